@@ -52,6 +52,7 @@ from typing import Dict, Any, Optional, List
 from urllib.parse import urlparse
 
 # ---- Listing parsers ----
+from services import batch_parse
 from services.zillow_parser import ZillowParser
 from services.redfin_parser import RedfinParser
 from services.realtor_parser import RealtorParser
@@ -244,6 +245,18 @@ class AppraiserEngine:
     # Listing Parsing
     # ---------------------------------------------------------
 
+    def parse_listings(
+        self,
+        urls: List[str],
+        max_workers: int = batch_parse.DEFAULT_MAX_WORKERS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Parses listings from any mix of supported sites concurrently.
+        Each URL is dispatched by domain exactly as in _parse_listing, and
+        results are returned in the same order as `urls`.
+        """
+        return batch_parse.map_ordered(self._parse_listing, urls, max_workers=max_workers)
+
     def _parse_listing(self, url: str) -> Dict[str, Any]:
         domain = urlparse(url).netloc.lower()
 
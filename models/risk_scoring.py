@@ -35,6 +35,28 @@ class RiskScoring:
         - interpretation
     """
 
+    __slots__ = (
+        "hazards",
+        "rent_control",
+        "jurisdiction",
+        "underwriting",
+        "property_type",
+        "subject",
+        "income_scenarios",
+        "_jurisdiction_score",
+    )
+
+    _COMMERCIAL_TYPES = frozenset({"commercial", "mixed_use"})
+    _MEDIUM_MF_TYPES = frozenset({"multifamily_5plus"})
+    _SMALL_MF_TYPES = frozenset({"duplex", "triplex", "fourplex"})
+
+    # (substring, score) checked in order; stricter regulation = lower score
+    _JURISDICTION_SCORES = (
+        ("la city", 70),
+        ("la county", 80),
+    )
+    _DEFAULT_JURISDICTION_SCORE = 85  # generally easier regulatory environment
+
     def __init__(
         self,
         hazards: Dict,
@@ -53,6 +75,10 @@ class RiskScoring:
         self.subject = subject or {}
         self.income_scenarios = income_scenarios or {}
 
+        self._jurisdiction_score = self._classify_jurisdiction(
+            self.jurisdiction.get("jurisdiction") or ""
+        )
+
     # -------------------------------------------------------------
     # Helper methods to generate component scores
     # -------------------------------------------------------------
@@ -71,7 +97,7 @@ class RiskScoring:
         fire = h.get("fire", {}).get("within_high_fire_hazard_area")
         fault = h.get("earthquake_fault", {}).get("within_fault_zone")
 
-        for risk in [flood, fire, fault]:
+        for risk in (flood, fire, fault):
             if risk is True:
                 penalty += 20  # high hazard = major penalty
 
@@ -90,13 +116,16 @@ class RiskScoring:
             return 85  # low risk
         return 70  # unknown = medium risk
 
+    @classmethod
+    def _classify_jurisdiction(cls, raw: str) -> float:
+        j = raw.lower()
+        for needle, score in cls._JURISDICTION_SCORES:
+            if needle in j:
+                return score
+        return cls._DEFAULT_JURISDICTION_SCORE
+
     def _score_jurisdiction(self) -> float:
-        j = self.jurisdiction.get("jurisdiction", "").lower()
-        if "la city" in j:
-            return 70  # stricter regulations
-        if "la county" in j:
-            return 80
-        return 85  # generally easier regulatory environment
+        return self._jurisdiction_score
 
     def _score_underwriting(self) -> float:
         dscr = self.underwriting.get("dscr", 1.0)
@@ -134,11 +163,11 @@ class RiskScoring:
     def _score_property_type(self) -> float:
         t = self.property_type.get("property_type")
 
-        if t in ["commercial", "mixed_use"]:
+        if t in self._COMMERCIAL_TYPES:
             return 65
-        if t in ["multifamily_5plus"]:
+        if t in self._MEDIUM_MF_TYPES:
             return 75
-        if t in ["duplex", "triplex", "fourplex"]:
+        if t in self._SMALL_MF_TYPES:
             return 80
         if t == "sfr":
             return 85
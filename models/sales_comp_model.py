@@ -21,6 +21,7 @@ This is a valuation tool designed to complement the income approach.
 
 from typing import List, Dict, Optional
 from statistics import median
+from heapq import nlargest
 
 
 class SalesCompModel:
@@ -54,6 +55,16 @@ class SalesCompModel:
         - You can later plug in MLS/Redfin/PropStream data to feed the comps.
     """
 
+    __slots__ = (
+        "subject",
+        "comps",
+        "max_distance_miles",
+        "min_sqft_ratio",
+        "max_sqft_ratio",
+        "target_comp_count",
+        "_validated_subject",
+    )
+
     def __init__(
         self,
         subject: Dict,
@@ -126,20 +137,24 @@ class SalesCompModel:
 
         return filtered
 
-    def _normalize_comp(self, comp: Dict) -> Dict:
+    def _normalize_comp(
+        self,
+        comp: Dict,
+        subj_beds: Optional[float],
+        subj_baths: Optional[float],
+        subj_sqft: Optional[float],
+        subj_units: Optional[int],
+        subj_type: Optional[str],
+    ) -> Dict:
         """
         Adds normalized fields:
         - price_per_sqft
         - price_per_unit
         - similarity_score (0–100; higher = more similar)
-        """
-        subj = self._validated_subject
-        subj_beds = subj.get("beds")
-        subj_baths = subj.get("baths")
-        subj_sqft = subj.get("sqft")
-        subj_units = subj.get("num_units")
-        subj_type = subj.get("property_type")
 
+        Subject fields are passed in by the caller so they are read
+        once per summary rather than once per comp.
+        """
         price = float(comp.get("price") or 0.0)
         sqft = float(comp.get("sqft") or 0.0)
         beds = comp.get("beds")
@@ -192,11 +207,21 @@ class SalesCompModel:
 
     def _normalized_comps(self) -> List[Dict]:
         filtered = self._filter_comps()
-        normalized = [self._normalize_comp(c) for c in filtered]
-        # Sort by similarity_score descending
-        normalized.sort(key=lambda c: c.get("similarity_score", 0.0), reverse=True)
-        # Trim to target count
-        return normalized[: self.target_comp_count]
+        subj = self._validated_subject
+        subj_fields = (
+            subj.get("beds"),
+            subj.get("baths"),
+            subj.get("sqft"),
+            subj.get("num_units"),
+            subj.get("property_type"),
+        )
+        normalized = [self._normalize_comp(c, *subj_fields) for c in filtered]
+        # Top target_comp_count by similarity_score, descending
+        return nlargest(
+            self.target_comp_count,
+            normalized,
+            key=lambda c: c.get("similarity_score", 0.0),
+        )
 
     # ---------------------------------------------------------
     # Valuation statistics
@@ -244,6 +269,31 @@ class SalesCompModel:
             return None
         return ppu * units
 
+    def _empty_summary(self) -> Dict:
+        """
+        Same shape as summary() when no comp survives filtering.
+        """
+        return {
+            "subject": self._validated_subject,
+            "normalized_comps": [],
+            "stats": {
+                "median_ppsf": None,
+                "low_ppsf": None,
+                "high_ppsf": None,
+                "median_ppu": None,
+                "low_ppu": None,
+                "high_ppu": None,
+            },
+            "value_estimates": {
+                "value_by_ppsf_median": None,
+                "value_by_ppu_median": None,
+                "base_value": None,
+                "low_value": None,
+                "high_value": None,
+            },
+            "notes": "Sales comparison results are heuristic and should be benchmarked against professional appraisals.",
+        }
+
     # ---------------------------------------------------------
     # Public summary
     # ---------------------------------------------------------
@@ -255,7 +305,9 @@ class SalesCompModel:
         - stats: ppsf/ppu stats
         - value_estimates: low/base/high for the subject
         """
-        comps_norm = self._normalized_comps()
+        comps_norm = self._normalized_comps() if self.comps else []
+        if not comps_norm:
+            return self._empty_summary()
 
         ppsf_stats = self._ppsf_stats(comps_norm)
         ppu_stats = self._ppu_stats(comps_norm)
@@ -5,31 +5,48 @@ class SalesComparison:
     AVM-like valuation using simple statistical methods.
     """
 
-    def __init__(self, subject_sqft: float, comps: list):
+    __slots__ = ("subject_sqft", "comps", "_comps")
+
+    def __init__(self, subject_sqft: float, comps):
         """
         comps = [
             {"price": 950000, "sqft": 1200},
             {"price": 975000, "sqft": 1250},
             ...
         ]
+
+        or an (N, 2) array of [price, sqft] rows.
         """
         self.subject_sqft = subject_sqft
         self.comps = comps
 
+        if isinstance(comps, np.ndarray):
+            self._comps = np.asarray(comps, dtype=np.float64).reshape(-1, 2)
+        else:
+            self._comps = np.array(
+                [[c["price"], c["sqft"]] for c in comps], dtype=np.float64
+            ).reshape(-1, 2)
+
     def price_per_sf(self):
-        return [c["price"] / c["sqft"] for c in self.comps if c["sqft"] > 0]
+        prices = self._comps[:, 0]
+        sqft = self._comps[:, 1]
+        mask = sqft > 0
+        return prices[mask] / sqft[mask]
 
     def valuation_range(self):
+        if self._comps.shape[0] == 0:
+            return None
+
         ppsf = self.price_per_sf()
         if len(ppsf) == 0:
             return None
 
-        low = np.percentile(ppsf, 20) * self.subject_sqft
-        base = np.percentile(ppsf, 50) * self.subject_sqft
-        high = np.percentile(ppsf, 80) * self.subject_sqft
-        
+        low, base, high = np.round(
+            np.percentile(ppsf, [20, 50, 80]) * self.subject_sqft, 0
+        )
+
         return {
-            "low_value": round(low, 0),
-            "base_value": round(base, 0),
-            "high_value": round(high, 0)
+            "low_value": float(low),
+            "base_value": float(base),
+            "high_value": float(high)
         }
@@ -3,6 +3,8 @@ class Underwriting:
     Computes DSCR, cash flow, CoC return, and feasibility.
     """
 
+    __slots__ = ("noi", "ads", "cash")
+
     def __init__(self, noi: float, annual_debt_service: float, cash_invested: float):
         self.noi = noi
         self.ads = annual_debt_service
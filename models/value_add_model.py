@@ -8,12 +8,11 @@ Models a value-add or BRRRR-style investment by estimating:
 - Incremental return on invested capital
 
 Integrates with:
-- IncomeApproach (for stabilized NOI)
+- IncomeApproach (same GSR/NOI formulas, inlined for stabilized NOI)
 - SalesComparison or cap rate for ARV
 """
 
 from typing import Optional, Dict
-from models.income_approach import IncomeApproach
 
 
 class ValueAddModel:
@@ -30,6 +29,18 @@ class ValueAddModel:
         op_ex_ratio: stabilized operating expense ratio (default 35%)
     """
 
+    __slots__ = (
+        "current_rent",
+        "stabilized_rent",
+        "num_units",
+        "rehab_budget",
+        "purchase_price",
+        "other_closing_costs",
+        "target_cap_rate",
+        "vacancy_rate",
+        "op_ex_ratio",
+    )
+
     def __init__(
         self,
         current_rent_per_unit: float,
@@ -56,23 +67,27 @@ class ValueAddModel:
     # Baseline (as-is) performance
     # ----------------------------------------------------------
 
-    def as_is_income(self) -> Dict:
+    def _income_profile(self, rent_per_unit: float) -> Dict:
         """
-        As-is income profile before value-add.
+        GSR and NOI for a given rent, using the same arithmetic as
+        IncomeApproach without allocating one per call.
         """
-        inc = IncomeApproach(
-            monthly_market_rent=self.current_rent,
-            num_units=self.num_units,
-            vacancy_rate=self.vacancy_rate,
-            operating_expense_ratio=self.op_ex_ratio
-        )
+        gsr = rent_per_unit * self.num_units * 12
+        egi = gsr - gsr * self.vacancy_rate
+        noi = egi - egi * self.op_ex_ratio
 
         return {
-            "rent_per_unit": self.current_rent,
-            "gsr": inc.gsr(),
-            "noi": inc.noi()
+            "rent_per_unit": rent_per_unit,
+            "gsr": gsr,
+            "noi": noi
         }
 
+    def as_is_income(self) -> Dict:
+        """
+        As-is income profile before value-add.
+        """
+        return self._income_profile(self.current_rent)
+
     # ----------------------------------------------------------
     # Stabilized (post-renovation) performance
     # ----------------------------------------------------------
@@ -81,18 +96,7 @@ class ValueAddModel:
         """
         Income profile after renovations and rent increases.
         """
-        inc = IncomeApproach(
-            monthly_market_rent=self.stabilized_rent,
-            num_units=self.num_units,
-            vacancy_rate=self.vacancy_rate,
-            operating_expense_ratio=self.op_ex_ratio
-        )
-
-        return {
-            "rent_per_unit": self.stabilized_rent,
-            "gsr": inc.gsr(),
-            "noi": inc.noi()
-        }
+        return self._income_profile(self.stabilized_rent)
 
     # ----------------------------------------------------------
     # ARV and equity creation
@@ -102,8 +106,9 @@ class ValueAddModel:
         """
         Uses stabilized NOI and target cap rate to estimate ARV.
         """
-        stabilized = self.stabilized_income()
-        noi = stabilized.get("noi", 0)
+        return self._arv_from_noi(self.stabilized_income().get("noi", 0))
+
+    def _arv_from_noi(self, noi: float) -> Optional[float]:
         if self.target_cap_rate <= 0:
             return None
         return noi / self.target_cap_rate
@@ -119,10 +124,13 @@ class ValueAddModel:
         """
         ARV minus total project cost.
         """
-        arv = self.arv_from_cap_rate()
+        return self._equity_from_arv(self.arv_from_cap_rate(), self.total_project_cost())
+
+    @staticmethod
+    def _equity_from_arv(arv: Optional[float], total_cost: float) -> Optional[float]:
         if arv is None:
             return None
-        return arv - self.total_project_cost()
+        return arv - total_cost
 
     # ----------------------------------------------------------
     # Value-add return metrics
@@ -132,11 +140,11 @@ class ValueAddModel:
         """
         Measures profit relative to all-in project cost.
         """
-        equity = self.created_equity()
-        if equity is None:
-            return None
-        total_cost = self.total_project_cost()
-        if total_cost == 0:
+        return self._return_on_cost(self.created_equity(), self.total_project_cost())
+
+    @staticmethod
+    def _return_on_cost(equity: Optional[float], total_cost: float) -> Optional[float]:
+        if equity is None or total_cost == 0:
             return None
         return equity / total_cost
 
@@ -149,12 +157,16 @@ class ValueAddModel:
     def summary(self) -> Dict:
         """
         High-level summary of the value-add play.
+
+        Stabilized income and project cost are computed once and threaded
+        through the ARV / equity / return chain.
         """
         as_is = self.as_is_income()
         stab = self.stabilized_income()
-        arv = self.arv_from_cap_rate()
-        equity = self.created_equity()
-        roc = self.value_add_return_on_cost()
+        total_cost = self.total_project_cost()
+        arv = self._arv_from_noi(stab["noi"])
+        equity = self._equity_from_arv(arv, total_cost)
+        roc = self._return_on_cost(equity, total_cost)
 
         return {
             "as_is": as_is,
@@ -163,7 +175,7 @@ class ValueAddModel:
                 "purchase_price": self.purchase_price,
                 "rehab_budget": self.rehab_budget,
                 "other_closing_costs": self.other_closing_costs,
-                "total_project_cost": self.total_project_cost()
+                "total_project_cost": total_cost
             },
             "arv": arv,
             "created_equity": equity,
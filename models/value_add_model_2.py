@@ -22,6 +22,16 @@ Outputs:
 from typing import Optional, Dict
 
 
+def _npv_5yr(rate: float, cf0: float, cf1: float, cf2: float,
+             cf3: float, cf4: float, cf5: float) -> float:
+    """
+    NPV of a 5-year cash flow stream, unrolled with Horner's rule in
+    the discount factor so the default hold period avoids a per-year loop.
+    """
+    v = 1.0 / (1.0 + rate)
+    return cf0 + v * (cf1 + v * (cf2 + v * (cf3 + v * (cf4 + v * cf5))))
+
+
 class ValueAddModel:
     """
     Parameters:
@@ -37,6 +47,15 @@ class ValueAddModel:
         directional metrics, not a full DCF.
     """
 
+    __slots__ = (
+        "purchase_price",
+        "rehab_budget",
+        "noi_initial",
+        "noi_stabilized",
+        "exit_cap_rate",
+        "hold_years",
+    )
+
     def __init__(
         self,
         purchase_price: float,
@@ -124,6 +143,17 @@ class ValueAddModel:
 
         # Internal IRR approximation via binary search
         low, high = -0.5, 0.5  # -50% to +50% IRR
+
+        if self.hold_years == 5:
+            cf1, cf2, cf3, cf4, cf5 = cfs
+            for _ in range(60):
+                mid = (low + high) / 2.0
+                if _npv_5yr(mid, cf0, cf1, cf2, cf3, cf4, cf5) > 0:
+                    low = mid
+                else:
+                    high = mid
+            return (low + high) / 2.0
+
         for _ in range(60):
             mid = (low + high) / 2.0
             npv = cf0
@@ -141,12 +171,10 @@ class ValueAddModel:
     # ---------------------------------------------------------
 
     def summary(self) -> Dict:
-        gin_cap = self.going_in_cap_rate()
-        yoc = self.yield_on_cost()
-        exit_val = self.exit_value()
-        eq = self.equity_creation()
-        irr = self.simple_5yr_irr()
-
+        """
+        Metrics are returned unrounded; format them at the presentation
+        or serialization layer.
+        """
         return {
             "inputs": {
                 "purchase_price": self.purchase_price,
@@ -156,10 +184,10 @@ class ValueAddModel:
                 "exit_cap_rate": self.exit_cap_rate,
                 "hold_years": self.hold_years,
             },
-            "total_cost": round(self.total_cost, 2),
-            "going_in_cap_rate": round(gin_cap, 4) if gin_cap is not None else None,
-            "yield_on_cost": round(yoc, 4) if yoc is not None else None,
-            "exit_value": round(exit_val, 2) if exit_val is not None else None,
-            "equity_creation": round(eq, 2) if eq is not None else None,
-            "simple_irr": round(irr, 4) if irr is not None else None,
+            "total_cost": self.total_cost,
+            "going_in_cap_rate": self.going_in_cap_rate(),
+            "yield_on_cost": self.yield_on_cost(),
+            "exit_value": self.exit_value(),
+            "equity_creation": self.equity_creation(),
+            "simple_irr": self.simple_5yr_irr(),
         }
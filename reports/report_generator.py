@@ -4,162 +4,133 @@ report_generator.py
 Builds HTML and optional PDF reports from a full appraisal dict.
 
 - build_html_report(appraisal) -> str HTML
-- build_pdf_report(html, output_path) -> str path (requires WeasyPrint)
+- build_pdf_report(html, output_path) -> str path or file object (requires WeasyPrint)
+- build_pdf_report_batch(htmls, output_path) -> str path (one PDF, one
+  WeasyPrint render for a whole portfolio)
 
 If WeasyPrint is not installed, PDF generation will raise a clear error.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, BinaryIO, List, Optional, Union
 
 # Optional PDF library
 try:
-    from weasyprint import HTML  # type: ignore
+    from weasyprint import CSS, HTML  # type: ignore
     HAS_WEASYPRINT = True
 except ImportError:
     HAS_WEASYPRINT = False
 
+if HAS_WEASYPRINT:
+    try:
+        from weasyprint.text.fonts import FontConfiguration  # type: ignore
+    except ImportError:  # WeasyPrint < 53
+        from weasyprint.fonts import FontConfiguration  # type: ignore
 
-def _safe_get(d: Dict[str, Any], path: str, default: Any = "") -> Any:
-    """
-    Utility to safely pull nested keys using 'a.b.c' style paths.
-    """
-    cur: Any = d
-    for part in path.split("."):
-        if not isinstance(cur, dict):
-            return default
-        cur = cur.get(part)
-        if cur is None:
-            return default
-    return cur
-
-
-def build_html_report(appraisal: Dict[str, Any]) -> str:
-    """
-    Build a single-page HTML report summarizing:
-
-    - Subject details
-    - Income / NOI
-    - Cap rate assumptions
-    - Valuation (as-is / stabilized)
-    - Sales comparison
-    - Market confidence
-    - Financing / DSCR
-    - Recommendation
-    - Narrative (full text)
-    """
+# A filesystem path or an open binary file-like object
+PdfTarget = Union[str, BinaryIO]
 
-    subject = appraisal.get("subject", {}) or {}
-    listing = subject.get("listing_core", {}) or {}
-    narrative = appraisal.get("narrative", {}) or {}
-    recommendation = appraisal.get("recommendation", {}) or {}
-    income = appraisal.get("income", {}) or {}
-    cap_rate = appraisal.get("cap_rate", {}) or {}
-    valuation = appraisal.get("valuation", {}) or {}
-    financing = appraisal.get("financing", {}) or {}
-    sales_comp = appraisal.get("sales_comparison", {}) or {}
-    market_conf = recommendation.get("market_confidence", {}) or {}
-
-    addr = subject.get("address_normalized") or subject.get("address_raw") or "N/A"
-    price = listing.get("price")
-    price_str = f"${price:,.0f}" if isinstance(price, (int, float)) else "N/A"
 
-    # Recommendation
-    final_rec = recommendation.get("final_recommendation", "N/A")
-    final_score = recommendation.get("final_score", "N/A")
-
-    # HTML document
-    html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="utf-8" />
-    <title>Appraisal Report - {addr}</title>
-    <style>
-        body {{
+_REPORT_CSS = """\
+        body {
             font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif;
             margin: 24px;
             color: #222;
             line-height: 1.5;
-        }}
-        h1, h2, h3 {{
+        }
+        h1, h2, h3 {
             margin-bottom: 4px;
-        }}
-        h1 {{
+        }
+        h1 {
             font-size: 24px;
             margin-bottom: 8px;
-        }}
-        h2 {{
+        }
+        h2 {
             font-size: 18px;
             margin-top: 20px;
-        }}
-        h3 {{
+        }
+        h3 {
             font-size: 15px;
             margin-top: 14px;
-        }}
-        .header-bar {{
+        }
+        .header-bar {
             padding: 12px 16px;
             background: #111;
             color: #f5f5f5;
             border-radius: 6px;
             margin-bottom: 16px;
-        }}
-        .section {{
+        }
+        .section {
             margin-bottom: 18px;
             padding: 12px 14px;
             border-radius: 6px;
             border: 1px solid #e0e0e0;
-        }}
-        .badge {{
+        }
+        .badge {
             display: inline-block;
             padding: 4px 10px;
             border-radius: 999px;
             font-size: 12px;
             font-weight: 600;
             margin-left: 8px;
-        }}
-        .badge-buy {{
+        }
+        .badge-buy {
             background: #0b8457;
             color: #fff;
-        }}
-        .badge-watch {{
+        }
+        .badge-watch {
             background: #e0a800;
             color: #111;
-        }}
-        .badge-pass {{
+        }
+        .badge-pass {
             background: #b00020;
             color: #fff;
-        }}
-        table {{
+        }
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 6px;
             font-size: 13px;
-        }}
-        th, td {{
+        }
+        th, td {
             border: 1px solid #ddd;
             padding: 6px 8px;
             text-align: left;
-        }}
-        th {{
+        }
+        th {
             background: #f4f4f4;
             font-weight: 600;
-        }}
-        .muted {{
+        }
+        .muted {
             color: #777;
             font-size: 12px;
-        }}
-        .mono {{
+        }
+        .mono {
             font-family: "SF Mono", Menlo, Monaco, Consolas, "Liberation Mono", "Courier New", monospace;
-        }}
-        pre {{
+        }
+        pre {
             white-space: pre-wrap;
             background: #fafafa;
             border-radius: 4px;
             padding: 10px;
             border: 1px solid #eee;
             font-size: 13px;
-        }}
-    </style>
-</head>
+        }
+"""
+
+# Inline <style> block embedded in the HTML report. build_pdf_report swaps it
+# for the pre-parsed stylesheet so WeasyPrint does not re-parse the CSS.
+_STYLE_BLOCK = "    <style>\n" + _REPORT_CSS + "    </style>\n"
+
+_STYLESHEET = None
+_FONT_CONFIG = None
+
+
+_REPORT_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8" />
+    <title>Appraisal Report - {addr}</title>
+{style_block}</head>
 <body>
 
 <div class="header-bar">
@@ -169,27 +140,13 @@ def build_html_report(appraisal: Dict[str, Any]) -> str:
 </div>
 
 <div class="section">
-    <h2>Executive Summary
-"""
-
-    # Recommendation badge
-    badge_class = "badge"
-    if isinstance(final_rec, str):
-        if final_rec.upper() == "BUY":
-            badge_class += " badge-buy"
-        elif final_rec.upper() == "WATCH":
-            badge_class += " badge-watch"
-        elif final_rec.upper() == "PASS":
-            badge_class += " badge-pass"
-
-    html += f"""        <div>
+    <h2>Executive Summary</h2>
+        <div>
             Final Recommendation:
             <span class="{badge_class}">{final_rec}</span>
             <span class="muted">Score: {final_score}</span>
         </div>
-"""
-
-    html += """</div>
+</div>
 
 <div class="section">
     <h2>Subject Property</h2>
@@ -224,47 +181,29 @@ def build_html_report(appraisal: Dict[str, Any]) -> str:
         </tr>
     </table>
 </div>
-""".format(
-        addr=addr,
-        prop_type=listing.get("property_type_raw", "N/A"),
-        beds=listing.get("beds", "N/A"),
-        baths=listing.get("baths", "N/A"),
-        sqft=listing.get("sqft", "N/A"),
-        lot_size=listing.get("lot_size", "N/A"),
-        year_built=listing.get("year_built", "N/A"),
-        price_str=price_str,
-    )
 
-    # Income / NOI
-    html += f"""
 <div class="section">
     <h2>Income Approach</h2>
     <table>
-        <tr><th>Gross Scheduled Rent (Annual)</th><td>${income.get("gross_scheduled_rent_annual", "N/A"):,.0f}</td></tr>
-        <tr><th>Effective Gross Income (Annual)</th><td>${income.get("effective_gross_income_annual", "N/A"):,.0f}</td></tr>
-        <tr><th>Operating Expenses (Annual)</th><td>${income.get("operating_expenses_annual", "N/A"):,.0f}</td></tr>
-        <tr><th>NOI (Annual)</th><td>${income.get("noi", "N/A"):,.0f}</td></tr>
-        <tr><th>Stabilized NOI</th><td>${income.get("noi_stabilized", "N/A"):,.0f}</td></tr>
+        <tr><th>Gross Scheduled Rent (Annual)</th><td>{income_gsr}</td></tr>
+        <tr><th>Effective Gross Income (Annual)</th><td>{income_egi}</td></tr>
+        <tr><th>Operating Expenses (Annual)</th><td>{income_opex}</td></tr>
+        <tr><th>NOI (Annual)</th><td>{income_noi}</td></tr>
+        <tr><th>Stabilized NOI</th><td>{income_noi_stabilized}</td></tr>
     </table>
 </div>
-"""
 
-    # Cap rate / valuation
-    html += f"""
 <div class="section">
     <h2>Cap Rate & Valuation</h2>
     <table>
-        <tr><th>Base Cap Rate</th><td>{cap_rate.get("base_cap_rate", "N/A")}</td></tr>
-        <tr><th>Risk Adjustment</th><td>{cap_rate.get("risk_adjustment", "N/A")}</td></tr>
-        <tr><th>Final Cap Rate</th><td>{cap_rate.get("final_cap_rate", "N/A")}</td></tr>
-        <tr><th>As-Is Value</th><td>${valuation.get("as_is_value", "N/A"):,.0f}</td></tr>
-        <tr><th>Stabilized Value</th><td>${valuation.get("stabilized_value", "N/A"):,.0f}</td></tr>
+        <tr><th>Base Cap Rate</th><td>{base_cap_rate}</td></tr>
+        <tr><th>Risk Adjustment</th><td>{risk_adjustment}</td></tr>
+        <tr><th>Final Cap Rate</th><td>{final_cap_rate}</td></tr>
+        <tr><th>As-Is Value</th><td>{as_is_value}</td></tr>
+        <tr><th>Stabilized Value</th><td>{stabilized_value}</td></tr>
     </table>
 </div>
-"""
 
-    # Sales comparison / market confidence
-    html += """
 <div class="section">
     <h2>Sales Comparison & Market Confidence</h2>
     <table>
@@ -278,47 +217,183 @@ def build_html_report(appraisal: Dict[str, Any]) -> str:
         Sales comparison and confidence metrics are heuristic and should be benchmarked against professional appraisal.
     </div>
 </div>
-""".format(
-        sales_active=str(sales_comp.get("success", False)),
-        sales_rating=_safe_get(sales_comp, "rating", "N/A"),
-        median_comp=f"${_safe_get(sales_comp, 'median_value', 0):,.0f}"
-        if isinstance(_safe_get(sales_comp, "median_value", None), (int, float))
-        else "N/A",
-        mc_level=market_conf.get("level", "unknown"),
-        mc_score=market_conf.get("score", "N/A"),
-    )
 
-    # Financing / DSCR
-    html += f"""
 <div class="section">
     <h2>Financing & DSCR</h2>
     <table>
-        <tr><th>Meets Minimum DSCR</th><td>{financing.get("meets_min_dscr", 'N/A')}</td></tr>
-        <tr><th>Max Loan Amount</th><td>${financing.get("max_loan_amount", 0):,.0f}</td></tr>
-        <tr><th>Max Supported Price (DSCR)</th><td>${financing.get("max_supported_price", 0):,.0f}</td></tr>
+        <tr><th>Meets Minimum DSCR</th><td>{meets_min_dscr}</td></tr>
+        <tr><th>Max Loan Amount</th><td>{max_loan_amount}</td></tr>
+        <tr><th>Max Supported Price (DSCR)</th><td>{max_supported_price}</td></tr>
     </table>
 </div>
-"""
 
-    # Narrative
-    full_text = narrative.get("full_text", "")
-    html += f"""
 <div class="section">
     <h2>Narrative Summary</h2>
     <pre>{full_text}</pre>
 </div>
-"""
 
-    html += """
 </body>
 </html>
 """
-    return html
 
 
-def build_pdf_report(html: str, output_path: str = "appraisal_report.pdf") -> str:
+def _get_font_config():
+    """
+    Shared WeasyPrint FontConfiguration, so system fonts are scanned once
+    per process rather than once per PDF.
+    """
+    global _FONT_CONFIG
+    if _FONT_CONFIG is None:
+        _FONT_CONFIG = FontConfiguration()
+    return _FONT_CONFIG
+
+
+def _get_stylesheet():
     """
-    Convert HTML string to PDF at the provided path.
+    WeasyPrint stylesheet for the report CSS, parsed once per process.
+    """
+    global _STYLESHEET
+    if _STYLESHEET is None:
+        _STYLESHEET = CSS(string=_REPORT_CSS, font_config=_get_font_config())
+    return _STYLESHEET
+
+
+_BADGE_CLASS = {
+    "BUY": "badge badge-buy",
+    "WATCH": "badge badge-watch",
+    "PASS": "badge badge-pass",
+}
+
+_HTML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
+
+
+def _escape(value: Any) -> str:
+    """
+    HTML-escape a value for interpolation into the report template.
+    """
+    return str(value).translate(_HTML_ESCAPE)
+
+
+def _money(value: Any) -> str:
+    """
+    Format a dollar amount, or 'N/A' when the value is missing / non-numeric.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f"${value:,.0f}"
+    return "N/A"
+
+
+def build_html_report(appraisal: Dict[str, Any]) -> str:
+    """
+    Build a single-page HTML report summarizing:
+
+    - Subject details
+    - Income / NOI
+    - Cap rate assumptions
+    - Valuation (as-is / stabilized)
+    - Sales comparison
+    - Market confidence
+    - Financing / DSCR
+    - Recommendation
+    - Narrative (full text)
+    """
+
+    subject = appraisal.get("subject", {}) or {}
+    listing = subject.get("listing_core", {}) or {}
+    narrative = appraisal.get("narrative", {}) or {}
+    recommendation = appraisal.get("recommendation", {}) or {}
+    income = appraisal.get("income", {}) or {}
+    cap_rate = appraisal.get("cap_rate", {}) or {}
+    valuation = appraisal.get("valuation", {}) or {}
+    financing = appraisal.get("financing", {}) or {}
+    sales_comp = appraisal.get("sales_comparison", {}) or {}
+    market_conf = recommendation.get("market_confidence", {}) or {}
+    if not isinstance(sales_comp, dict):
+        sales_comp = {}
+    sales_rating = sales_comp.get("rating")
+
+    addr = subject.get("address_normalized") or subject.get("address_raw") or "N/A"
+
+    # Recommendation
+    final_rec = recommendation.get("final_recommendation", "N/A")
+    final_score = recommendation.get("final_score", "N/A")
+
+    # Recommendation badge
+    badge_class = _BADGE_CLASS.get(
+        final_rec.upper() if isinstance(final_rec, str) else None, "badge"
+    )
+
+    fields = {
+        "addr": addr,
+        "price_str": _money(listing.get("price")),
+        "badge_class": badge_class,
+        "final_rec": final_rec,
+        "final_score": final_score,
+        # Subject
+        "prop_type": listing.get("property_type_raw", "N/A"),
+        "beds": listing.get("beds", "N/A"),
+        "baths": listing.get("baths", "N/A"),
+        "sqft": listing.get("sqft", "N/A"),
+        "lot_size": listing.get("lot_size", "N/A"),
+        "year_built": listing.get("year_built", "N/A"),
+        # Income / NOI
+        "income_gsr": _money(income.get("gross_scheduled_rent_annual")),
+        "income_egi": _money(income.get("effective_gross_income_annual")),
+        "income_opex": _money(income.get("operating_expenses_annual")),
+        "income_noi": _money(income.get("noi")),
+        "income_noi_stabilized": _money(income.get("noi_stabilized")),
+        # Cap rate / valuation
+        "base_cap_rate": cap_rate.get("base_cap_rate", "N/A"),
+        "risk_adjustment": cap_rate.get("risk_adjustment", "N/A"),
+        "final_cap_rate": cap_rate.get("final_cap_rate", "N/A"),
+        "as_is_value": _money(valuation.get("as_is_value")),
+        "stabilized_value": _money(valuation.get("stabilized_value")),
+        # Sales comparison / market confidence
+        "sales_active": str(sales_comp.get("success", False)),
+        "sales_rating": "N/A" if sales_rating is None else sales_rating,
+        "median_comp": _money(sales_comp.get("median_value")),
+        "mc_level": market_conf.get("level", "unknown"),
+        "mc_score": market_conf.get("score", "N/A"),
+        # Financing / DSCR
+        "meets_min_dscr": financing.get("meets_min_dscr", "N/A"),
+        "max_loan_amount": _money(financing.get("max_loan_amount", 0)),
+        "max_supported_price": _money(financing.get("max_supported_price", 0)),
+        # Narrative
+        "full_text": narrative.get("full_text", ""),
+    }
+
+    # Every interpolated value is escaped exactly once; the style block is
+    # trusted markup and is added afterwards.
+    ctx = {key: _escape(value) for key, value in fields.items()}
+    ctx["style_block"] = _STYLE_BLOCK
+
+    return _REPORT_TEMPLATE.format_map(ctx)
+
+
+def _write_pdf(document, output_path: PdfTarget, stylesheets) -> None:
+    """
+    Stream the rendered PDF straight into a file handle, either the
+    caller's binary file-like object or one opened on output_path.
+    """
+    font_config = _get_font_config()
+    if hasattr(output_path, "write"):
+        document.write_pdf(target=output_path, stylesheets=stylesheets, font_config=font_config)
+        return
+
+    with open(output_path, "wb") as f:
+        document.write_pdf(target=f, stylesheets=stylesheets, font_config=font_config)
+
+
+def build_pdf_report(html: str, output_path: PdfTarget = "appraisal_report.pdf") -> PdfTarget:
+    """
+    Convert HTML string to PDF at the provided path (or binary file-like
+    object).
 
     Requires WeasyPrint to be installed:
         pip install weasyprint
@@ -332,5 +407,54 @@ def build_pdf_report(html: str, output_path: str = "appraisal_report.pdf") -> st
             "to enable PDF report generation."
         )
 
-    HTML(string=html).write_pdf(output_path)
+    stylesheets = None
+    if _STYLE_BLOCK in html:
+        html = html.replace(_STYLE_BLOCK, "", 1)
+        stylesheets = [_get_stylesheet()]
+
+    _write_pdf(HTML(string=html), output_path, stylesheets)
+    return output_path
+
+
+def _report_body(html: str) -> str:
+    """
+    Inner <body> markup of a full HTML document (or the string itself if
+    it has no <body> element).
+    """
+    start = html.find("<body>")
+    end = html.rfind("</body>")
+    if start == -1 or end == -1:
+        return html
+    return html[start + len("<body>"):end]
+
+
+def build_pdf_report_batch(
+    htmls: List[str], output_path: PdfTarget = "appraisal_portfolio.pdf"
+) -> PdfTarget:
+    """
+    Render several HTML reports into a single PDF, one report per page
+    break, with a single WeasyPrint call so fonts, the stylesheet and the
+    PDF writer are set up once for the whole batch.
+
+    Returns:
+        output_path (for convenience)
+    """
+    if not HAS_WEASYPRINT:
+        raise RuntimeError(
+            "WeasyPrint is not installed. Install via 'pip install weasyprint' "
+            "to enable PDF report generation."
+        )
+
+    bodies = [
+        _report_body(html.replace(_STYLE_BLOCK, "", 1)) for html in htmls
+    ]
+    body = '\n<div style="page-break-before: always;"></div>\n'.join(bodies)
+    document = (
+        "<!DOCTYPE html>\n<html>\n<head>\n"
+        '    <meta charset="utf-8" />\n'
+        "    <title>Appraisal Reports</title>\n"
+        f"</head>\n<body>\n{body}\n</body>\n</html>\n"
+    )
+
+    _write_pdf(HTML(string=document), output_path, [_get_stylesheet()])
     return output_path
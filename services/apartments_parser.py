@@ -24,9 +24,16 @@ This parser extracts:
 """
 
 import re
-import requests
-from bs4 import BeautifulSoup
-from typing import Dict, Optional, List
+import copy
+from typing import Dict, Optional, List, Iterable
+
+from services import batch_parse
+from services.html_parsing import make_soup
+from services.http_session import get_session
+from services.ttl_cache import TTLCache
+
+# Successful parse results, keyed by (parser version, url)
+_PARSE_CACHE = TTLCache(maxsize=1024, ttl=3600)
 
 
 class ApartmentsParser:
@@ -64,6 +71,27 @@ class ApartmentsParser:
         "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     )
 
+    # Bump when extraction logic changes so cached results are not reused
+    PARSER_VERSION = 1
+
+    ZIP_PATTERN = re.compile(r"\d{5}")
+    CITY_STATE_ZIP_PATTERN = re.compile(r",\s*([\w\s]+),\s*([A-Z]{2})\s*(\d{5})")
+    RENT_RANGE_PATTERN = re.compile(r"\$([\d,]+)\s*[-–]\s*\$([\d,]+)")
+    RENT_PLUS_PATTERN = re.compile(r"\$([\d,]+)\s*\+")
+    # Unit grid row: each alternative is wrapped in a named group so
+    # m.lastgroup says which field matched
+    UNIT_ROW_PATTERN = re.compile(
+        r"(?P<beds>(?P<bed_count>\d+)\s*bed)"
+        r"|(?P<studio>studio)"
+        r"|(?P<baths>(?P<bath_count>[\d\.]+)\s*bath)"
+        r"|(?P<sqft_range>(?P<sqft_lo>[\d,]+)\s*-\s*(?P<sqft_hi>[\d,]+)\s*sq)"
+        r"|(?P<sqft>(?P<sqft_val>[\d,]+)\s*sq\s*ft)"
+        r"|(?P<rent_range>\$(?P<rent_lo>[\d,]+)\s*[-–]\s*\$(?P<rent_hi>[\d,]+))"
+        r"|(?P<rent>\$(?P<rent_val>[\d,]+))"
+    )
+    PROPERTY_TYPE_PATTERN = re.compile(r"Property Type[:\s]+([\w\s]+)<")
+    UNIT_COUNT_PATTERN = re.compile(r"(\d+)[ -]?unit\b", re.IGNORECASE)
+
     def __init__(self, url: str):
         self.url = url
         self.html = None
@@ -75,7 +103,7 @@ class ApartmentsParser:
 
     def fetch(self) -> bool:
         try:
-            r = requests.get(
+            r = get_session().get(
                 self.url,
                 headers={"User-Agent": self.USER_AGENT},
                 timeout=12,
@@ -84,7 +112,7 @@ class ApartmentsParser:
                 return False
 
             self.html = r.text
-            self.soup = BeautifulSoup(self.html, "html.parser")
+            self.soup = make_soup(self.html)
             return True
         except Exception:
             return False
@@ -115,7 +143,7 @@ class ApartmentsParser:
         title = self.soup.find("title")
         if title:
             text = title.get_text(strip=True)
-            if re.search(r"\d{5}", text):
+            if self.ZIP_PATTERN.search(text):
                 return text
 
         return None
@@ -125,7 +153,7 @@ class ApartmentsParser:
             return None, None, None
 
         # Example: "1234 W Adams Blvd, Los Angeles, CA 90018"
-        m = re.search(r",\s*([\w\s]+),\s*([A-Z]{2})\s*(\d{5})", address_full)
+        m = self.CITY_STATE_ZIP_PATTERN.search(address_full)
         if m:
             return m.group(1), m.group(2), m.group(3)
 
@@ -145,7 +173,7 @@ class ApartmentsParser:
         if not self.html:
             return None, None
 
-        m = re.search(r"\$([\d,]+)\s*[-–]\s*\$([\d,]+)", self.html)
+        m = self.RENT_RANGE_PATTERN.search(self.html)
         if m:
             return (
                 float(m.group(1).replace(",", "")),
@@ -153,7 +181,7 @@ class ApartmentsParser:
             )
 
         # Single rent: "$1,800+"
-        m = re.search(r"\$([\d,]+)\s*\+", self.html)
+        m = self.RENT_PLUS_PATTERN.search(self.html)
         if m:
             val = float(m.group(1).replace(",", ""))
             return val, val
@@ -179,47 +207,51 @@ class ApartmentsParser:
 
         unit_rows = self.soup.select("tr.rentalGridRow")
 
+        # Bound once outside the row loop
+        scan_row = self.UNIT_ROW_PATTERN.finditer
+        append = results.append
+
         for row in unit_rows:
             text = row.get_text(" ", strip=True).lower()
 
+            # One scan over the row; keep the first hit for each field kind
+            first = {}
+            for m in scan_row(text):
+                kind = m.lastgroup
+                if kind not in first:
+                    first[kind] = m
+
             # Beds
             beds = None
-            m = re.search(r"(\d+)\s*bed", text)
-            if m:
-                beds = float(m.group(1))
-            elif "studio" in text:
+            if "beds" in first:
+                beds = float(first["beds"].group("bed_count"))
+            elif "studio" in first:
                 beds = 0.0
 
             # Baths
             baths = None
-            m = re.search(r"([\d\.]+)\s*bath", text)
-            if m:
-                baths = float(m.group(1))
+            if "baths" in first:
+                baths = float(first["baths"].group("bath_count"))
 
-            # Sqft range
+            # Sqft range, else single sqft
             sqft_min, sqft_max = None, None
-            m = re.search(r"([\d,]+)\s*-\s*([\d,]+)\s*sq", text)
-            if m:
-                sqft_min = int(m.group(1).replace(",", ""))
-                sqft_max = int(m.group(2).replace(",", ""))
-
-            # Single sqft
-            m = re.search(r"([\d,]+)\s*sq\s*ft", text)
-            if m and sqft_min is None:
-                sqft_min = sqft_max = int(m.group(1).replace(",", ""))
-
-            # Rent range
+            if "sqft_range" in first:
+                m = first["sqft_range"]
+                sqft_min = int(m.group("sqft_lo").replace(",", ""))
+                sqft_max = int(m.group("sqft_hi").replace(",", ""))
+            elif "sqft" in first:
+                sqft_min = sqft_max = int(first["sqft"].group("sqft_val").replace(",", ""))
+
+            # Rent range, else single rent
             rent_min, rent_max = None, None
-            m = re.search(r"\$([\d,]+)\s*[-–]\s*\$([\d,]+)", text)
-            if m:
-                rent_min = float(m.group(1).replace(",", ""))
-                rent_max = float(m.group(2).replace(",", ""))
-            else:
-                m = re.search(r"\$([\d,]+)", text)
-                if m:
-                    rent_min = rent_max = float(m.group(1).replace(",", ""))
-
-            results.append(
+            if "rent_range" in first:
+                m = first["rent_range"]
+                rent_min = float(m.group("rent_lo").replace(",", ""))
+                rent_max = float(m.group("rent_hi").replace(",", ""))
+            elif "rent" in first:
+                rent_min = rent_max = float(first["rent"].group("rent_val").replace(",", ""))
+
+            append(
                 {
                     "beds": beds,
                     "baths": baths,
@@ -240,7 +272,7 @@ class ApartmentsParser:
         if not self.html:
             return None
 
-        m = re.search(r"Property Type[:\s]+([\w\s]+)<", self.html)
+        m = self.PROPERTY_TYPE_PATTERN.search(self.html)
         if m:
             return m.group(1).strip()
 
@@ -256,7 +288,7 @@ class ApartmentsParser:
             return None
 
         # Often appears in description
-        m = re.search(r"(\d+)[ -]?unit\b", self.html.lower())
+        m = self.UNIT_COUNT_PATTERN.search(self.html)
         if m:
             return int(m.group(1))
 
@@ -267,6 +299,17 @@ class ApartmentsParser:
     # -------------------------------------------------------------
 
     def parse(self) -> Dict:
+        cache_key = (self.PARSER_VERSION, self.url)
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        result = self._parse_uncached()
+        if result.get("success"):
+            _PARSE_CACHE.set(cache_key, copy.deepcopy(result))
+        return result
+
+    def _parse_uncached(self) -> Dict:
         if not self.fetch():
             return {
                 "success": False,
@@ -291,3 +334,11 @@ class ApartmentsParser:
             "property_type": self._extract_property_type(),
             "num_units": self._extract_unit_count(),
         }
+
+    @classmethod
+    def parse_many(cls, urls: Iterable[str], max_workers: int = 8) -> List[Dict]:
+        """
+        Parse several Apartments.com listings concurrently (see services/batch_parse.py).
+        Results are returned in the same order as `urls`.
+        """
+        return batch_parse.parse_many(cls, urls, max_workers=max_workers)
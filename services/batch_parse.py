@@ -0,0 +1,53 @@
+"""
+batch_parse.py
+
+Concurrent parsing of many listing URLs.
+
+Listing fetches are network-bound, so a small thread pool over the shared
+pooled session (services/http_session.py) overlaps the round-trips while
+extraction stays in the calling process. max_workers bounds concurrency
+per batch so a large comp pull does not hammer a single host.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, TypeVar
+
+DEFAULT_MAX_WORKERS = 8
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_ordered(fn: Callable[[T], R], items: Iterable[T], max_workers: int = DEFAULT_MAX_WORKERS) -> List[R]:
+    """
+    Apply fn to every item on a thread pool, returning results in input order.
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(fn, items))
+
+
+def parse_many(
+    parser_cls,
+    urls: Iterable[str],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    method: str = "parse",
+) -> List[Dict]:
+    """
+    Run parser_cls(url).parse() (or the named `method`) for every URL
+    concurrently.
+
+    Results are returned in the same order as `urls`. A parser that raises
+    is reported as {"success": False, "error": ...} rather than aborting
+    the whole batch.
+    """
+    def _parse_one(url: str) -> Dict:
+        try:
+            return getattr(parser_cls(url), method)()
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    return map_ordered(_parse_one, urls, max_workers=max_workers)
@@ -14,10 +14,23 @@ Produce a standardized property data output consistent with Zillow/Redfin/Realto
 """
 
 import re
-import json
-import requests
+import copy
 from bs4 import BeautifulSoup
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Iterable
+
+from services import batch_parse
+from services.html_parsing import (
+    iter_json_ld,
+    json_ld_blobs,
+    json_ld_types,
+    loads_dict,
+    make_soup,
+)
+from services.http_session import get_session
+from services.ttl_cache import TTLCache
+
+# Successful parse results, keyed by (parser version, url)
+_PARSE_CACHE = TTLCache(maxsize=1024, ttl=3600)
 
 
 class Century21Parser:
@@ -49,10 +62,37 @@ class Century21Parser:
         "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     )
 
+    # Bump when extraction logic changes so cached results are not reused
+    PARSER_VERSION = 1
+
+    JSON_LD_TYPES = frozenset({"SingleFamilyResidence", "Apartment", "House", "Residence"})
+
+    INITIAL_STATE_PATTERN = re.compile(r"window\.__INITIAL_STATE__\s*=\s*({.*?});")
+    PRICE_PATTERN = re.compile(r"\$([\d,]+)")
+    CITY_STATE_ZIP_PATTERN = re.compile(r",\s*([\w\s]+),\s*([A-Z]{2})\s*(\d{5})")
+    BEDS_PATTERN = re.compile(r"([\d\.]+)\s*beds?", re.IGNORECASE)
+    BATHS_PATTERN = re.compile(r"([\d\.]+)\s*bath", re.IGNORECASE)
+    SQFT_PATTERN = re.compile(r"([\d,]+)\s*sq\s*ft", re.IGNORECASE)
+    LOT_SIZE_PATTERN = re.compile(r"([\d,]+)\s*sq\s*ft\s*lot", re.IGNORECASE)
+    YEAR_BUILT_PATTERN = re.compile(r"Year Built[:\s]+(\d{4})")
+    UNIT_COUNT_PATTERN = re.compile(r"(\d+)[ -]?unit\b", re.IGNORECASE)
+    PLEX_PATTERN = re.compile(r"duplex|triplex|fourplex|quadruplex", re.IGNORECASE)
+
     def __init__(self, url: str):
         self.url = url
         self.html = None
-        self.soup = None
+        self._soup: Optional[BeautifulSoup] = None
+
+    @property
+    def soup(self) -> Optional[BeautifulSoup]:
+        """
+        BeautifulSoup tree, built on first access. JSON-LD, embedded JSON
+        and most fallbacks read the raw HTML, so the tree is only needed
+        for the h1/title address fallback.
+        """
+        if self._soup is None and self.html:
+            self._soup = make_soup(self.html)
+        return self._soup
 
     # -------------------------------------------------------------
     # Fetch Page
@@ -60,7 +100,7 @@ class Century21Parser:
 
     def fetch(self) -> bool:
         try:
-            resp = requests.get(
+            resp = get_session().get(
                 self.url,
                 headers={"User-Agent": self.USER_AGENT},
                 timeout=15,
@@ -69,7 +109,7 @@ class Century21Parser:
                 return False
 
             self.html = resp.text
-            self.soup = BeautifulSoup(self.html, "html.parser")
+            self._soup = None
             return True
         except Exception:
             return False
@@ -82,22 +122,12 @@ class Century21Parser:
         """
         Extracts JSON-LD embedded in <script type='application/ld+json'>.
         """
-        data = {}
-        for tag in self.soup.find_all("script", type="application/ld+json"):
-            try:
-                parsed = json.loads(tag.string)
-                if isinstance(parsed, dict) and parsed.get("@type") in [
-                    "SingleFamilyResidence",
-                    "Apartment",
-                    "House",
-                    "Residence",
-                ]:
-                    data = parsed
-                    break
-            except Exception:
-                continue
+        # Scanned straight from the HTML so no parse tree has to be built
+        for obj in iter_json_ld(json_ld_blobs(self.html)):
+            if json_ld_types(obj) & self.JSON_LD_TYPES:
+                return obj
 
-        return data
+        return {}
 
     def _extract_embedded_json(self) -> Dict:
         """
@@ -106,12 +136,9 @@ class Century21Parser:
         if not self.html:
             return {}
 
-        match = re.search(r"window\.__INITIAL_STATE__\s*=\s*({.*?});", self.html)
+        match = self.INITIAL_STATE_PATTERN.search(self.html)
         if match:
-            try:
-                return json.loads(match.group(1))
-            except Exception:
-                return {}
+            return loads_dict(match.group(1))
 
         return {}
 
@@ -119,6 +146,23 @@ class Century21Parser:
     # Field Extraction Helpers
     # -------------------------------------------------------------
 
+    @staticmethod
+    def _flatten_characteristics(json_data: Dict) -> Dict:
+        """
+        Flattens propertyDetails.characteristics into {field: value} once,
+        so each field helper is a single dict lookup instead of a
+        four-level .get() walk.
+        """
+        details = json_data.get("propertyDetails")
+        chars = details.get("characteristics") if isinstance(details, dict) else None
+        if not isinstance(chars, dict):
+            return {}
+
+        return {
+            key: (val.get("value") if isinstance(val, dict) else val)
+            for key, val in chars.items()
+        }
+
     def _extract_price(self, json_data: Dict) -> Optional[float]:
         # JSON-LD first
         offers = json_data.get("offers", {})
@@ -142,7 +186,7 @@ class Century21Parser:
 
         # HTML fallback
         if self.html:
-            m = re.search(r"\$([\d,]+)", self.html)
+            m = self.PRICE_PATTERN.search(self.html)
             if m:
                 return float(m.group(1).replace(",", ""))
 
@@ -160,12 +204,16 @@ class Century21Parser:
             if parts:
                 return ", ".join(parts)
 
-        # HTML fallback
-        h1 = self.soup.find("h1")
+        # HTML fallback (builds the soup lazily)
+        soup = self.soup
+        if soup is None:
+            return None
+
+        h1 = soup.find("h1")
         if h1:
             return h1.get_text(strip=True)
 
-        title = self.soup.find("title")
+        title = soup.find("title")
         if title:
             return title.get_text(strip=True)
 
@@ -182,150 +230,117 @@ class Century21Parser:
 
         # HTML fallback
         if self.html:
-            m = re.search(r",\s*([\w\s]+),\s*([A-Z]{2})\s*(\d{5})", self.html)
+            m = self.CITY_STATE_ZIP_PATTERN.search(self.html)
             if m:
                 return m.group(1), m.group(2), m.group(3)
 
         return None, None, None
 
-    def _extract_beds(self, json_data: Dict) -> Optional[float]:
-        # JSON data
-        try:
-            bed = (
-                json_data.get("propertyDetails", {})
-                .get("characteristics", {})
-                .get("bedrooms", {})
-                .get("value")
-            )
-            if bed:
+    def _extract_beds(self, chars: Dict) -> Optional[float]:
+        bed = chars.get("bedrooms")
+        if bed:
+            try:
                 return float(bed)
-        except Exception:
-            pass
+            except Exception:
+                pass
 
         # HTML fallback
         if self.html:
-            m = re.search(r"([\d\.]+)\s*beds?", self.html.lower())
+            m = self.BEDS_PATTERN.search(self.html)
             if m:
                 return float(m.group(1))
 
         return None
 
-    def _extract_baths(self, json_data: Dict) -> Optional[float]:
-        try:
-            bath = (
-                json_data.get("propertyDetails", {})
-                .get("characteristics", {})
-                .get("bathrooms", {})
-                .get("value")
-            )
-            if bath:
+    def _extract_baths(self, chars: Dict) -> Optional[float]:
+        bath = chars.get("bathrooms")
+        if bath:
+            try:
                 return float(bath)
-        except Exception:
-            pass
+            except Exception:
+                pass
 
         if self.html:
-            m = re.search(r"([\d\.]+)\s*bath", self.html.lower())
+            m = self.BATHS_PATTERN.search(self.html)
             if m:
                 return float(m.group(1))
 
         return None
 
-    def _extract_sqft(self, json_data: Dict) -> Optional[int]:
-        try:
-            sqft = (
-                json_data.get("propertyDetails", {})
-                .get("characteristics", {})
-                .get("livingArea", {})
-                .get("value")
-            )
-            if sqft:
+    def _extract_sqft(self, chars: Dict) -> Optional[int]:
+        sqft = chars.get("livingArea")
+        if sqft:
+            try:
                 return int(sqft)
-        except Exception:
-            pass
+            except Exception:
+                pass
 
         if self.html:
-            m = re.search(r"([\d,]+)\s*sq\s*ft", self.html.lower())
+            m = self.SQFT_PATTERN.search(self.html)
             if m:
                 return int(m.group(1).replace(",", ""))
 
         return None
 
-    def _extract_lot_size(self, json_data: Dict) -> Optional[int]:
-        try:
-            lot = (
-                json_data.get("propertyDetails", {})
-                .get("characteristics", {})
-                .get("lotSize", {})
-                .get("value")
-            )
-            if lot:
+    def _extract_lot_size(self, chars: Dict) -> Optional[int]:
+        lot = chars.get("lotSize")
+        if lot:
+            try:
                 return int(lot)
-        except Exception:
-            pass
+            except Exception:
+                pass
 
         if self.html:
-            m = re.search(r"([\d,]+)\s*sq\s*ft\s*lot", self.html.lower())
+            m = self.LOT_SIZE_PATTERN.search(self.html)
             if m:
                 return int(m.group(1).replace(",", ""))
 
         return None
 
-    def _extract_year_built(self, json_data: Dict) -> Optional[int]:
-        try:
-            year = (
-                json_data.get("propertyDetails", {})
-                .get("characteristics", {})
-                .get("yearBuilt", {})
-                .get("value")
-            )
-            if year:
+    def _extract_year_built(self, chars: Dict) -> Optional[int]:
+        year = chars.get("yearBuilt")
+        if year:
+            try:
                 return int(year)
-        except Exception:
-            pass
+            except Exception:
+                pass
 
         # HTML fallback
         if self.html:
-            m = re.search(r"Year Built[:\s]+(\d{4})", self.html)
+            m = self.YEAR_BUILT_PATTERN.search(self.html)
             if m:
                 return int(m.group(1))
 
         return None
 
-    def _extract_property_type(self, json_ld: Dict, json_data: Dict) -> Optional[str]:
-        if "@type" in json_ld:
-            return json_ld["@type"]
-
-        try:
-            pt = (
-                json_data.get("propertyDetails", {})
-                .get("characteristics", {})
-                .get("propertyType", {})
-                .get("value")
-            )
-            if pt:
-                return pt
-        except Exception:
-            pass
+    def _extract_property_type(self, json_ld: Dict, chars: Dict) -> Optional[str]:
+        kind = json_ld.get("@type")
+        if isinstance(kind, list):
+            # A multi-typed object: report the residence type it matched on
+            kind = next((k for k in kind if k in self.JSON_LD_TYPES), None)
+        if kind:
+            return kind
 
-        return None
+        return chars.get("propertyType") or None
 
     def _extract_num_units(self) -> Optional[int]:
         """
         Try to infer number of units from description text.
         """
-        text = self.html.lower() if self.html else ""
+        text = self.html or ""
 
         # Explicit detection
-        m = re.search(r"(\d+)[ -]?unit\b", text)
+        m = self.UNIT_COUNT_PATTERN.search(text)
         if m:
             return int(m.group(1))
 
-        # Keyword inference
-        if "duplex" in text:
+        # Keyword inference (one case-insensitive scan, no lowered copy)
+        found = {kw.lower() for kw in self.PLEX_PATTERN.findall(text)}
+        if "duplex" in found:
             return 2
-        if "triplex" in text:
+        if "triplex" in found:
             return 3
-        if "fourplex" in text or "quadruplex" in text:
+        if "fourplex" in found or "quadruplex" in found:
             return 4
 
         return None
@@ -335,6 +350,17 @@ class Century21Parser:
     # -------------------------------------------------------------
 
     def parse(self) -> Dict:
+        cache_key = (self.PARSER_VERSION, self.url)
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        result = self._parse_uncached()
+        if result.get("success"):
+            _PARSE_CACHE.set(cache_key, copy.deepcopy(result))
+        return result
+
+    def _parse_uncached(self) -> Dict:
         if not self.fetch():
             return {"success": False, "error": "Failed to fetch Century21 page"}
 
@@ -344,6 +370,8 @@ class Century21Parser:
         # If JSON-LD is empty but embedded JSON exists, merge the two
         primary_json = {**json_ld, **embedded_json} if embedded_json else json_ld
 
+        chars = self._flatten_characteristics(primary_json)
+
         address_full = self._extract_address(primary_json)
         city, state, zipcode = self._extract_city_state_zip(primary_json)
 
@@ -355,11 +383,19 @@ class Century21Parser:
             "state": state,
             "zip": zipcode,
             "price": self._extract_price(primary_json),
-            "beds": self._extract_beds(primary_json),
-            "baths": self._extract_baths(primary_json),
-            "sqft": self._extract_sqft(primary_json),
-            "lot_size": self._extract_lot_size(primary_json),
-            "year_built": self._extract_year_built(primary_json),
-            "property_type": self._extract_property_type(json_ld, primary_json),
+            "beds": self._extract_beds(chars),
+            "baths": self._extract_baths(chars),
+            "sqft": self._extract_sqft(chars),
+            "lot_size": self._extract_lot_size(chars),
+            "year_built": self._extract_year_built(chars),
+            "property_type": self._extract_property_type(json_ld, chars),
             "num_units": self._extract_num_units(),
         }
+
+    @classmethod
+    def parse_many(cls, urls: Iterable[str], max_workers: int = 8) -> List[Dict]:
+        """
+        Parse several Century21 listings concurrently (see services/batch_parse.py).
+        Results are returned in the same order as `urls`.
+        """
+        return batch_parse.parse_many(cls, urls, max_workers=max_workers)
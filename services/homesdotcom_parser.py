@@ -18,12 +18,29 @@ Homes.com may change their front-end structure periodically.
 """
 
 import re
-import json
-from typing import Optional, Dict
+import copy
+from typing import Optional, Dict, List, Iterable
 
-import requests
 from bs4 import BeautifulSoup
 
+from services import batch_parse
+from services.html_parsing import (
+    as_float,
+    as_int,
+    dig,
+    extract_next_data,
+    first_matches,
+    iter_json_ld,
+    json_ld_blobs,
+    json_ld_types,
+    make_soup,
+)
+from services.http_session import get_session
+from services.ttl_cache import TTLCache
+
+# Successful parse results, keyed by (parser version, url)
+_PARSE_CACHE = TTLCache(maxsize=1024, ttl=3600)
+
 
 class HomesDotComParser:
     """
@@ -54,10 +71,52 @@ class HomesDotComParser:
         "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     )
 
+    # Bump when extraction logic changes so cached results are not reused
+    PARSER_VERSION = 1
+
+    # Listing facts, fused into one alternation so the raw HTML is scanned
+    # once (see html_parsing.first_matches). Free-text captures (city/state/
+    # zip, property type) stay separate since they can swallow other fields.
+    FIELDS_PATTERN = re.compile(
+        r"(?=(?P<price>\$(?P<price_val>[\d,]+))"
+        r"|(?i:(?P<beds>(?P<beds_val>[\d\.]+)\s*beds?))"
+        r"|(?i:(?P<baths>(?P<baths_val>[\d\.]+)\s*baths?))"
+        r"|(?i:(?P<lot_size>(?P<lot_size_val>[\d,]+)\s*sq\s*ft\s*lot))"
+        r"|(?i:(?P<sqft>(?P<sqft_val>[\d,]+)\s*sq\s*ft))"
+        r"|(?P<built_in>Built\s+in\s+(?P<built_in_val>\d{4}))"
+        r"|(?P<year_built>Year Built[:\s]+(?P<year_built_val>\d{4}))"
+        r"|(?i:(?P<num_units>(?P<num_units_val>\d+)[ -]?unit\b))"
+        r")"
+    )
+    # A lot-size match is also an "N sq ft" match at the same position
+    FIELD_ALIASES = {"lot_size": ("sqft",)}
+
+    JSON_LD_TYPES = frozenset({"SingleFamilyResidence", "Apartment", "House", "Residence"})
+
+    # Where the listing model lives inside __NEXT_DATA__
+    NEXT_DATA_PATH = ("props", "pageProps", "property")
+
+    CITY_STATE_ZIP_PATTERN = re.compile(r",\s*([\w\s]+),\s*([A-Z]{2})\s*(\d{5})")
+    PROPERTY_TYPE_PATTERN = re.compile(r"Property Type[:\s]+([\w\s]+)<")
+    PLEX_PATTERN = re.compile(r"duplex|triplex|fourplex|quadruplex", re.IGNORECASE)
+
     def __init__(self, url: str):
         self.url = url
         self.html: Optional[str] = None
-        self.soup: Optional[BeautifulSoup] = None
+        self._soup: Optional[BeautifulSoup] = None
+        self._fields: Optional[Dict[str, str]] = None
+        self._json_ld_cache: Optional[Dict] = None
+
+    @property
+    def soup(self) -> Optional[BeautifulSoup]:
+        """
+        BeautifulSoup tree, built on first access. JSON-LD, __NEXT_DATA__
+        and the regex fallbacks all read the raw HTML, so the tree is only
+        needed for the og:title / <title> address fallback.
+        """
+        if self._soup is None and self.html:
+            self._soup = make_soup(self.html)
+        return self._soup
 
     # ---------------------------------------------------------
     # Fetch HTML
@@ -65,14 +124,16 @@ class HomesDotComParser:
 
     def fetch(self) -> bool:
         try:
-            resp = requests.get(
+            resp = get_session().get(
                 self.url,
                 headers={"User-Agent": self.USER_AGENT},
                 timeout=10,
             )
             resp.raise_for_status()
             self.html = resp.text
-            self.soup = BeautifulSoup(self.html, "html.parser")
+            self._soup = None
+            self._fields = None
+            self._json_ld_cache = None
             return True
         except Exception:
             return False
@@ -85,39 +146,56 @@ class HomesDotComParser:
         """
         Some Homes.com pages ship structured property data inside
         <script type="application/ld+json"> or other JSON blobs.
+        Decoded once per fetched page and reused.
         """
-        if not self.soup:
+        if self._json_ld_cache is None:
+            self._json_ld_cache = self._find_embedded_json()
+        return self._json_ld_cache
+
+    def _find_embedded_json(self) -> Dict:
+        if not self.html:
             return {}
 
-        data = {}
+        # Try JSON-LD first, scanned straight from the HTML so no parse
+        # tree has to be built; take the first object that looks like a
+        # residence
+        for obj in iter_json_ld(json_ld_blobs(self.html)):
+            if json_ld_types(obj) & self.JSON_LD_TYPES:
+                return obj
 
-        # Try JSON-LD first
-        for tag in self.soup.find_all("script", type="application/ld+json"):
-            try:
-                j = json.loads(tag.string or "{}")
-                # Take the first object that looks like a residence
-                if isinstance(j, dict) and j.get("@type") in [
-                    "SingleFamilyResidence",
-                    "Apartment",
-                    "House",
-                    "Residence",
-                ]:
-                    data = j
-                    break
-                if isinstance(j, list):
-                    for item in j:
-                        if isinstance(item, dict) and item.get("@type") in [
-                            "SingleFamilyResidence",
-                            "Apartment",
-                            "House",
-                            "Residence",
-                        ]:
-                            data = item
-                            break
-            except Exception:
-                continue
+        return {}
+
+    def _extract_next_data(self) -> Dict:
+        """
+        Listing facts from the __NEXT_DATA__ page model, keyed like the
+        parse() output. Missing values are left out so the JSON-LD / HTML
+        fallbacks still run for them.
+        """
+        prop = dig(extract_next_data(self.html), *self.NEXT_DATA_PATH)
+        if not isinstance(prop, dict):
+            return {}
 
-        return data
+        facts = {
+            "price": as_float(prop.get("listPrice") or prop.get("price")),
+            "beds": as_float(prop.get("bedrooms") or prop.get("beds")),
+            "baths": as_float(prop.get("bathrooms") or prop.get("baths")),
+            "sqft": as_int(prop.get("livingArea") or prop.get("sqft")),
+            "lot_size": as_int(prop.get("lotSize")),
+            "year_built": as_int(prop.get("yearBuilt")),
+            "property_type": prop.get("propertyType") or None,
+        }
+        return {k: v for k, v in facts.items() if v is not None}
+
+    def _html_field(self, name: str) -> Optional[str]:
+        """
+        First raw-HTML value for `name`, from a single fused scan of the
+        page that is run on first use.
+        """
+        if self._fields is None:
+            self._fields = first_matches(
+                self.FIELDS_PATTERN, self.html or "", self.FIELD_ALIASES
+            )
+        return self._fields.get(name)
 
     # ---------------------------------------------------------
     # Field Extractors (JSON-LD first, then HTML fallback)
@@ -135,10 +213,9 @@ class HomesDotComParser:
                     pass
 
         # Fallback: search for a currency pattern
-        if self.html:
-            m = re.search(r"\$([\d,]+)", self.html)
-            if m:
-                return float(m.group(1).replace(",", ""))
+        val = self._html_field("price")
+        if val:
+            return float(val.replace(",", ""))
 
         return None
 
@@ -177,7 +254,7 @@ class HomesDotComParser:
 
         # Fallback: regex from raw HTML
         if self.html:
-            m = re.search(r",\s*([\w\s]+),\s*([A-Z]{2})\s*(\d{5})", self.html)
+            m = self.CITY_STATE_ZIP_PATTERN.search(self.html)
             if m:
                 return m.group(1), m.group(2), m.group(3)
 
@@ -190,10 +267,9 @@ class HomesDotComParser:
             except Exception:
                 pass
 
-        if self.html:
-            m = re.search(r"([\d\.]+)\s*beds?", self.html.lower())
-            if m:
-                return float(m.group(1))
+        val = self._html_field("beds")
+        if val:
+            return float(val)
 
         return None
 
@@ -204,10 +280,9 @@ class HomesDotComParser:
             except Exception:
                 pass
 
-        if self.html:
-            m = re.search(r"([\d\.]+)\s*baths?", self.html.lower())
-            if m:
-                return float(m.group(1))
+        val = self._html_field("baths")
+        if val:
+            return float(val)
 
         return None
 
@@ -219,10 +294,9 @@ class HomesDotComParser:
             except Exception:
                 pass
 
-        if self.html:
-            m = re.search(r"([\d,]+)\s*sq\s*ft", self.html.lower())
-            if m:
-                return int(m.group(1).replace(",", ""))
+        val = self._html_field("sqft")
+        if val:
+            return int(val.replace(",", ""))
 
         return None
 
@@ -234,10 +308,9 @@ class HomesDotComParser:
             except Exception:
                 pass
 
-        if self.html:
-            m = re.search(r"([\d,]+)\s*sq\s*ft\s*lot", self.html.lower())
-            if m:
-                return int(m.group(1).replace(",", ""))
+        val = self._html_field("lot_size")
+        if val:
+            return int(val.replace(",", ""))
 
         return None
 
@@ -245,22 +318,22 @@ class HomesDotComParser:
         if not self.html:
             return None
 
-        m = re.search(r"Built\s+in\s+(\d{4})", self.html)
-        if m:
-            return int(m.group(1))
-
-        m = re.search(r"Year Built[:\s]+(\d{4})", self.html)
-        if m:
-            return int(m.group(1))
+        val = self._html_field("built_in") or self._html_field("year_built")
+        if val:
+            return int(val)
 
         return None
 
     def _extract_property_type(self, json_ld: Dict) -> Optional[str]:
-        if "@type" in json_ld:
-            return json_ld["@type"]
+        kind = json_ld.get("@type")
+        if isinstance(kind, list):
+            # A multi-typed object: report the residence type it matched on
+            kind = next((k for k in kind if k in self.JSON_LD_TYPES), None)
+        if kind:
+            return kind
 
         if self.html:
-            m = re.search(r"Property Type[:\s]+([\w\s]+)<", self.html)
+            m = self.PROPERTY_TYPE_PATTERN.search(self.html)
             if m:
                 return m.group(1).strip()
 
@@ -273,16 +346,16 @@ class HomesDotComParser:
         if not self.html:
             return None
 
-        text = self.html.lower()
-        m = re.search(r"(\d+)[ -]?unit\b", text)
-        if m:
-            return int(m.group(1))
+        val = self._html_field("num_units")
+        if val:
+            return int(val)
 
-        if "duplex" in text:
+        found = {kw.lower() for kw in self.PLEX_PATTERN.findall(self.html)}
+        if "duplex" in found:
             return 2
-        if "triplex" in text:
+        if "triplex" in found:
             return 3
-        if "fourplex" in text or "quadruplex" in text:
+        if "fourplex" in found or "quadruplex" in found:
             return 4
 
         return None
@@ -292,14 +365,30 @@ class HomesDotComParser:
     # ---------------------------------------------------------
 
     def parse(self) -> Dict:
+        cache_key = (self.PARSER_VERSION, self.url)
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        result = self._parse_uncached()
+        if result.get("success"):
+            _PARSE_CACHE.set(cache_key, copy.deepcopy(result))
+        return result
+
+    def _parse_uncached(self) -> Dict:
         if not self.fetch():
             return {"success": False, "error": "Failed to fetch Homes.com page"}
 
         json_ld = self._extract_embedded_json()
+        facts = self._extract_next_data()
 
         address_full = self._extract_address_full(json_ld)
         city, state, zipcode = self._extract_city_state_zip(json_ld)
 
+        def field(name, extract, *args):
+            # Structured page model first, regex ladder only if it is missing
+            return facts[name] if name in facts else extract(*args)
+
         return {
             "success": True,
             "source": "homes.com",
@@ -307,12 +396,20 @@ class HomesDotComParser:
             "city": city,
             "state": state,
             "zip": zipcode,
-            "price": self._extract_price(json_ld),
-            "beds": self._extract_beds(json_ld),
-            "baths": self._extract_baths(json_ld),
-            "sqft": self._extract_sqft(json_ld),
-            "lot_size": self._extract_lot_size(json_ld),
-            "year_built": self._extract_year_built(),
-            "property_type": self._extract_property_type(json_ld),
+            "price": field("price", self._extract_price, json_ld),
+            "beds": field("beds", self._extract_beds, json_ld),
+            "baths": field("baths", self._extract_baths, json_ld),
+            "sqft": field("sqft", self._extract_sqft, json_ld),
+            "lot_size": field("lot_size", self._extract_lot_size, json_ld),
+            "year_built": field("year_built", self._extract_year_built),
+            "property_type": field("property_type", self._extract_property_type, json_ld),
             "num_units": self._extract_num_units(),
         }
+
+    @classmethod
+    def parse_many(cls, urls: Iterable[str], max_workers: int = 8) -> List[Dict]:
+        """
+        Parse several Homes.com listings concurrently (see services/batch_parse.py).
+        Results are returned in the same order as `urls`.
+        """
+        return batch_parse.parse_many(cls, urls, max_workers=max_workers)
@@ -0,0 +1,230 @@
+"""
+html_parsing.py
+
+Shared BeautifulSoup construction and raw-HTML scanning for the listing
+parsers.
+
+lxml routes parsing through libxml2 and is several times faster than the
+pure-Python "html.parser" on large listing pages. It is optional: when it
+is not installed we fall back to the stdlib parser so nothing breaks.
+"""
+
+import re
+import json
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Pattern
+
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+
+try:
+    import lxml  # type: ignore  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# Optional faster JSON decoder for the embedded page-state blobs
+try:
+    import orjson  # type: ignore
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+SOUP_FEATURES = "lxml" if HAS_LXML else "html.parser"
+
+NEXT_DATA_PATTERN = re.compile(
+    r"<script[^>]*id=[\"']__NEXT_DATA__[\"'][^>]*>(.*?)</script>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+JSON_LD_PATTERN = re.compile(
+    r"<script[^>]*type=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def make_soup(html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Build a BeautifulSoup tree with the fastest available backend.
+
+    `parse_only` limits the tree to the tags a parser actually reads;
+    everything else is skipped while parsing instead of being built and
+    then ignored.
+    """
+    return BeautifulSoup(html, SOUP_FEATURES, parse_only=parse_only)
+
+
+def find_label_nodes(soup: BeautifulSoup, labels: Iterable[str]) -> Dict[str, NavigableString]:
+    """
+    Map each label (lowercased) to the first text node in `soup` that
+    contains it, case-insensitively.
+
+    Equivalent to one soup.find(string=re.compile(label, re.I)) per label,
+    but the document's strings are walked once for all of them, and the
+    walk stops as soon as every label has been seen.
+    """
+    pending = list(dict.fromkeys(label.lower() for label in labels))
+    found: Dict[str, NavigableString] = {}
+
+    for node in soup.find_all(string=True):
+        text = node.lower()
+        hits = [label for label in pending if label in text]
+        if not hits:
+            continue
+        for label in hits:
+            found[label] = node
+        pending = [label for label in pending if label not in found]
+        if not pending:
+            break
+
+    return found
+
+
+def first_matches(
+    pattern: Pattern,
+    text: str,
+    aliases: Optional[Mapping[str, Iterable[str]]] = None,
+) -> Dict[str, str]:
+    """
+    Walk `text` once with a fused `pattern` and return the first captured
+    value for each field.
+
+    `pattern` is a zero-width lookahead over an alternation, where every
+    alternative is a named group `<field>` wrapping a value group
+    `<field>_val`; m.lastgroup names the field that matched. Matches do not
+    consume text, so each field still sees its leftmost hit. Only one
+    alternative is reported per position, so when one field's match is also
+    a valid match for another at the same spot (e.g. "5,000 sq ft lot" for
+    a plain "N sq ft" field), `aliases` lists those other fields and they
+    take the value if still unset.
+
+    The walk stops as soon as every field has a value, so pages whose facts
+    sit near the top are not scanned to the end.
+    """
+    fields: Dict[str, str] = {}
+    aliases = aliases or {}
+    wanted = sum(1 for name in pattern.groupindex if not name.endswith("_val"))
+
+    for m in pattern.finditer(text):
+        kind = m.lastgroup
+        if kind in fields:
+            continue
+        value = m.group(kind + "_val")
+        fields[kind] = value
+        for alias in aliases.get(kind, ()):
+            fields.setdefault(alias, value)
+        if len(fields) == wanted:
+            break
+
+    return fields
+
+
+# -------------------------------------------------------------
+# Next.js page state
+# -------------------------------------------------------------
+
+def extract_next_data(html: Optional[str]) -> Dict:
+    """
+    Decode the <script id="__NEXT_DATA__"> blob that Next.js sites ship
+    their page model in. Returns {} when the page has none or it is invalid.
+    """
+    if not html:
+        return {}
+
+    m = NEXT_DATA_PATTERN.search(html)
+    if not m:
+        return {}
+
+    return loads_dict(m.group(1))
+
+
+def loads_dict(text: Optional[str]) -> Dict:
+    """
+    Decode a JSON object, returning {} for empty, invalid or non-object input.
+    """
+    if not text:
+        return {}
+
+    try:
+        data = _json_loads(text)
+    except Exception:
+        return {}
+
+    return data if isinstance(data, dict) else {}
+
+
+# -------------------------------------------------------------
+# JSON-LD
+# -------------------------------------------------------------
+
+def json_ld_blobs(html: Optional[str]) -> List[str]:
+    """
+    Raw text of every <script type="application/ld+json"> tag, scanned
+    straight from the HTML so no parse tree has to be built.
+    """
+    if not html:
+        return []
+    return [m.group(1) for m in JSON_LD_PATTERN.finditer(html)]
+
+
+def iter_json_ld(blobs: Iterable[str]) -> Iterator[Dict]:
+    """
+    Every JSON-LD object in `blobs`, with top-level arrays and @graph
+    containers flattened. Blobs that do not decode are skipped.
+    """
+    for blob in blobs:
+        try:
+            data = _json_loads(blob)
+        except Exception:
+            continue
+
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            yield item
+            graph = item.get("@graph")
+            if isinstance(graph, list):
+                for node in graph:
+                    if isinstance(node, dict):
+                        yield node
+
+
+def json_ld_types(obj: Mapping) -> FrozenSet[str]:
+    """
+    The @type of a JSON-LD object as a set (it may be a string or a list).
+    """
+    kind = obj.get("@type")
+    if isinstance(kind, str):
+        return frozenset((kind,))
+    if isinstance(kind, list):
+        return frozenset(k for k in kind if isinstance(k, str))
+    return frozenset()
+
+
+def dig(data: Any, *path: str) -> Any:
+    """
+    Follow `path` through nested dicts, returning None if any step is missing.
+    """
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def as_float(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def as_int(value: Any) -> Optional[int]:
+    number = as_float(value)
+    if number is None:
+        return None
+    try:
+        return int(number)
+    except (OverflowError, ValueError):
+        return None
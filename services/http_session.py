@@ -0,0 +1,120 @@
+"""
+http_session.py
+
+Shared HTTP session for the listing parsers.
+
+Each parser used to call the top-level requests.get(), which builds a
+fresh Session, adapter and connection pool per listing. Routing fetches
+through one pooled Session lets repeated requests to the same host reuse
+keep-alive connections instead of paying a new TLS handshake every time.
+
+Listing pages are large and compress well, so the session also advertises
+gzip/deflate (and brotli when a decoder is installed) on every request.
+
+Batch fetches share a per-host limit (host_slot), with a little random
+jitter once the limit is reached, so a large comp pull does not open
+dozens of simultaneous connections to one listing site and get throttled
+or blocked.
+"""
+
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# urllib3 can only decode "br" responses when a brotli package is present
+try:
+    import brotli  # type: ignore  # noqa: F401
+    HAS_BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi  # type: ignore  # noqa: F401
+        HAS_BROTLI = True
+    except ImportError:
+        HAS_BROTLI = False
+
+
+POOL_CONNECTIONS = 20
+POOL_MAXSIZE = 50
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.3
+
+# Concurrent requests allowed per host across all threads
+MAX_PER_HOST = int(os.getenv("LISTING_MAX_PER_HOST", "10"))
+# Upper bound (seconds) of the random delay taken before a request that
+# had to wait for a host slot
+REQUEST_JITTER = float(os.getenv("LISTING_REQUEST_JITTER", "0.1"))
+
+DEFAULT_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate",
+}
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+_HOST_SLOTS: Dict[str, threading.BoundedSemaphore] = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide pooled session, creating it on first use.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                session.headers.update(DEFAULT_HEADERS)
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_CONNECTIONS,
+                    pool_maxsize=POOL_MAXSIZE,
+                    max_retries=Retry(total=MAX_RETRIES, backoff_factor=RETRY_BACKOFF),
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _SESSION = session
+    return _SESSION
+
+
+def _slots_for(host: str) -> threading.BoundedSemaphore:
+    with _HOST_SLOTS_LOCK:
+        slots = _HOST_SLOTS.get(host)
+        if slots is None:
+            slots = _HOST_SLOTS[host] = threading.BoundedSemaphore(MAX_PER_HOST)
+        return slots
+
+
+@contextmanager
+def host_slot(url: str) -> Iterator[None]:
+    """
+    Hold one of the url's host request slots for the duration of the block.
+    A request that had to wait for its slot also takes a short random
+    delay, so queued requests do not all fire at once; uncontended fetches
+    (e.g. a single parse) start immediately. Wrap the whole fetch,
+    including reading the body, so streamed downloads count against the
+    limit too.
+    """
+    host = (urlparse(url).hostname or "").lower()
+    # www.zillow.com and zillow.com share one limit
+    if host.startswith("www."):
+        host = host[4:]
+
+    slots = _slots_for(host)
+    contended = not slots.acquire(blocking=False)
+    if contended:
+        slots.acquire()
+    try:
+        if contended and REQUEST_JITTER > 0:
+            time.sleep(random.uniform(0.0, REQUEST_JITTER))
+        yield
+    finally:
+        slots.release()
@@ -0,0 +1,58 @@
+"""
+inflight.py
+
+Request coalescing for concurrent fetches of the same URL.
+
+A batch comp pull often asks for the same listing from several places at
+once (subject detail, comp search, a report re-run). InFlight lets the
+first caller for a key do the work while any caller that arrives before
+it finishes waits for that same result, so N concurrent requests for one
+URL cost one download and one parse.
+
+Nothing is kept once the call completes; later callers start a new one.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class InFlight:
+    """
+    Thread-safe map of key -> pending call.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def run(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Return fn(), or the result of the identical call already running
+        for `key`. An exception raised by fn() is raised to every waiter.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def __len__(self) -> int:
+        return len(self._calls)
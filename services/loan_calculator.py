@@ -1,25 +1,90 @@
 import math
+from typing import Optional
+
+import numpy as np
 
 class LoanCalculator:
     """
     Standard mortgage amortization and investor underwriting model.
     """
 
-    def __init__(self, loan_amount: float, interest_rate: float, years: int):
-        self.principal = loan_amount
-        self.rate = interest_rate / 12
-        self.months = years * 12
+    __slots__ = ("_principal", "_rate", "_months", "_monthly")
+
+    def __init__(self, loan_amount: float, interest_rate: float, years: int) -> None:
+        self._principal: float = loan_amount
+        self._rate: float = interest_rate / 12
+        self._months: int = years * 12
+        # Payment for the current terms, computed on first use and dropped
+        # whenever a term changes
+        self._monthly: Optional[float] = None
+
+    @property
+    def principal(self) -> float:
+        return self._principal
+
+    @principal.setter
+    def principal(self, value: float) -> None:
+        self._principal = value
+        self._monthly = None
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @rate.setter
+    def rate(self, value: float) -> None:
+        self._rate = value
+        self._monthly = None
+
+    @property
+    def months(self) -> int:
+        return self._months
 
-    def monthly_payment(self):
-        r = self.rate
-        n = self.months
-        p = self.principal
+    @months.setter
+    def months(self, value: int) -> None:
+        self._months = value
+        self._monthly = None
 
+    @staticmethod
+    def _amortized_payment(p: float, r: float, n: int) -> float:
         if r == 0:
             return p / n
-        
-        payment = p * (r * (1 + r)**n) / ((1 + r)**n - 1)
-        return payment
 
-    def annual_debt_service(self):
+        pow_term = (1 + r) ** n
+        return p * (r * pow_term) / (pow_term - 1)
+
+    def monthly_payment(self) -> float:
+        if self._monthly is None:
+            self._monthly = self._amortized_payment(self._principal, self._rate, self._months)
+        return self._monthly
+
+    def annual_debt_service(self) -> float:
         return self.monthly_payment() * 12
+
+    # ----------------------------------------------------------
+    # Batch pricing
+    # ----------------------------------------------------------
+
+    @staticmethod
+    def monthly_payment_batch(principal, annual_rate, years) -> np.ndarray:
+        """
+        monthly_payment for many loans at once. Inputs are array-likes
+        (or scalars) that broadcast together; the whole portfolio is priced
+        in NumPy instead of one Python call per loan.
+        """
+        p = np.asarray(principal, dtype=np.float64)
+        r = np.asarray(annual_rate, dtype=np.float64) / 12.0
+        n = np.asarray(years, dtype=np.float64) * 12.0
+
+        pow_term = np.power(1.0 + r, n)
+        # Zero-rate rows divide 0/0 here, and zero-term rows divide by zero
+        # in both branches; np.where picks p / n for zero-rate rows
+        with np.errstate(divide="ignore", invalid="ignore"):
+            amortizing = p * (r * pow_term) / (pow_term - 1.0)
+            straight_line = p / n
+
+        return np.where(r == 0, straight_line, amortizing)
+
+    @staticmethod
+    def annual_debt_service_batch(principal, annual_rate, years) -> np.ndarray:
+        return LoanCalculator.monthly_payment_batch(principal, annual_rate, years) * 12
@@ -22,10 +22,28 @@ This is the light version. A future upgrade will support:
 """
 
 import re
+import copy
 import json
-import requests
+from html import unescape
 from bs4 import BeautifulSoup
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Iterable
+
+from services import batch_parse
+from services.html_parsing import first_matches, make_soup
+from services.http_session import get_session
+from services.ttl_cache import TTLCache
+
+# Successful parse results, keyed by (parser version, url)
+_PARSE_CACHE = TTLCache(maxsize=1024, ttl=3600)
+
+# selectolax (Lexbor backend) parses far faster than BeautifulSoup and
+# covers the rent roll lookups that still need a tree. Optional: without it
+# we fall back to BeautifulSoup.
+try:
+    from selectolax.parser import HTMLParser  # type: ignore
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
 
 
 class LoopNetParser:
@@ -58,10 +76,76 @@ class LoopNetParser:
         "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     )
 
+    # Bump when extraction logic changes so cached results are not reused
+    PARSER_VERSION = 1
+
+    CITY_STATE_ZIP_PATTERN = re.compile(r",\s*([\w\s]+),\s*([A-Z]{2})\s*(\d{5})")
+    # Listing facts, fused into one alternation so the raw HTML is scanned
+    # once (see html_parsing.first_matches). The property type capture is
+    # free text and stays separate since it can swallow other fields.
+    FIELDS_PATTERN = re.compile(
+        r"(?=(?P<noi>NOI[:\s]+\$(?P<noi_val>[\d,]+))"
+        r"|(?P<price>\$(?P<price_val>[\d,]+))"
+        r"|(?P<cap_rate>Cap Rate[:\s]+(?P<cap_rate_val>[\d\.]+)%)"
+        r"|(?P<lot_sqft>Lot Size[:\s]+(?P<lot_sqft_val>[\d,]+)\s*SF)"
+        r"|(?P<building_sqft>(?P<building_sqft_val>[\d,]+)\s*SF)"
+        r"|(?P<year_built>Year Built[:\s]+(?P<year_built_val>\d{4}))"
+        r"|(?P<num_units>(?P<num_units_val>\d+)[ -]?[Uu]nit)"
+        r")"
+    )
+
+    PROPERTY_TYPE_PATTERN = re.compile(r"Property Type[:\s]+([\w\s]+)<")
+    # Any rent roll mention in the raw HTML: a rent-roll class, or the
+    # words "rent roll" possibly split by tags or comments (as in
+    # <b>Rent</b> Roll) or written as character references
+    RENT_ROLL_PATTERN = re.compile(
+        r"rent[\s_-]*roll|"
+        + r"(?:<!--.*?-->|<[^>]*>)*".join(
+            r"(?: |&#?\w+;)" if c == " " else rf"(?:{c}|&#?\w+;)" for c in "rent roll"
+        ),
+        re.IGNORECASE | re.DOTALL,
+    )
+    PRE_TAG_PATTERN = re.compile(r"<pre\b", re.IGNORECASE)
+    RENT_ROLL_HEADING = "rent roll"
+    RENT_ROLL_SELECTOR = "div.rent-roll, section.rent-roll"
+
+    # Address and meta lookups read the raw HTML directly
+    TITLE_H1_PATTERN = re.compile(
+        r"<h1\b[^>]*\bclass=[\"'][^\"']*\bproperty-title\b[^\"']*[\"'][^>]*>(.*?)</h1>",
+        re.IGNORECASE | re.DOTALL,
+    )
+    TITLE_PATTERN = re.compile(r"<title\b[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+    META_TAG_PATTERN = re.compile(r"<meta\b[^>]*>", re.IGNORECASE)
+    TAG_ATTR_PATTERN = re.compile(r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)')""")
+    MARKUP_PATTERN = re.compile(r"<[^>]+>")
+
     def __init__(self, url: str):
         self.url = url
         self.html = None
-        self.soup: Optional[BeautifulSoup] = None
+        self._soup: Optional[BeautifulSoup] = None
+        self._tree = None
+        self._fields: Optional[Dict[str, str]] = None
+
+    @property
+    def tree(self):
+        """
+        selectolax tree, built on first access when selectolax is installed.
+        Only the rent roll lookup needs a tree; everything else reads the
+        raw HTML.
+        """
+        if self._tree is None and HAS_SELECTOLAX and self.html:
+            self._tree = HTMLParser(self.html)
+        return self._tree
+
+    @property
+    def soup(self) -> Optional[BeautifulSoup]:
+        """
+        BeautifulSoup fallback tree, built on first access and only when
+        selectolax is not available.
+        """
+        if self._soup is None and not HAS_SELECTOLAX and self.html:
+            self._soup = make_soup(self.html)
+        return self._soup
 
     # -------------------------------------------------------------
     # Fetch Page
@@ -69,7 +153,7 @@ class LoopNetParser:
 
     def fetch(self) -> bool:
         try:
-            r = requests.get(
+            r = get_session().get(
                 self.url,
                 headers={"User-Agent": self.USER_AGENT},
                 timeout=12,
@@ -78,7 +162,9 @@ class LoopNetParser:
                 return False
 
             self.html = r.text
-            self.soup = BeautifulSoup(self.html, "html.parser")
+            self._tree = None
+            self._soup = None
+            self._fields = None
             return True
         except Exception:
             return False
@@ -94,33 +180,67 @@ class LoopNetParser:
         - meta[property="og:title"]
         - title tag
         """
-        if not self.soup:
+        if not self.html:
             return None
 
-        title_el = self.soup.select_one("h1.property-title")
-        if title_el:
-            return title_el.get_text(strip=True)
+        m = self.TITLE_H1_PATTERN.search(self.html)
+        if m:
+            return self._markup_text(m.group(1))
 
-        meta = self.soup.find("meta", property="og:title")
-        if meta and meta.get("content"):
-            return meta["content"].strip()
+        content = self._meta_content("og:title")
+        if content:
+            return content.strip()
 
-        title2 = self.soup.find("title")
-        if title2:
-            return title2.get_text(strip=True)
+        m = self.TITLE_PATTERN.search(self.html)
+        if m:
+            return self._markup_text(m.group(1))
 
         return None
 
+    @classmethod
+    def _markup_text(cls, fragment: str) -> str:
+        """
+        Text of an HTML fragment with tags dropped and each text run
+        stripped, matching BeautifulSoup's get_text(strip=True).
+        """
+        return "".join(unescape(part).strip() for part in cls.MARKUP_PATTERN.split(fragment))
+
     def _extract_city_state_zip(self, address: str):
         if not address:
             return None, None, None
 
-        m = re.search(r",\s*([\w\s]+),\s*([A-Z]{2})\s*(\d{5})", address)
+        m = self.CITY_STATE_ZIP_PATTERN.search(address)
         if m:
             return m.group(1), m.group(2), m.group(3)
 
         return None, None, None
 
+    def _html_field(self, name: str) -> Optional[str]:
+        """
+        First raw-HTML value for `name`, from a single fused scan of the
+        page that is run on first use.
+        """
+        if self._fields is None:
+            self._fields = first_matches(self.FIELDS_PATTERN, self.html or "")
+        return self._fields.get(name)
+
+    def _meta_content(self, prop: str) -> Optional[str]:
+        """
+        content attribute of the first <meta property=prop> tag.
+        """
+        if not self.html:
+            return None
+
+        for tag in self.META_TAG_PATTERN.finditer(self.html):
+            attrs = {
+                name.lower(): unescape(dq or sq)
+                for name, dq, sq in self.TAG_ATTR_PATTERN.findall(tag.group(0))
+            }
+            if attrs.get("property") == prop:
+                return attrs.get("content")
+
+        return None
+
     # -------------------------------------------------------------
     # Price, Cap Rate, NOI
     # -------------------------------------------------------------
@@ -130,10 +250,10 @@ class LoopNetParser:
             return None
 
         # $3,200,000 style
-        m = re.search(r"\$([\d,]+)", self.html)
-        if m:
+        val = self._html_field("price")
+        if val:
             try:
-                return float(m.group(1).replace(",", ""))
+                return float(val.replace(",", ""))
             except:
                 return None
 
@@ -143,9 +263,9 @@ class LoopNetParser:
         if not self.html:
             return None
 
-        m = re.search(r"Cap Rate[:\s]+([\d\.]+)%", self.html)
-        if m:
-            return float(m.group(1)) / 100
+        val = self._html_field("cap_rate")
+        if val:
+            return float(val) / 100
 
         return None
 
@@ -154,10 +274,10 @@ class LoopNetParser:
             return None
 
         # NOI: $123,456
-        m = re.search(r"NOI[:\s]+\$([\d,]+)", self.html)
-        if m:
+        val = self._html_field("noi")
+        if val:
             try:
-                return float(m.group(1).replace(",", ""))
+                return float(val.replace(",", ""))
             except:
                 pass
 
@@ -171,10 +291,10 @@ class LoopNetParser:
         if not self.html:
             return None
 
-        m = re.search(r"([\d,]+)\s*SF", self.html)
-        if m:
+        val = self._html_field("building_sqft")
+        if val:
             try:
-                return int(m.group(1).replace(",", ""))
+                return int(val.replace(",", ""))
             except:
                 return None
 
@@ -185,10 +305,10 @@ class LoopNetParser:
             return None
 
         # Lot Size: 7,500 SF
-        m = re.search(r"Lot Size[:\s]+([\d,]+)\s*SF", self.html)
-        if m:
+        val = self._html_field("lot_sqft")
+        if val:
             try:
-                return int(m.group(1).replace(",", ""))
+                return int(val.replace(",", ""))
             except:
                 return None
 
@@ -198,9 +318,9 @@ class LoopNetParser:
         if not self.html:
             return None
 
-        m = re.search(r"Year Built[:\s]+(\d{4})", self.html)
-        if m:
-            return int(m.group(1))
+        val = self._html_field("year_built")
+        if val:
+            return int(val)
 
         return None
 
@@ -212,26 +332,22 @@ class LoopNetParser:
         if not self.html:
             return None
 
-        m = re.search(r"Property Type[:\s]+([\w\s]+)<", self.html)
+        m = self.PROPERTY_TYPE_PATTERN.search(self.html)
         if m:
             return m.group(1).strip()
 
         # fallback meta
-        meta = self.soup.find("meta", property="og:type")
-        if meta:
-            return meta.get("content")
-
-        return None
+        return self._meta_content("og:type")
 
     def _extract_num_units(self) -> Optional[int]:
         if not self.html:
             return None
 
         # 16 Units, 24-Unit Building, etc.
-        m = re.search(r"(\d+)[ -]?[Uu]nit", self.html)
-        if m:
+        val = self._html_field("num_units")
+        if val:
             try:
-                return int(m.group(1))
+                return int(val)
             except:
                 pass
 
@@ -249,6 +365,29 @@ class LoopNetParser:
         This does NOT replace full OM/PDF extraction, but is a useful
         starting input for the underwriting model.
         """
+        # Without a <pre> block or any rent roll mention there is nothing
+        # to find, so don't build a tree at all
+        if not self.html or not (
+            self.PRE_TAG_PATTERN.search(self.html)
+            or self.RENT_ROLL_PATTERN.search(self.html)
+        ):
+            return None
+
+        if self.tree is not None:
+            pre = self.tree.css_first("pre")
+            if pre:
+                return pre.text(separator="\n", strip=True)
+
+            node = self.tree.css_first(self.RENT_ROLL_SELECTOR)
+            if node:
+                return node.text(separator="\n", strip=True) or None
+
+            for node in self.tree.css("div, section"):
+                if node.text().strip().lower().startswith("rent roll"):
+                    return node.text(separator="\n", strip=True) or None
+
+            return None
+
         if not self.soup:
             return None
 
@@ -257,23 +396,51 @@ class LoopNetParser:
         if pre:
             return pre.get_text("\n", strip=True)
 
-        # fallback: search for "Rent Roll" section title
-        rr_block = None
-        for tag in self.soup.find_all(["div", "section"]):
-            if tag.get_text().strip().lower().startswith("rent roll"):
-                rr_block = tag.get_text("\n", strip=True)
-                break
+        # dedicated rent roll container
+        block = self.soup.select_one(self.RENT_ROLL_SELECTOR)
+        if block:
+            return block.get_text("\n", strip=True) or None
 
-        if rr_block:
-            return rr_block
+        # fallback: the first div/section whose text opens with a "Rent Roll"
+        # title. The title may be split across tags, so each container's
+        # text is checked, but only as far as its opening characters instead
+        # of materializing the text of every div/section on the page.
+        for tag in self.soup.find_all(["div", "section"]):
+            if self._opens_with_rent_roll(tag):
+                return tag.get_text("\n", strip=True) or None
 
         return None
 
+    @classmethod
+    def _opens_with_rent_roll(cls, tag) -> bool:
+        """
+        tag.get_text().strip().lower().startswith("rent roll"), reading
+        only the strings needed to decide it.
+        """
+        needed = len(cls.RENT_ROLL_HEADING)
+        opening = ""
+        for text in tag.strings:
+            opening = (opening + text).lstrip()
+            if len(opening) >= needed:
+                break
+        return opening[:needed].lower().startswith(cls.RENT_ROLL_HEADING)
+
     # -------------------------------------------------------------
     # Main parse()
     # -------------------------------------------------------------
 
     def parse(self) -> Dict:
+        cache_key = (self.PARSER_VERSION, self.url)
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        result = self._parse_uncached()
+        if result.get("success"):
+            _PARSE_CACHE.set(cache_key, copy.deepcopy(result))
+        return result
+
+    def _parse_uncached(self) -> Dict:
         if not self.fetch():
             return {"success": False, "error": "Failed to fetch LoopNet page"}
 
@@ -297,3 +464,11 @@ class LoopNetParser:
             "noi": self._extract_noi(),
             "rent_roll_raw": self._extract_rent_roll_raw(),
         }
+
+    @classmethod
+    def parse_many(cls, urls: Iterable[str], max_workers: int = 8) -> List[Dict]:
+        """
+        Parse several LoopNet listings concurrently (see services/batch_parse.py).
+        Results are returned in the same order as `urls`.
+        """
+        return batch_parse.parse_many(cls, urls, max_workers=max_workers)
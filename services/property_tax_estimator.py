@@ -9,22 +9,46 @@ Defaults:
 
 from typing import Optional
 
+import numpy as np
+
 
 class PropertyTaxEstimator:
-    def __init__(self, base_rate: float = 0.01, local_add_on_rate: float = 0.0025):
-        self.base_rate = base_rate
-        self.local_add_on_rate = local_add_on_rate
+    __slots__ = ("base_rate", "local_add_on_rate", "_total_rate")
+
+    def __init__(self, base_rate: float = 0.01, local_add_on_rate: float = 0.0025) -> None:
+        self.base_rate: float = base_rate
+        self.local_add_on_rate: float = local_add_on_rate
+        self._total_rate: float = base_rate + local_add_on_rate
 
     def estimate_annual_tax(self, purchase_price: float, custom_rate: Optional[float] = None) -> float:
         """
         Estimate annual property tax.
         If custom_rate is provided, it overrides base + local add.
         """
-        if custom_rate is not None:
-            rate = custom_rate
-        else:
-            rate = self.base_rate + self.local_add_on_rate
+        rate = custom_rate if custom_rate is not None else self._total_rate
         return purchase_price * rate
 
     def estimate_monthly_tax(self, purchase_price: float, custom_rate: Optional[float] = None) -> float:
         return self.estimate_annual_tax(purchase_price, custom_rate) / 12
+
+    def estimate_annual_tax_batch(
+        self,
+        purchase_prices: np.ndarray,
+        custom_rates: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Annual tax for a whole set of parcels in one array multiply.
+        custom_rates, if given, is a per-parcel rate array (or scalar).
+        """
+        prices = np.asarray(purchase_prices, dtype=np.float64)
+        rates = custom_rates if custom_rates is not None else self._total_rate
+        return prices * rates
+
+    def estimate_monthly_tax_batch(
+        self,
+        purchase_prices: np.ndarray,
+        custom_rates: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        result = self.estimate_annual_tax_batch(purchase_prices, custom_rates)
+        result /= 12
+        return result
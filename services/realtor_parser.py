@@ -17,10 +17,28 @@ headless browser automation.
 """
 
 import re
-import json
-import requests
+import copy
+from typing import Dict, Optional, List, Iterable
+
 from bs4 import BeautifulSoup
-from typing import Dict, Optional
+
+from services import batch_parse
+from services.html_parsing import (
+    as_float,
+    as_int,
+    dig,
+    extract_next_data,
+    first_matches,
+    iter_json_ld,
+    json_ld_blobs,
+    json_ld_types,
+    make_soup,
+)
+from services.http_session import get_session
+from services.ttl_cache import TTLCache
+
+# Successful parse results, keyed by (parser version, url)
+_PARSE_CACHE = TTLCache(maxsize=1024, ttl=3600)
 
 
 class RealtorParser:
@@ -52,10 +70,52 @@ class RealtorParser:
         "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
     )
 
+    # Bump when extraction logic changes so cached results are not reused
+    PARSER_VERSION = 1
+
+    # Listing facts, fused into one alternation so the raw HTML is scanned
+    # once (see html_parsing.first_matches). Free-text captures (city/state/
+    # zip, property type) stay separate since they can swallow other fields.
+    FIELDS_PATTERN = re.compile(
+        r"(?=(?P<price>\$(?P<price_val>[\d,]+))"
+        r"|(?i:(?P<beds>(?P<beds_val>\d+)\s*beds?))"
+        r"|(?i:(?P<baths>(?P<baths_val>[\d\.]+)\s*bath))"
+        r"|(?i:(?P<lot_size>(?P<lot_size_val>[\d,]+)\s*sq\s*ft\s*lot))"
+        r"|(?i:(?P<sqft>(?P<sqft_val>[\d,]+)\s*sq\s*ft))"
+        r"|(?P<built_in>Built\s*in\s*(?P<built_in_val>\d{4}))"
+        r"|(?P<year_built>Year Built[:\s]+(?P<year_built_val>\d{4}))"
+        r"|(?i:(?P<num_units>(?P<num_units_val>\d+)[ -]?unit\b))"
+        r")"
+    )
+    # A lot-size match is also an "N sq ft" match at the same position
+    FIELD_ALIASES = {"lot_size": ("sqft",)}
+
+    JSON_LD_TYPES = frozenset({"SingleFamilyResidence", "Residence", "House"})
+
+    # Where the listing model lives inside __NEXT_DATA__
+    NEXT_DATA_PATH = ("props", "pageProps", "initialReduxState", "propertyDetails")
+
+    CITY_STATE_ZIP_PATTERN = re.compile(r",\s*([\w\s]+),\s*([A-Z]{2})\s*(\d{5})")
+    PROPERTY_TYPE_PATTERN = re.compile(r"Property Type[:\s]+([\w\s]+)<")
+    PLEX_PATTERN = re.compile(r"duplex|triplex|fourplex|quadruplex", re.IGNORECASE)
+
     def __init__(self, url: str):
         self.url = url
         self.html = None
-        self.soup = None
+        self._soup: Optional[BeautifulSoup] = None
+        self._fields: Optional[Dict[str, str]] = None
+        self._json_ld_cache: Optional[Dict] = None
+
+    @property
+    def soup(self) -> Optional[BeautifulSoup]:
+        """
+        BeautifulSoup tree, built on first access. JSON-LD, __NEXT_DATA__
+        and the regex fallbacks all read the raw HTML, so the tree is only
+        needed for the og:street-address fallback.
+        """
+        if self._soup is None and self.html:
+            self._soup = make_soup(self.html)
+        return self._soup
 
     # -------------------------------------------------------------
     # Fetch HTML
@@ -63,12 +123,14 @@ class RealtorParser:
 
     def fetch(self) -> bool:
         try:
-            r = requests.get(self.url, headers={"User-Agent": self.USER_AGENT}, timeout=10)
+            r = get_session().get(self.url, headers={"User-Agent": self.USER_AGENT}, timeout=10)
             if r.status_code != 200:
                 return False
 
             self.html = r.text
-            self.soup = BeautifulSoup(self.html, "html.parser")
+            self._soup = None
+            self._fields = None
+            self._json_ld_cache = None
             return True
         except:
             return False
@@ -80,19 +142,57 @@ class RealtorParser:
     def _extract_json_ld(self) -> Dict:
         """
         Realtor.com pages often contain JSON-LD card metadata.
+        Decoded once per fetched page and reused.
         """
-        scripts = self.soup.find_all("script", type="application/ld+json")
+        if self._json_ld_cache is None:
+            self._json_ld_cache = self._find_json_ld()
+        return self._json_ld_cache
 
-        for tag in scripts:
-            try:
-                data = json.loads(tag.string)
-                if isinstance(data, dict) and data.get("@type") in ["SingleFamilyResidence", "Residence", "House"]:
-                    return data
-            except:
-                continue
+    def _find_json_ld(self) -> Dict:
+        # Scanned straight from the HTML as plain strings, which every
+        # JSON decoder (orjson included) accepts
+        for obj in iter_json_ld(json_ld_blobs(self.html)):
+            if json_ld_types(obj) & self.JSON_LD_TYPES:
+                return obj
 
         return {}
 
+    def _extract_next_data(self) -> Dict:
+        """
+        Listing facts from the __NEXT_DATA__ page model, keyed like the
+        parse() output. Missing values are left out so the JSON-LD / HTML
+        fallbacks still run for them.
+        """
+        details = dig(extract_next_data(self.html), *self.NEXT_DATA_PATH)
+        if not isinstance(details, dict):
+            return {}
+
+        desc = details.get("description")
+        if not isinstance(desc, dict):
+            desc = {}
+
+        facts = {
+            "price": as_float(details.get("list_price")),
+            "beds": as_float(desc.get("beds")),
+            "baths": as_float(desc.get("baths")),
+            "sqft": as_int(desc.get("sqft")),
+            "lot_size": as_int(desc.get("lot_sqft")),
+            "year_built": as_int(desc.get("year_built")),
+            "property_type": desc.get("type") or None,
+        }
+        return {k: v for k, v in facts.items() if v is not None}
+
+    def _html_field(self, name: str) -> Optional[str]:
+        """
+        First raw-HTML value for `name`, from a single fused scan of the
+        page that is run on first use.
+        """
+        if self._fields is None:
+            self._fields = first_matches(
+                self.FIELDS_PATTERN, self.html or "", self.FIELD_ALIASES
+            )
+        return self._fields.get(name)
+
     # -------------------------------------------------------------
     # Field Extractors (with Fallbacks)
     # -------------------------------------------------------------
@@ -106,9 +206,9 @@ class RealtorParser:
                 return float(price)
 
         # fallback HTML search
-        m = re.search(r"\$([\d,]+)", self.html or "")
-        if m:
-            return float(m.group(1).replace(",", ""))
+        val = self._html_field("price")
+        if val:
+            return float(val.replace(",", ""))
 
         return None
 
@@ -124,10 +224,11 @@ class RealtorParser:
             if any(components):
                 return ", ".join([c for c in components if c])
 
-        # fallback meta tags
-        meta = self.soup.find("meta", property="og:street-address")
-        if meta:
-            return meta.get("content")
+        # fallback meta tags (builds the soup lazily)
+        if self.soup:
+            meta = self.soup.find("meta", property="og:street-address")
+            if meta:
+                return meta.get("content")
 
         return None
 
@@ -142,7 +243,7 @@ class RealtorParser:
             )
 
         # fallback attempt
-        m = re.search(r",\s*([\w\s]+),\s*([A-Z]{2})\s*(\d{5})", self.html or "")
+        m = self.CITY_STATE_ZIP_PATTERN.search(self.html or "")
         if m:
             return m.group(1), m.group(2), m.group(3)
 
@@ -152,9 +253,9 @@ class RealtorParser:
         if "numberOfRooms" in json_ld:
             return float(json_ld.get("numberOfRooms", 0))
 
-        m = re.search(r"(\d+)\s*beds?", self.html.lower())
-        if m:
-            return float(m.group(1))
+        val = self._html_field("beds")
+        if val:
+            return float(val)
 
         return None
 
@@ -162,9 +263,9 @@ class RealtorParser:
         if "numberOfBathroomsTotal" in json_ld:
             return float(json_ld.get("numberOfBathroomsTotal"))
 
-        m = re.search(r"([\d\.]+)\s*bath", self.html.lower())
-        if m:
-            return float(m.group(1))
+        val = self._html_field("baths")
+        if val:
+            return float(val)
 
         return None
 
@@ -174,9 +275,9 @@ class RealtorParser:
             if val:
                 return int(val)
 
-        m = re.search(r"([\d,]+)\s*sq\s*ft", self.html.lower())
-        if m:
-            return int(m.group(1).replace(",", ""))
+        val = self._html_field("sqft")
+        if val:
+            return int(val.replace(",", ""))
 
         return None
 
@@ -186,47 +287,46 @@ class RealtorParser:
             if val:
                 return int(val)
 
-        m = re.search(r"([\d,]+)\s*sq\s*ft\s*lot", self.html.lower())
-        if m:
-            return int(m.group(1).replace(",", ""))
+        val = self._html_field("lot_size")
+        if val:
+            return int(val.replace(",", ""))
 
         return None
 
     def _extract_year_built(self) -> Optional[int]:
-        m = re.search(r"Built\s*in\s*(\d{4})", self.html)
-        if m:
-            return int(m.group(1))
-
-        m = re.search(r"Year Built[:\s]+(\d{4})", self.html)
-        if m:
-            return int(m.group(1))
+        val = self._html_field("built_in") or self._html_field("year_built")
+        if val:
+            return int(val)
 
         return None
 
     def _extract_property_type(self, json_ld: Dict) -> Optional[str]:
-        if "@type" in json_ld:
-            return json_ld["@type"]
-
-        m = re.search(r"Property Type[:\s]+([\w\s]+)<", self.html)
+        kind = json_ld.get("@type")
+        if isinstance(kind, list):
+            # A multi-typed object: report the residence type it matched on
+            kind = next((k for k in kind if k in self.JSON_LD_TYPES), None)
+        if kind:
+            return kind
+
+        m = self.PROPERTY_TYPE_PATTERN.search(self.html)
         if m:
             return m.group(1).strip()
 
         return None
 
     def _extract_num_units(self) -> Optional[int]:
-        text = self.html.lower()
-
         # explicit identification
-        m = re.search(r"(\d+)[ -]?unit\b", text)
-        if m:
-            return int(m.group(1))
+        val = self._html_field("num_units")
+        if val:
+            return int(val)
 
-        # inference models
-        if "duplex" in text:
+        # inference models (one case-insensitive scan, no lowered copy)
+        found = {kw.lower() for kw in self.PLEX_PATTERN.findall(self.html)}
+        if "duplex" in found:
             return 2
-        if "triplex" in text:
+        if "triplex" in found:
             return 3
-        if "fourplex" in text or "quadruplex" in text:
+        if "fourplex" in found or "quadruplex" in found:
             return 4
 
         return None
@@ -236,15 +336,31 @@ class RealtorParser:
     # -------------------------------------------------------------
 
     def parse(self) -> Dict:
+        cache_key = (self.PARSER_VERSION, self.url)
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        result = self._parse_uncached()
+        if result.get("success"):
+            _PARSE_CACHE.set(cache_key, copy.deepcopy(result))
+        return result
+
+    def _parse_uncached(self) -> Dict:
         if not self.fetch():
             return {"success": False, "error": "Page fetch failed"}
 
         json_ld = self._extract_json_ld()
+        facts = self._extract_next_data()
 
         # Extract address components
         address_full = self._extract_address(json_ld)
         city, state, zipcode = self._extract_city_state_zip(json_ld)
 
+        def field(name, extract, *args):
+            # Structured page model first, regex ladder only if it is missing
+            return facts[name] if name in facts else extract(*args)
+
         return {
             "success": True,
             "source": "realtor",
@@ -252,12 +368,20 @@ class RealtorParser:
             "city": city,
             "state": state,
             "zip": zipcode,
-            "price": self._extract_price(json_ld),
-            "beds": self._extract_beds(json_ld),
-            "baths": self._extract_baths(json_ld),
-            "sqft": self._extract_sqft(json_ld),
-            "lot_size": self._extract_lot_size(json_ld),
-            "year_built": self._extract_year_built(),
-            "property_type": self._extract_property_type(json_ld),
+            "price": field("price", self._extract_price, json_ld),
+            "beds": field("beds", self._extract_beds, json_ld),
+            "baths": field("baths", self._extract_baths, json_ld),
+            "sqft": field("sqft", self._extract_sqft, json_ld),
+            "lot_size": field("lot_size", self._extract_lot_size, json_ld),
+            "year_built": field("year_built", self._extract_year_built),
+            "property_type": field("property_type", self._extract_property_type, json_ld),
             "num_units": self._extract_num_units(),
         }
+
+    @classmethod
+    def parse_many(cls, urls: Iterable[str], max_workers: int = 8) -> List[Dict]:
+        """
+        Parse several Realtor.com listings concurrently (see services/batch_parse.py).
+        Results are returned in the same order as `urls`.
+        """
+        return batch_parse.parse_many(cls, urls, max_workers=max_workers)
@@ -14,9 +14,27 @@ a proper proxy + browser-based automation tool is recommended.
 """
 
 import re
-import requests
-from bs4 import BeautifulSoup
-from typing import Optional, Dict
+import copy
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import Optional, Dict, List, Iterable
+
+from services import batch_parse
+from services.html_parsing import (
+    as_float,
+    as_int,
+    dig,
+    find_label_nodes,
+    iter_json_ld,
+    json_ld_blobs,
+    json_ld_types,
+    make_soup,
+)
+from services.http_session import get_session, host_slot
+from services.inflight import InFlight
+
+# Concurrent parse() calls for the same URL, sharing one fetch
+_IN_FLIGHT = InFlight()
 
 
 class RedfinParser:
@@ -42,15 +60,57 @@ class RedfinParser:
             }
     """
 
+    __slots__ = ("url", "html", "_soup", "_label_nodes", "_json_ld_cache")
+
     USER_AGENT = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
         "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     )
 
+    PRICE_PATTERN = re.compile(r"\$([\d,]+)")
+    DECIMAL_PATTERN = re.compile(r"([\d\.]+)")
+    INTEGER_PATTERN = re.compile(r"([\d,]+)")
+    YEAR_PATTERN = re.compile(r"(\d{4})")
+    UNIT_COUNT_PATTERN = re.compile(r"(\d+)[ -]?unit", re.IGNORECASE)
+    PLEX_PATTERN = re.compile(r"duplex|triplex|fourplex|quadruplex", re.IGNORECASE)
+
+    # Label text searched for in the page (case-insensitive substrings),
+    # in priority order per field
+    BEDS_LABELS = ("beds", "bed")
+    BATHS_LABELS = ("bath",)
+    SQFT_LABELS = ("sq. ft", "sqft", "sq ft")
+    LOT_SIZE_LABELS = ("lot size",)
+    YEAR_BUILT_LABELS = ("year built", "built")
+    PROPERTY_TYPE_LABELS = ("property type", "home type", "type")
+    ALL_LABELS = (
+        BEDS_LABELS + BATHS_LABELS + SQFT_LABELS + LOT_SIZE_LABELS
+        + YEAR_BUILT_LABELS + PROPERTY_TYPE_LABELS
+    )
+
+    # Only these tags (and their contents) are kept in the soup; the
+    # extractors never look at anything else
+    SOUP_STRAINER = SoupStrainer(["h1", "title", "span", "div", "li", "meta"])
+    ADDRESS_SELECTOR = sv.compile("div.address > h1")
+
+    # JSON-LD @types that describe the home itself
+    JSON_LD_HOME_TYPES = frozenset({"SingleFamilyResidence", "House", "Residence", "Apartment"})
+
     def __init__(self, url: str):
         self.url = url
         self.html = None
-        self.soup = None
+        self._soup: Optional[BeautifulSoup] = None
+        self._label_nodes = None
+        self._json_ld_cache: Optional[Dict] = None
+
+    @property
+    def soup(self) -> Optional[BeautifulSoup]:
+        """
+        BeautifulSoup tree, built on first access. Only needed for the
+        fields the page's JSON-LD does not carry.
+        """
+        if self._soup is None and self.html:
+            self._soup = make_soup(self.html, parse_only=self.SOUP_STRAINER)
+        return self._soup
 
     # -------------------------------------------------------------
     # Fetch & Parse HTML
@@ -58,31 +118,88 @@ class RedfinParser:
 
     def fetch(self) -> bool:
         try:
-            response = requests.get(self.url, headers={"User-Agent": self.USER_AGENT}, timeout=10)
-            if response.status_code != 200:
-                return False
-            self.html = response.text
-            self.soup = BeautifulSoup(self.html, "html.parser")
+            with host_slot(self.url):
+                response = get_session().get(self.url, headers={"User-Agent": self.USER_AGENT}, timeout=10)
+                if response.status_code != 200:
+                    return False
+                self.html = response.text
+            self._soup = None
+            self._label_nodes = None
+            self._json_ld_cache = None
             return True
         except:
             return False
 
+    # -------------------------------------------------------------
+    # JSON-LD (Primary Source)
+    # -------------------------------------------------------------
+
+    def _extract_json_ld(self) -> Dict:
+        """
+        Listing facts from the page's JSON-LD, keyed like the parse()
+        output. Missing values are left out so the HTML extractors still
+        run for them. Decoded once per fetched page and reused.
+        """
+        if self._json_ld_cache is None:
+            self._json_ld_cache = self._find_json_ld()
+        return self._json_ld_cache
+
+    def _find_json_ld(self) -> Dict:
+        home: Dict = {}
+        price = None
+
+        for obj in iter_json_ld(json_ld_blobs(self.html)):
+            offers = obj.get("offers")
+            if isinstance(offers, list):
+                offers = offers[0] if offers else None
+            if price is None and isinstance(offers, dict):
+                price = as_float(offers.get("price"))
+
+            if not home:
+                # The home is either the object itself or the listing's mainEntity
+                entity = obj.get("mainEntity")
+                if json_ld_types(obj) & self.JSON_LD_HOME_TYPES:
+                    home = obj
+                elif isinstance(entity, dict) and json_ld_types(entity) & self.JSON_LD_HOME_TYPES:
+                    home = entity
+
+        facts = {
+            "price": price,
+            "beds": as_float(home.get("numberOfBedrooms") or home.get("numberOfRooms")),
+            "baths": as_float(home.get("numberOfBathroomsTotal")),
+            "sqft": as_int(dig(home, "floorSize", "value")),
+            "lot_size": as_int(dig(home, "lotSize", "value")),
+            "year_built": as_int(home.get("yearBuilt")),
+        }
+
+        addr = home.get("address")
+        if isinstance(addr, dict) and addr.get("streetAddress"):
+            city = addr.get("addressLocality")
+            state = addr.get("addressRegion")
+            zipcode = addr.get("postalCode")
+            state_zip = " ".join(p for p in (state, zipcode) if p)
+            facts["address_full"] = ", ".join(
+                p for p in (addr["streetAddress"], city, state_zip) if p
+            )
+            facts["city"] = city
+            facts["state"] = state
+            facts["zip"] = zipcode
+
+        return {k: v for k, v in facts.items() if v is not None}
+
     # -------------------------------------------------------------
     # Extraction Helpers
     # -------------------------------------------------------------
 
     def _extract_price(self) -> Optional[float]:
-        patterns = [
-            r"\$([\d,]+)",  # $1,234,000
-        ]
-        for p in patterns:
-            match = re.search(p, self.html or "")
-            if match:
-                return float(match.group(1).replace(",", ""))
+        # $1,234,000
+        match = self.PRICE_PATTERN.search(self.html or "")
+        if match:
+            return float(match.group(1).replace(",", ""))
         return None
 
     def _extract_address(self) -> Optional[str]:
-        el = self.soup.select_one("div.address > h1")
+        el = self.ADDRESS_SELECTOR.select_one(self.soup)
         if el:
             return el.get_text(strip=True)
 
@@ -96,47 +213,47 @@ class RedfinParser:
         return None
 
     def _extract_beds(self) -> Optional[float]:
-        text = self._find_text(["Beds", "bed"])
+        text = self._find_text(self.BEDS_LABELS)
         if text:
-            match = re.search(r"([\d\.]+)", text)
+            match = self.DECIMAL_PATTERN.search(text)
             if match:
                 return float(match.group(1))
         return None
 
     def _extract_baths(self) -> Optional[float]:
-        text = self._find_text(["Bath", "bath"])
+        text = self._find_text(self.BATHS_LABELS)
         if text:
-            match = re.search(r"([\d\.]+)", text)
+            match = self.DECIMAL_PATTERN.search(text)
             if match:
                 return float(match.group(1))
         return None
 
     def _extract_sqft(self) -> Optional[int]:
-        text = self._find_text(["Sq. Ft", "sqft", "Sq Ft"])
+        text = self._find_text(self.SQFT_LABELS)
         if text:
-            m = re.search(r"([\d,]+)", text)
+            m = self.INTEGER_PATTERN.search(text)
             if m:
                 return int(m.group(1).replace(",", ""))
         return None
 
     def _extract_lot_size(self) -> Optional[int]:
-        text = self._find_text(["Lot Size", "lot size"])
+        text = self._find_text(self.LOT_SIZE_LABELS)
         if text:
-            m = re.search(r"([\d,]+)", text)
+            m = self.INTEGER_PATTERN.search(text)
             if m:
                 return int(m.group(1).replace(",", ""))
         return None
 
     def _extract_year_built(self) -> Optional[int]:
-        text = self._find_text(["Year Built", "Built"])
+        text = self._find_text(self.YEAR_BUILT_LABELS)
         if text:
-            m = re.search(r"(\d{4})", text)
+            m = self.YEAR_PATTERN.search(text)
             if m:
                 return int(m.group(1))
         return None
 
     def _extract_property_type(self) -> Optional[str]:
-        text = self._find_text(["Property Type", "Home Type", "Type"])
+        text = self._find_text(self.PROPERTY_TYPE_LABELS)
         if text:
             return text.strip()
         return None
@@ -146,16 +263,17 @@ class RedfinParser:
         Redfin rarely shows unit count directly — this tries to infer from description.
         """
         text = self.html or ""
-        m = re.search(r"(\d+)[ -]?unit", text.lower())
+        m = self.UNIT_COUNT_PATTERN.search(text)
         if m:
             return int(m.group(1))
 
-        # fallback: property type hints
-        if "duplex" in text.lower():
+        # fallback: property type hints (one case-insensitive scan, no lowered copy)
+        found = {kw.lower() for kw in self.PLEX_PATTERN.findall(text)}
+        if "duplex" in found:
             return 2
-        if "triplex" in text.lower():
+        if "triplex" in found:
             return 3
-        if "fourplex" in text.lower() or "quadruplex" in text.lower():
+        if "fourplex" in found or "quadruplex" in found:
             return 4
 
         return None
@@ -164,9 +282,13 @@ class RedfinParser:
     # Utility for scanning common Redfin fields
     # -------------------------------------------------------------
 
-    def _find_text(self, keywords):
-        for key in keywords:
-            el = self.soup.find(text=re.compile(key, re.IGNORECASE))
+    def _find_text(self, labels):
+        # Every label is located in one walk over the page, on first use
+        if self._label_nodes is None:
+            self._label_nodes = find_label_nodes(self.soup, self.ALL_LABELS)
+
+        for label in labels:
+            el = self._label_nodes.get(label)
             if el:
                 return el.parent.get_text(" ", strip=True)
         return None
@@ -176,38 +298,70 @@ class RedfinParser:
     # -------------------------------------------------------------
 
     def parse(self) -> Dict:
+        # Callers share one result object, so each gets its own copy
+        return copy.deepcopy(_IN_FLIGHT.run(self.url, self._parse_uncached))
+
+    def _parse_uncached(self) -> Dict:
         if not self.fetch():
             return {
                 "success": False,
                 "error": "Could not fetch Redfin page"
             }
 
-        # address parsing
-        full_address = self._extract_address() or ""
-
-        # attempt city / state / zip split
-        city, state, zipcode = None, None, None
-        parts = full_address.split(",")
-        if len(parts) >= 3:
-            city = parts[-3].strip()
-            state_zip = parts[-2].strip().split(" ")
-            if len(state_zip) >= 2:
-                state = state_zip[0]
-                zipcode = state_zip[1]
-
-        return {
+        facts = self._extract_json_ld()
+
+        if "address_full" in facts:
+            full_address = facts["address_full"]
+            city, state, zipcode = facts.get("city"), facts.get("state"), facts.get("zip")
+        else:
+            # address parsing
+            full_address = self._extract_address() or ""
+
+            # attempt city / state / zip split
+            city, state, zipcode = None, None, None
+            parts = full_address.split(",")
+            if len(parts) >= 3:
+                city = parts[-3].strip()
+                state_zip = parts[-2].strip().split(" ")
+                if len(state_zip) >= 2:
+                    state = state_zip[0]
+                    zipcode = state_zip[1]
+
+        def field(name, extract):
+            # JSON-LD first; the soup / regex extractors only if it is missing
+            return facts[name] if name in facts else extract()
+
+        result = {
             "success": True,
             "source": "redfin",
             "address_full": full_address,
             "city": city,
             "state": state,
             "zip": zipcode,
-            "price": self._extract_price(),
-            "beds": self._extract_beds(),
-            "baths": self._extract_baths(),
-            "sqft": self._extract_sqft(),
-            "lot_size": self._extract_lot_size(),
-            "year_built": self._extract_year_built(),
+            "price": field("price", self._extract_price),
+            "beds": field("beds", self._extract_beds),
+            "baths": field("baths", self._extract_baths),
+            "sqft": field("sqft", self._extract_sqft),
+            "lot_size": field("lot_size", self._extract_lot_size),
+            "year_built": field("year_built", self._extract_year_built),
             "property_type": self._extract_property_type(),
             "num_units": self._extract_num_units()
         }
+        self._release_page()
+        return result
+
+    def _release_page(self) -> None:
+        # Every field is extracted; drop the page and its tree so a batch
+        # does not keep each listing's HTML alive as long as its parser
+        self.html = None
+        self._soup = None
+        self._label_nodes = None
+        self._json_ld_cache = None
+
+    @classmethod
+    def parse_many(cls, urls: Iterable[str], max_workers: int = 8) -> List[Dict]:
+        """
+        Parse several Redfin listings concurrently (see services/batch_parse.py).
+        Results are returned in the same order as `urls`.
+        """
+        return batch_parse.parse_many(cls, urls, max_workers=max_workers)
@@ -1,16 +1,70 @@
 import re
-import requests
-from bs4 import BeautifulSoup
+import copy
+import soupsieve as sv
+from bs4 import SoupStrainer
+from typing import Dict, List, Iterable, Optional, Tuple
+
+from services import batch_parse
+from services.html_parsing import (
+    HAS_LXML,
+    as_float,
+    NEXT_DATA_PATTERN,
+    dig,
+    iter_json_ld,
+    json_ld_blobs,
+    json_ld_types,
+    loads_dict,
+    make_soup,
+)
+from services.http_session import get_session, host_slot
+from services.inflight import InFlight
+
+if HAS_LXML:
+    from lxml import etree  # type: ignore
+
+# Concurrent extract() calls for the same URL, sharing one fetch
+_IN_FLIGHT = InFlight()
 
 class ZillowParser:
     """
     Extracts structured property data from a Zillow link.
     """
-    
+
+    __slots__ = ("url", "html", "soup", "_targets")
+
+    # Every field is read from a data-testid tagged span/h1/li, so the
+    # soup is limited to those tags
+    SOUP_STRAINER = SoupStrainer(["span", "h1", "li"], attrs={"data-testid": True})
+    # Every candidate target node in one (precompiled) selector pass
+    TARGET_NODES_SELECTOR = sv.compile("span[data-testid], h1[data-testid], li[data-testid]")
+
+    # (tag, data-testid) of the nodes the extractors read
+    PRICE_TARGET = ("span", "price")
+    ADDRESS_TARGET = ("h1", "detail-address")
+    FACT_ITEM_TARGET = ("li", "bed-bath-item")
+    # Structured-data script blocks, captured alongside them when streaming
+    NEXT_DATA_TARGET = ("script", "__NEXT_DATA__")
+    JSON_LD_TARGET = ("script", "application/ld+json")
+    TARGETS = (PRICE_TARGET, ADDRESS_TARGET, FACT_ITEM_TARGET, NEXT_DATA_TARGET, JSON_LD_TARGET)
+
+    # __NEXT_DATA__ keeps the listing in a JSON-encoded cache whose entries
+    # each wrap a "property" object
+    NEXT_DATA_CACHE_PATH = ("props", "pageProps", "componentProps", "gdpClientCache")
+    # JSON-LD @types that describe the home itself
+    JSON_LD_HOME_TYPES = frozenset({"SingleFamilyResidence", "House", "Residence", "Apartment"})
+    DETAIL_KEYS = ("beds", "baths", "sqft", "lot_sqft")
+
+    # Streamed response bodies are fed to lxml in chunks of this many bytes
+    STREAM_CHUNK_SIZE = 65536
+    # Text under these tags is not part of BeautifulSoup's .text
+    NON_TEXT_TAGS = frozenset(("script", "style", "template"))
+
     def __init__(self, url: str):
         self.url = url
         self.html = None
         self.soup = None
+        # Text of every target node, per target, collected once per page
+        self._targets: Optional[Dict[Tuple[str, str], List[str]]] = None
     
     def fetch_html(self):
         headers = {
@@ -18,22 +72,201 @@ class ZillowParser:
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
             "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         }
-        r = requests.get(self.url, headers=headers)
-        r.raise_for_status()
-        self.html = r.text
-        self.soup = BeautifulSoup(self.html, "html.parser")
+        # With lxml the body is parsed as it downloads and only the target
+        # nodes' text is kept; neither the page string nor a DOM is held
+        with host_slot(self.url):
+            r = get_session().get(self.url, headers=headers, timeout=10, stream=HAS_LXML)
+            try:
+                r.raise_for_status()
+                if HAS_LXML:
+                    self._targets = self._stream_targets(r)
+                    return
+                self.html = r.text
+            finally:
+                r.close()
+
+        self.soup = make_soup(self.html, parse_only=self.SOUP_STRAINER)
+        self._targets = self._index_soup_targets()
+
+    def _index_soup_targets(self) -> Dict[Tuple[str, str], List[str]]:
+        """
+        The soup equivalent of _stream_targets: one selector pass buckets
+        the tagged nodes, and the script blocks are read from the raw HTML
+        (the strained soup does not keep them).
+        """
+        found: Dict[Tuple[str, str], List[str]] = {t: [] for t in self.TARGETS}
+        for el in self.TARGET_NODES_SELECTOR.select(self.soup):
+            slots = found.get((el.name, el.get("data-testid")))
+            if slots is not None:
+                slots.append(el.text)
+
+        m = NEXT_DATA_PATTERN.search(self.html or "")
+        if m:
+            found[self.NEXT_DATA_TARGET].append(m.group(1))
+        found[self.JSON_LD_TARGET].extend(json_ld_blobs(self.html))
+        return found
+
+    def _stream_targets(self, response) -> Dict[Tuple[str, str], List[str]]:
+        """
+        Pull-parse the response body and return the text of every target
+        node, per target, in document order.
+        """
+        found: Dict[Tuple[str, str], List[Optional[str]]] = {t: [] for t in self.TARGETS}
+        # Target nodes still open, mapped to their slot in `found`; slots
+        # are reserved on open so nested matches keep document order
+        open_targets = {}
+        parser = etree.HTMLPullParser(events=("start", "end"), encoding=response.encoding)
+
+        def drain():
+            for event, elem in parser.read_events():
+                if event == "start":
+                    slots = found.get(self._target_key(elem))
+                    if slots is not None:
+                        open_targets[elem] = (slots, len(slots))
+                        slots.append(None)
+                    continue
+
+                hit = open_targets.pop(elem, None)
+                if hit is not None:
+                    slots, i = hit
+                    slots[i] = self._visible_text(elem)
+
+                # Nothing open still needs this subtree: drop it, and any
+                # finished siblings before it, to keep memory flat
+                if not open_targets:
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+
+        for chunk in response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE):
+            parser.feed(chunk)
+            drain()
+        parser.close()
+        drain()
+
+        return found
+
+    @classmethod
+    def _target_key(cls, elem) -> Tuple[str, Optional[str]]:
+        if elem.tag == "script":
+            if elem.get("id") == "__NEXT_DATA__":
+                return cls.NEXT_DATA_TARGET
+            return ("script", (elem.get("type") or "").lower())
+        return (elem.tag, elem.get("data-testid"))
+
+    @classmethod
+    def _visible_text(cls, elem) -> str:
+        """
+        Text of an lxml element the way BeautifulSoup's .text reads it:
+        comments and script/style contents are skipped.
+        """
+        parts = [elem.text or ""]
+        for child in elem:
+            if isinstance(child.tag, str) and child.tag not in cls.NON_TEXT_TAGS:
+                parts.append(cls._visible_text(child))
+            parts.append(child.tail or "")
+        return "".join(parts)
+
+    def _node_texts(self, target: Tuple[str, str]) -> List[str]:
+        """
+        .text of every node matching `target`, in document order.
+        """
+        return self._targets[target]
+
+    # -------------------------------------------------------------
+    # Structured data (__NEXT_DATA__ / JSON-LD)
+    # -------------------------------------------------------------
+
+    def _next_data(self) -> Dict:
+        blobs = self._node_texts(self.NEXT_DATA_TARGET)
+        return loads_dict(blobs[0]) if blobs else {}
+
+    def _next_data_property(self) -> Dict:
+        """
+        The listing object the page renders from, or {} if absent.
+        """
+        cache = dig(self._next_data(), *self.NEXT_DATA_CACHE_PATH)
+        if isinstance(cache, str):
+            cache = loads_dict(cache)
+        if not isinstance(cache, dict):
+            return {}
+
+        for entry in cache.values():
+            prop = entry.get("property") if isinstance(entry, dict) else None
+            if isinstance(prop, dict):
+                return prop
+        return {}
+
+    def _json_ld_home(self) -> Dict:
+        """
+        The first JSON-LD object describing the home, or {} if absent.
+        """
+        for obj in iter_json_ld(self._node_texts(self.JSON_LD_TARGET)):
+            if json_ld_types(obj) & self.JSON_LD_HOME_TYPES:
+                return obj
+        return {}
+
+    def _structured_facts(self) -> Dict:
+        """
+        Price, address and details from __NEXT_DATA__, then JSON-LD, in the
+        same string form the HTML extractors return. Missing values are left
+        out so the HTML extractors still run for them.
+        """
+        prop = self._next_data_property()
+        home = self._json_ld_home()
+        prop_addr = prop.get("address") if isinstance(prop.get("address"), dict) else {}
+        home_addr = home.get("address") if isinstance(home.get("address"), dict) else {}
+
+        candidates = {
+            "price": (prop.get("price"),),
+            "beds": (prop.get("bedrooms"), home.get("numberOfRooms")),
+            "baths": (prop.get("bathrooms"), home.get("numberOfBathroomsTotal")),
+            "sqft": (prop.get("livingArea"), dig(home, "floorSize", "value")),
+            "lot_sqft": (prop.get("lotSize"),),
+        }
+        facts = {}
+        for key, values in candidates.items():
+            for value in values:
+                text = self._number_text(value)
+                if text is not None:
+                    facts[key] = text
+                    break
+
+        address = (
+            self._format_address(prop_addr.get("streetAddress"), prop_addr.get("city"),
+                                 prop_addr.get("state"), prop_addr.get("zipcode"))
+            or self._format_address(home_addr.get("streetAddress"), home_addr.get("addressLocality"),
+                                    home_addr.get("addressRegion"), home_addr.get("postalCode"))
+        )
+        if address:
+            facts["address"] = address
+
+        return facts
+
+    @staticmethod
+    def _number_text(value) -> Optional[str]:
+        number = as_float(value)
+        if number is None:
+            return None
+        return str(int(number)) if number.is_integer() else str(number)
+
+    @staticmethod
+    def _format_address(street, city, state, zipcode) -> Optional[str]:
+        if not street:
+            return None
+        state_zip = " ".join(p for p in (state, zipcode) if p)
+        return ", ".join(p for p in (street, city, state_zip) if p)
     
     def extract_price(self):
         try:
-            price_tag = self.soup.find("span", {"data-testid": "price"})
-            return price_tag.text.strip().replace("$", "").replace(",", "")
+            price_text = self._node_texts(self.PRICE_TARGET)[0]
+            return price_text.strip().replace("$", "").replace(",", "")
         except:
             return None
     
     def extract_address(self):
         try:
-            tag = self.soup.find("h1", {"data-testid": "detail-address"})
-            return tag.text.strip()
+            return self._node_texts(self.ADDRESS_TARGET)[0].strip()
         except:
             return None
     
@@ -47,9 +280,8 @@ class ZillowParser:
         """
         details = {"beds": None, "baths": None, "sqft": None, "lot_sqft": None}
         try:
-            fact_items = self.soup.find_all("li", {"data-testid": "bed-bath-item"})
-            for item in fact_items:
-                txt = item.text.lower()
+            for item_text in self._node_texts(self.FACT_ITEM_TARGET):
+                txt = item_text.lower()
                 if "bd" in txt:
                     details["beds"] = re.findall(r'\d+', txt)[0]
                 if "ba" in txt:
@@ -61,11 +293,41 @@ class ZillowParser:
             return details
     
     def extract(self):
+        # Callers share one result object, so each gets its own copy
+        return copy.deepcopy(_IN_FLIGHT.run(self.url, self._extract_uncached))
+
+    def _extract_uncached(self):
         self.fetch_html()
-        return {
+        # Structured page data first; HTML scraping only fills what it lacks
+        facts = self._structured_facts()
+
+        details = {key: facts.get(key) for key in self.DETAIL_KEYS}
+        if None in details.values():
+            scraped = self.extract_property_details()
+            details = {key: details[key] or scraped[key] for key in self.DETAIL_KEYS}
+
+        result = {
             "source": "zillow",
             "url": self.url,
-            "price": self.extract_price(),
-            "address": self.extract_address(),
-            "details": self.extract_property_details()
+            "price": facts.get("price") or self.extract_price(),
+            "address": facts.get("address") or self.extract_address(),
+            "details": details
         }
+        self._release_page()
+        return result
+
+    def _release_page(self) -> None:
+        # Every field is extracted; drop the page, soup and captured script
+        # blocks so a batch does not keep them alive as long as the parser
+        self.html = None
+        self.soup = None
+        self._targets = None
+
+    @classmethod
+    def extract_many(cls, urls: Iterable[str], max_workers: int = 8) -> List[Dict]:
+        """
+        Extract several Zillow listings concurrently (see services/batch_parse.py).
+        Results are returned in the same order as `urls`; a listing that
+        fails to fetch comes back as {"success": False, "error": ...}.
+        """
+        return batch_parse.parse_many(cls, urls, max_workers=max_workers, method="extract")
@@ -14,7 +14,11 @@ Goals:
 """
 
 import re
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Optional, Dict, Iterable, List, Tuple
+
+# Distinct raw addresses whose parsed components are kept in memory
+NORMALIZE_CACHE_SIZE = 4096
 
 
 class AddressNormalizer:
@@ -35,6 +39,8 @@ class AddressNormalizer:
         }
     """
 
+    __slots__ = ()
+
     # Common USPS-style abbreviations
     STREET_SUFFIXES = {
         "STREET": "St",
@@ -79,6 +85,10 @@ class AddressNormalizer:
         "SW": "SW",
     }
 
+    # Directional and suffix keys do not overlap, so one merged table
+    # serves both lookups for each street token
+    TOKEN_MAP = {**STREET_SUFFIXES, **DIRECTIONALS}
+
     ADDRESS_PATTERN = re.compile(
         r"""
         ^\s*
@@ -94,6 +104,8 @@ class AddressNormalizer:
         re.VERBOSE,
     )
 
+    RESULT_KEYS = ("raw", "street", "city", "state", "zip", "normalized_full")
+
     def normalize(self, raw_address: str) -> Dict:
         """
         Main normalization entry point.
@@ -118,77 +130,98 @@ class AddressNormalizer:
                 "normalized_full": None,
             }
 
-        raw = raw_address.strip()
-        match = self.ADDRESS_PATTERN.match(raw)
+        # Normalization is pure, so the same address seen again across the
+        # pipeline (listing, APN lookup, jurisdiction check) is a cache hit
+        return dict(zip(self.RESULT_KEYS, _normalize_cached(raw_address.strip())))
 
-        if not match:
-            # If we cannot parse, return raw as normalized_full
-            return {
-                "raw": raw,
-                "street": raw,
-                "city": None,
-                "state": None,
-                "zip": None,
-                "normalized_full": raw,
-            }
+    def normalize_many(self, raw_addresses: Iterable[str]) -> List[Dict]:
+        """
+        normalize() for a batch of addresses, in input order. Repeated
+        addresses within (or across) batches are parsed only once.
+        """
+        return [self.normalize(raw) for raw in raw_addresses]
 
-        street_raw = match.group("street")
-        city_raw = match.group("city")
-        state_raw = match.group("state")
-        zip_raw = match.group("zip")
+    @classmethod
+    def _parse(cls, raw: str) -> Tuple[Optional[str], ...]:
+        """
+        Parse a stripped, non-empty address into a tuple ordered like
+        RESULT_KEYS.
+        """
+        parts = cls._split_well_formed(raw)
+        if parts is None:
+            match = cls.ADDRESS_PATTERN.match(raw)
 
-        street_norm = self._normalize_street(street_raw)
-        city_norm = self._normalize_city(city_raw)
+            if not match:
+                # If we cannot parse, return raw as normalized_full
+                return (raw, raw, None, None, None, raw)
+
+            parts = match.group("street", "city", "state", "zip")
+
+        street_raw, city_raw, state_raw, zip_raw = parts
+
+        street_norm = cls._normalize_street(street_raw)
+        city_norm = cls._normalize_city(city_raw)
         state_norm = state_raw.upper()
         zip_norm = zip_raw
 
         normalized_full = f"{street_norm}, {city_norm}, {state_norm} {zip_norm}"
 
-        return {
-            "raw": raw,
-            "street": street_norm,
-            "city": city_norm,
-            "state": state_norm,
-            "zip": zip_norm,
-            "normalized_full": normalized_full,
-        }
+        return (raw, street_norm, city_norm, state_norm, zip_norm, normalized_full)
+
+    @staticmethod
+    def _split_well_formed(raw: str) -> Optional[Tuple[str, str, str, str]]:
+        """
+        Fast path for the common clean shape "street, city, ST 12345":
+        plain string splitting yields exactly what ADDRESS_PATTERN would
+        capture. Returns None for anything else so the regex decides.
+        """
+        parts = raw.split(",")
+        if len(parts) != 3:
+            return None
+
+        street = parts[0].rstrip()
+        city = parts[1].strip()
+        state_zip = parts[2].split()
+        if not street or not city or "\n" in street or len(state_zip) != 2:
+            return None
+
+        state, zipcode = state_zip
+        if not (len(state) == 2 and state.isascii() and state.isalpha()):
+            return None
+        if not (len(zipcode) == 5 and zipcode.isdecimal()):
+            return None
+        if not all(c.isalnum() or c in "_." or c.isspace() for c in city):
+            return None
+
+        return street, city, state, zipcode
 
     # ---------------------------------------------------------
     # Component normalizers
     # ---------------------------------------------------------
 
-    def _normalize_city(self, city: str) -> str:
+    @classmethod
+    def _normalize_city(cls, city: str) -> str:
         """
         Title-case the city (e.g., 'los angeles' -> 'Los Angeles').
         """
         return city.strip().title()
 
-    def _normalize_street(self, street: str) -> str:
+    @classmethod
+    def _normalize_street(cls, street: str) -> str:
         """
         Normalize directional prefixes/suffixes and street suffixes.
         Example:
             "1234 West Adams Boulevard" -> "1234 W Adams Blvd"
         """
-        tokens = street.strip().split()
-        if not tokens:
-            return street.strip()
-
-        # First token might be house number, keep as-is
-        normalized_tokens = []
-
-        for i, token in enumerate(tokens):
-            upper = token.upper().strip(",")
-            # Directionals (handle both prefix and suffix)
-            if upper in self.DIRECTIONALS:
-                normalized_tokens.append(self.DIRECTIONALS[upper])
-                continue
-
-            # Street suffixes
-            if upper in self.STREET_SUFFIXES:
-                normalized_tokens.append(self.STREET_SUFFIXES[upper])
-                continue
-
-            # Otherwise keep original casing, but strip commas
-            normalized_tokens.append(token.strip(","))
-
-        return " ".join(normalized_tokens)
+        token_map = cls.TOKEN_MAP
+        # Directionals (prefix or suffix) and street suffixes are abbreviated;
+        # anything else (house number, street name) keeps its casing, minus commas
+        return " ".join(
+            token_map.get(token.upper().strip(","), token.strip(","))
+            for token in street.split()
+        )
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize_cached(raw: str) -> Tuple[Optional[str], ...]:
+    return AddressNormalizer._parse(raw)
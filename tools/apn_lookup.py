@@ -33,6 +33,8 @@ import re
 from typing import Optional, Dict
 from bs4 import BeautifulSoup
 
+from services.html_parsing import find_label_nodes
+
 
 class APNLookup:
     """
@@ -51,9 +53,25 @@ class APNLookup:
 
     """
 
+    __slots__ = ()
+
     # LA County APN is 10 digits (3 segments: xxxx-xxx-xxx)
     APN_PATTERN = re.compile(r"^(\d{4})[- ]?(\d{3})[- ]?(\d{3})$")
 
+    # Assessor page labels (case-insensitive substrings)
+    USE_CODE_LABEL = "use code"
+    LOT_SIZE_LABEL = "lot size"
+    YEAR_BUILT_LABEL = "year built"
+    SQUARE_FEET_LABEL = "square feet"
+    ASSESSED_VALUE_LABEL = "assessed value"
+    UNITS_LABEL = "units"
+    ASSESSOR_LABELS = (
+        USE_CODE_LABEL, LOT_SIZE_LABEL, YEAR_BUILT_LABEL,
+        SQUARE_FEET_LABEL, ASSESSED_VALUE_LABEL, UNITS_LABEL,
+    )
+
+    NON_DIGIT_PATTERN = re.compile(r"[^\d]")
+
     # -----------------------------------------------------------
     # APN Normalization
     # -----------------------------------------------------------
@@ -61,6 +79,15 @@ class APNLookup:
     def normalize(self, raw_apn: str) -> Dict:
         raw = raw_apn.strip()
 
+        # Already-normalized input (the common case) skips the regex
+        if len(raw) == 10 and raw.isdecimal():
+            return {
+                "raw": raw,
+                "normalized": raw,
+                "pretty": f"{raw[:4]}-{raw[4:7]}-{raw[7:]}",
+                "valid_format": True
+            }
+
         m = self.APN_PATTERN.match(raw)
         if not m:
             return {
@@ -93,9 +120,11 @@ class APNLookup:
         This extractor attempts to read common fields.
         """
         soup = BeautifulSoup(html_text, "html.parser")
+        # One walk over the page finds every label
+        label_nodes = find_label_nodes(soup, self.ASSESSOR_LABELS)
 
         def extract_text(label):
-            el = soup.find(text=re.compile(label, re.IGNORECASE))
+            el = label_nodes.get(label)
             if not el:
                 return None
             parent = el.parent
@@ -103,18 +132,18 @@ class APNLookup:
                 return parent.find_next("span").get_text(strip=True)
             return None
 
-        land_use = extract_text("Use Code")
-        lot_size = extract_text("Lot Size")
-        year_built = extract_text("Year Built")
-        building_sqft = extract_text("Square Feet")
-        assessed_total = extract_text("Assessed Value")
-        units = extract_text("Units")
+        land_use = extract_text(self.USE_CODE_LABEL)
+        lot_size = extract_text(self.LOT_SIZE_LABEL)
+        year_built = extract_text(self.YEAR_BUILT_LABEL)
+        building_sqft = extract_text(self.SQUARE_FEET_LABEL)
+        assessed_total = extract_text(self.ASSESSED_VALUE_LABEL)
+        units = extract_text(self.UNITS_LABEL)
 
         # Numeric conversions
         def clean_num(val):
             if not val:
                 return None
-            return int(re.sub(r"[^\d]", "", val))
+            return int(self.NON_DIGIT_PATTERN.sub("", val))
 
         return {
             "land_use_code": land_use,
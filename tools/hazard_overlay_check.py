@@ -12,7 +12,56 @@ For now, it returns a clean placeholder structure that your
 analysis and reports can depend on without breaking.
 """
 
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# Flood, fault and fire layers are spatially coherent, so lookups are cached
+# per coordinate tile: 3 decimal places is roughly a 110 m square, and
+# neighbouring parcels in a batch share one lookup per layer
+TILE_PRECISION = 3
+HAZARD_CACHE_SIZE = 10000
+
+Tile = Optional[Tuple[float, float]]
+
+
+def _tile_key(lat: Optional[float], lng: Optional[float]) -> Tile:
+    if lat is None or lng is None:
+        return None
+    return (round(lat, TILE_PRECISION), round(lng, TILE_PRECISION))
+
+
+@lru_cache(maxsize=HAZARD_CACHE_SIZE)
+def _flood_zone(tile: Tile) -> Dict:
+    """
+    Placeholder for FEMA flood zone lookup.
+    """
+    return {
+        "source": "FEMA",
+        "zone": "UNKNOWN",        # e.g., X, AE, AO, etc.
+        "is_high_risk": None      # True / False when implemented
+    }
+
+
+@lru_cache(maxsize=HAZARD_CACHE_SIZE)
+def _earthquake_fault(tile: Tile) -> Dict:
+    """
+    Placeholder for USGS earthquake fault/rupture zone.
+    """
+    return {
+        "source": "USGS",
+        "within_fault_zone": None  # True / False when implemented
+    }
+
+
+@lru_cache(maxsize=HAZARD_CACHE_SIZE)
+def _fire(tile: Tile) -> Dict:
+    """
+    Placeholder for CAL FIRE Very High Fire Hazard Severity Zone.
+    """
+    return {
+        "source": "CAL_FIRE",
+        "within_high_fire_hazard_area": None  # True / False when implemented
+    }
 
 
 class HazardOverlayChecker:
@@ -21,40 +70,35 @@ class HazardOverlayChecker:
     a summary of key environmental/hazard risk flags.
 
     In the future, you can plug in real API calls or GIS lookups
-    where the placeholder logic currently lives.
+    where the placeholder logic currently lives (the module-level
+    _flood_zone / _earthquake_fault / _fire functions).
     """
 
+    __slots__ = ("lat", "lng", "_tile")
+
     def __init__(self, lat: Optional[float], lng: Optional[float]):
         self.lat = lat
         self.lng = lng
+        self._tile = _tile_key(lat, lng)
 
     def check_flood_zone(self) -> Dict:
         """
-        Placeholder for FEMA flood zone lookup.
+        FEMA flood zone for this location's tile.
         """
-        return {
-            "source": "FEMA",
-            "zone": "UNKNOWN",        # e.g., X, AE, AO, etc.
-            "is_high_risk": None      # True / False when implemented
-        }
+        # Copies, so callers cannot mutate the cached entry
+        return dict(_flood_zone(self._tile))
 
     def check_earthquake_fault(self) -> Dict:
         """
-        Placeholder for USGS earthquake fault/rupture zone.
+        USGS earthquake fault/rupture zone for this location's tile.
         """
-        return {
-            "source": "USGS",
-            "within_fault_zone": None  # True / False when implemented
-        }
+        return dict(_earthquake_fault(self._tile))
 
     def check_fire(self) -> Dict:
         """
-        Placeholder for CAL FIRE Very High Fire Hazard Severity Zone.
+        CAL FIRE Very High Fire Hazard Severity Zone for this location's tile.
         """
-        return {
-            "source": "CAL_FIRE",
-            "within_high_fire_hazard_area": None  # True / False when implemented
-        }
+        return dict(_fire(self._tile))
 
     def summary(self) -> Dict:
         """
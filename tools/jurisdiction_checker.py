@@ -16,7 +16,8 @@ confirmation, verify with:
 - Local city planning departments
 """
 
-from typing import Optional, Dict
+import re
+from typing import Optional, Dict, Pattern
 
 
 class JurisdictionChecker:
@@ -32,6 +33,8 @@ class JurisdictionChecker:
         - reason: explanation of classification
     """
 
+    __slots__ = ("raw_address", "label", "parcel", "_combined")
+
     LA_CITY_KEYWORDS = [
         "los angeles", "los ángeles", "city of los angeles",
         "la city", "city of la"
@@ -43,6 +46,10 @@ class JurisdictionChecker:
         "unincorporated"
     ]
 
+    # Each keyword list as one alternation, so a check is a single scan
+    LA_CITY_PATTERN = re.compile("|".join(map(re.escape, LA_CITY_KEYWORDS)))
+    LA_COUNTY_PATTERN = re.compile("|".join(map(re.escape, LA_COUNTY_KEYWORDS)))
+
     def __init__(
         self,
         raw_address: Optional[str] = None,
@@ -52,16 +59,16 @@ class JurisdictionChecker:
         self.raw_address = (raw_address or "").lower()
         self.label = (geocoder_label or "").lower()
         self.parcel = (parcel_jurisdiction or "").lower()
+        # Sources are already lowercased; joined once for every keyword check
+        self._combined = " ".join((self.raw_address, self.label, self.parcel))
 
     # ---------------------------------------------------------
     # Helper Methods
     # ---------------------------------------------------------
 
-    def _contains(self, keywords):
-        """Check if any keyword appears in the known text sources."""
-        text_sources = [self.raw_address, self.label, self.parcel]
-        combined = " ".join(text_sources).lower()
-        return any(k in combined for k in keywords)
+    def _contains(self, pattern: Pattern) -> bool:
+        """Check if any keyword of `pattern` appears in the known text sources."""
+        return pattern.search(self._combined) is not None
 
     def _extract_city_from_label(self) -> Optional[str]:
         """
@@ -92,7 +99,7 @@ class JurisdictionChecker:
         """
 
         # 1. Check for City of LA
-        if self._contains(self.LA_CITY_KEYWORDS):
+        if self._contains(self.LA_CITY_PATTERN):
             return {
                 "jurisdiction": "LA City",
                 "city_name": "Los Angeles",
@@ -100,7 +107,7 @@ class JurisdictionChecker:
             }
 
         # 2. Check for unincorporated LA County
-        if self._contains(self.LA_COUNTY_KEYWORDS):
+        if self._contains(self.LA_COUNTY_PATTERN):
             return {
                 "jurisdiction": "LA County",
                 "city_name": None,
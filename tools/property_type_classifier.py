@@ -13,6 +13,7 @@ Used for:
 - risk scoring
 """
 
+import re
 from typing import Optional, Dict
 
 
@@ -29,6 +30,41 @@ class PropertyTypeClassifier:
         - reason: explanation
     """
 
+    __slots__ = ("num_units", "zoning", "label")
+
+    # Label keywords in priority order (first keyword present wins)
+    LABEL_TYPES = (
+        ("single", "sfr"),
+        ("condo", "condo"),
+        ("townhome", "townhome"),
+        ("townhouse", "townhome"),
+        ("apartment", "multifamily_5plus"),
+        ("duplex", "duplex"),
+        ("triplex", "triplex"),
+        ("fourplex", "fourplex"),
+        ("quadplex", "fourplex"),
+        ("multi", "multifamily_5plus"),
+        ("commercial", "commercial"),
+    )
+    # Every keyword present in the label, found in one scan; the lookahead
+    # keeps overlapping keywords from hiding each other
+    LABEL_PATTERN = re.compile(
+        "(?=(" + "|".join(re.escape(k) for k, _ in LABEL_TYPES) + "))"
+    )
+
+    # Residential zones keyed by their two-character prefix
+    ZONING_PREFIX_TYPES = {
+        "R1": "sfr",
+        "RS": "sfr",
+        "RE": "sfr",
+        # RD zones typically allow small multifamily
+        "RD": "small_multifamily",
+        "R2": "duplex",
+        "R3": "small_multifamily",
+        "R4": "multifamily_5plus",
+        "R5": "multifamily_5plus",
+    }
+
     def __init__(
         self,
         num_units: Optional[int] = None,
@@ -61,24 +97,12 @@ class PropertyTypeClassifier:
     # --------------------------------------------------------
 
     def _label_based(self) -> Optional[str]:
-        if "single" in self.label:
-            return "sfr"
-        if "condo" in self.label:
-            return "condo"
-        if "townhome" in self.label or "townhouse" in self.label:
-            return "townhome"
-        if "apartment" in self.label:
-            return "multifamily_5plus"
-        if "duplex" in self.label:
-            return "duplex"
-        if "triplex" in self.label:
-            return "triplex"
-        if "fourplex" in self.label or "quadplex" in self.label:
-            return "fourplex"
-        if "multi" in self.label:
-            return "multifamily_5plus"
-        if "commercial" in self.label:
-            return "commercial"
+        found = set(self.LABEL_PATTERN.findall(self.label))
+        if not found:
+            return None
+        for keyword, property_type in self.LABEL_TYPES:
+            if keyword in found:
+                return property_type
         return None
 
     # --------------------------------------------------------
@@ -86,19 +110,9 @@ class PropertyTypeClassifier:
     # --------------------------------------------------------
 
     def _zoning_based(self) -> Optional[str]:
-        if self.zoning.startswith("R1") or self.zoning.startswith("RS") or self.zoning.startswith("RE"):
-            return "sfr"
-        if self.zoning.startswith("RD"):
-            # RD zones typically allow small multifamily
-            return "small_multifamily"
-        if self.zoning.startswith("R2"):
-            return "duplex"
-        if self.zoning.startswith("R3"):
-            return "small_multifamily"
-        if self.zoning.startswith("R4"):
-            return "multifamily_5plus"
-        if self.zoning.startswith("R5"):
-            return "multifamily_5plus"
+        zoned = self.ZONING_PREFIX_TYPES.get(self.zoning[:2])
+        if zoned:
+            return zoned
         if self.zoning.startswith("C"):
             return "commercial"
         return None
@@ -11,7 +11,13 @@ based on known public rules and should be verified using
 City of LA ZIMAS, County RSO registry, and local ordinances.
 """
 
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Optional, Dict, Tuple
+
+import numpy as np
+
+# Distinct (year_built, property_type, jurisdiction, num_units) inputs kept
+EVALUATE_CACHE_SIZE = 4096
 
 
 class RentControlClassifier:
@@ -30,6 +36,60 @@ class RentControlClassifier:
         - exemption_reason: string explanation
     """
 
+    LA_CITY_NAMES = frozenset({"la city", "city of la", "los angeles"})
+    LA_COUNTY_NAMES = frozenset({"la county", "los angeles county", "unincorporated la"})
+    SFR_OR_CONDO_TYPES = frozenset({"sfr", "single_family", "condo"})
+    SMALL_MULTIUNIT_COUNTS = frozenset({2, 3, 4})
+
+    # Every evaluate() result, indexed by the outcome codes below
+    OUTCOMES = (
+        {"rso_applies": None, "jurisdiction": "Unknown",
+         "reason": "Insufficient jurisdiction data"},
+        {"rso_applies": False, "jurisdiction": "LA City",
+         "reason": "New construction (post-1978) exempt"},
+        {"rso_applies": False, "jurisdiction": "LA City",
+         "reason": "SFR or condo is exempt from LA City RSO"},
+        {"rso_applies": True, "jurisdiction": "LA City",
+         "reason": "Pre-1978 multifamily subject to LA City RSO"},
+        {"rso_applies": None, "jurisdiction": "LA City",
+         "reason": "Unable to classify property type"},
+        {"rso_applies": False, "jurisdiction": "LA County",
+         "reason": "Post-1995 construction generally exempt"},
+        {"rso_applies": False, "jurisdiction": "LA County",
+         "reason": "SFR/condo generally exempt under County RSO"},
+        {"rso_applies": True, "jurisdiction": "LA County",
+         "reason": "Multifamily units may fall under LA County RSO"},
+        {"rso_applies": None, "jurisdiction": "LA County",
+         "reason": "Insufficient data for County classification"},
+        {"rso_applies": False, "jurisdiction": "Other City",
+         "reason": "Most other cities in LA County do not have RSO"},
+    )
+    (
+        UNKNOWN_JURISDICTION,
+        CITY_NEW_CONSTRUCTION,
+        CITY_SFR_OR_CONDO,
+        CITY_MULTIFAMILY,
+        CITY_UNCLASSIFIED,
+        COUNTY_NEW_CONSTRUCTION,
+        COUNTY_SFR_OR_CONDO,
+        COUNTY_MULTIFAMILY,
+        COUNTY_UNCLASSIFIED,
+        OTHER_CITY,
+    ) = range(10)
+
+    # evaluate_batch: jurisdiction classes and per-parcel rule bits, which
+    # together index _OUTCOME_TABLE
+    (
+        JURISDICTION_UNKNOWN,
+        JURISDICTION_CITY,
+        JURISDICTION_COUNTY,
+        JURISDICTION_OTHER,
+    ) = range(4)
+    NEW_CONSTRUCTION_BIT = 1
+    SFR_OR_CONDO_BIT = 2
+    CITY_MULTIFAMILY_BIT = 4
+    COUNTY_MULTIFAMILY_BIT = 8
+
     def __init__(
         self,
         year_built: Optional[int],
@@ -60,14 +120,14 @@ class RentControlClassifier:
         SFRs and condos are exempt from LA City RSO.
         LA County rules depend on tenancy circumstances.
         """
-        return self.property_type in ["sfr", "single_family", "condo"]
+        return self.property_type in self.SFR_OR_CONDO_TYPES
 
     def is_small_multiunit(self) -> bool:
         """
         Duplexes, triplexes, fourplexes — covered by RSO in City of LA
         if built before 1978.
         """
-        return self.num_units in [2, 3, 4]
+        return self.num_units in self.SMALL_MULTIUNIT_COUNTS
 
     def is_large_multifamily(self) -> bool:
         """
@@ -80,10 +140,10 @@ class RentControlClassifier:
     # ------------------------------------------------------------
 
     def is_la_city(self) -> bool:
-        return self.jurisdiction in ["la city", "city of la", "los angeles"]
+        return self.jurisdiction in self.LA_CITY_NAMES
 
     def is_la_county(self) -> bool:
-        return self.jurisdiction in ["la county", "los angeles county", "unincorporated la"]
+        return self.jurisdiction in self.LA_COUNTY_NAMES
 
     # ------------------------------------------------------------
     # Main Evaluation
@@ -93,82 +153,158 @@ class RentControlClassifier:
         """
         Returns a structured assessment of rent control applicability.
         """
+        # The rules are pure in the normalized inputs, so a batch of parcels
+        # sharing jurisdiction/type/vintage only evaluates each combination
+        # once. Copied so callers cannot mutate the cached entry.
+        return dict(_evaluate_cached(
+            self.year_built, self.property_type, self.jurisdiction, self.num_units
+        ))
+
+    def _evaluate_uncached(self) -> Dict:
 
         # Unknown jurisdiction
         if self.jurisdiction == "" or self.jurisdiction == "unknown":
-            return {
-                "rso_applies": None,
-                "jurisdiction": "Unknown",
-                "reason": "Insufficient jurisdiction data"
-            }
+            return self.OUTCOMES[self.UNKNOWN_JURISDICTION]
 
         # -----------------------------
         # LA CITY RSO LOGIC
         # -----------------------------
         if self.is_la_city():
             if self.is_new_construction():
-                return {
-                    "rso_applies": False,
-                    "jurisdiction": "LA City",
-                    "reason": "New construction (post-1978) exempt"
-                }
+                return self.OUTCOMES[self.CITY_NEW_CONSTRUCTION]
 
             if self.is_sfr_or_condo():
-                return {
-                    "rso_applies": False,
-                    "jurisdiction": "LA City",
-                    "reason": "SFR or condo is exempt from LA City RSO"
-                }
+                return self.OUTCOMES[self.CITY_SFR_OR_CONDO]
 
             if self.is_small_multiunit() or self.is_large_multifamily():
-                return {
-                    "rso_applies": True,
-                    "jurisdiction": "LA City",
-                    "reason": "Pre-1978 multifamily subject to LA City RSO"
-                }
-
-            return {
-                "rso_applies": None,
-                "jurisdiction": "LA City",
-                "reason": "Unable to classify property type"
-            }
+                return self.OUTCOMES[self.CITY_MULTIFAMILY]
+
+            return self.OUTCOMES[self.CITY_UNCLASSIFIED]
 
         # -----------------------------
         # LA COUNTY RSO LOGIC
         # -----------------------------
         if self.is_la_county():
             if self.is_new_construction():
-                return {
-                    "rso_applies": False,
-                    "jurisdiction": "LA County",
-                    "reason": "Post-1995 construction generally exempt"
-                }
+                return self.OUTCOMES[self.COUNTY_NEW_CONSTRUCTION]
 
             if self.is_sfr_or_condo():
-                return {
-                    "rso_applies": False,
-                    "jurisdiction": "LA County",
-                    "reason": "SFR/condo generally exempt under County RSO"
-                }
+                return self.OUTCOMES[self.COUNTY_SFR_OR_CONDO]
 
             if self.num_units >= 2:
-                return {
-                    "rso_applies": True,
-                    "jurisdiction": "LA County",
-                    "reason": "Multifamily units may fall under LA County RSO"
-                }
-
-            return {
-                "rso_applies": None,
-                "jurisdiction": "LA County",
-                "reason": "Insufficient data for County classification"
-            }
+                return self.OUTCOMES[self.COUNTY_MULTIFAMILY]
+
+            return self.OUTCOMES[self.COUNTY_UNCLASSIFIED]
 
         # -----------------------------
         # OTHER CITIES IN LA COUNTY
         # -----------------------------
+        return self.OUTCOMES[self.OTHER_CITY]
+
+    # ------------------------------------------------------------
+    # Batch Evaluation
+    # ------------------------------------------------------------
+
+    @classmethod
+    def evaluate_batch(cls, year_built, property_type, jurisdiction, num_units) -> Dict[str, np.ndarray]:
+        """
+        evaluate() for a whole parcel set at once. Inputs are equal-length
+        sequences (None where unknown). Each distinct property type /
+        jurisdiction string is normalized and matched only once, and the
+        rule cascade is a single table lookup per parcel.
+
+        Returns columns aligned with the inputs:
+            - reason_code: int8 index into OUTCOMES
+            - rso_applies: True/False/None (object array)
+            - jurisdiction: "LA City" / "LA County" / "Other City" / "Unknown"
+        """
+        years = cls._numeric_column(year_built)
+        units = np.nan_to_num(cls._numeric_column(num_units), nan=0.0)
+        ptype_labels, ptype_idx = cls._normalized_labels(property_type)
+        juris_labels, juris_idx = cls._normalized_labels(jurisdiction)
+
+        # String rules are decided once per distinct label, then broadcast
+        juris_class = np.select(
+            [
+                (juris_labels == "") | (juris_labels == "unknown"),
+                np.isin(juris_labels, list(cls.LA_CITY_NAMES)),
+                np.isin(juris_labels, list(cls.LA_COUNTY_NAMES)),
+            ],
+            [cls.JURISDICTION_UNKNOWN, cls.JURISDICTION_CITY, cls.JURISDICTION_COUNTY],
+            default=cls.JURISDICTION_OTHER,
+        )[juris_idx]
+        sfr_or_condo = np.isin(ptype_labels, list(cls.SFR_OR_CONDO_TYPES))[ptype_idx]
+
+        rule_bits = (
+            (years >= 1979) * cls.NEW_CONSTRUCTION_BIT
+            | sfr_or_condo * cls.SFR_OR_CONDO_BIT
+            | (np.isin(units, list(cls.SMALL_MULTIUNIT_COUNTS)) | (units >= 5)) * cls.CITY_MULTIFAMILY_BIT
+            | (units >= 2) * cls.COUNTY_MULTIFAMILY_BIT
+        )
+        # The whole cascade is one lookup per parcel
+        codes = _OUTCOME_TABLE[juris_class, rule_bits]
+
         return {
-            "rso_applies": False,
-            "jurisdiction": "Other City",
-            "reason": "Most other cities in LA County do not have RSO"
+            "reason_code": codes,
+            "rso_applies": np.array([o["rso_applies"] for o in cls.OUTCOMES], dtype=object)[codes],
+            "jurisdiction": np.array([o["jurisdiction"] for o in cls.OUTCOMES])[codes],
         }
+
+    @staticmethod
+    def _numeric_column(values) -> np.ndarray:
+        # None (unknown) becomes NaN, which fails every comparison
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+    @staticmethod
+    def _normalized_labels(values) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (distinct normalized strings, index of each value into them).
+        """
+        # Hash-coding keeps this O(n); np.unique would sort the strings
+        index: Dict = {}
+        codes = np.fromiter((index.setdefault(v, len(index)) for v in values), dtype=np.intp)
+        labels = np.array([(v or "").lower().strip() for v in index], dtype=str)
+        return labels, codes
+
+
+def _build_outcome_table() -> np.ndarray:
+    """
+    Outcome code for every (jurisdiction class, rule bits) pair, following
+    the cascade in RentControlClassifier._evaluate_uncached.
+    """
+    c = RentControlClassifier
+    table = np.full((4, 16), c.OTHER_CITY, dtype=np.int8)
+    table[c.JURISDICTION_UNKNOWN] = c.UNKNOWN_JURISDICTION
+
+    cascades = (
+        (c.JURISDICTION_CITY, c.CITY_MULTIFAMILY_BIT, c.CITY_NEW_CONSTRUCTION,
+         c.CITY_SFR_OR_CONDO, c.CITY_MULTIFAMILY, c.CITY_UNCLASSIFIED),
+        (c.JURISDICTION_COUNTY, c.COUNTY_MULTIFAMILY_BIT, c.COUNTY_NEW_CONSTRUCTION,
+         c.COUNTY_SFR_OR_CONDO, c.COUNTY_MULTIFAMILY, c.COUNTY_UNCLASSIFIED),
+    )
+    for juris, multifamily_bit, new, sfr, multifamily, unclassified in cascades:
+        for bits in range(16):
+            if bits & c.NEW_CONSTRUCTION_BIT:
+                table[juris, bits] = new
+            elif bits & c.SFR_OR_CONDO_BIT:
+                table[juris, bits] = sfr
+            elif bits & multifamily_bit:
+                table[juris, bits] = multifamily
+            else:
+                table[juris, bits] = unclassified
+    return table
+
+
+_OUTCOME_TABLE = _build_outcome_table()
+
+
+@lru_cache(maxsize=EVALUATE_CACHE_SIZE)
+def _evaluate_cached(
+    year_built: Optional[int],
+    property_type: str,
+    jurisdiction: str,
+    num_units: int
+) -> Dict:
+    return RentControlClassifier(
+        year_built, property_type, jurisdiction, num_units
+    )._evaluate_uncached()
@@ -54,8 +54,10 @@ This module standardizes these inputs into a list of comps like:
    }
 """
 
-from typing import List, Dict, Optional
 import statistics
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
 
 
 class RentalCompAggregator:
@@ -81,8 +83,14 @@ class RentalCompAggregator:
             "by_bedroom": {...},
             "recommended_rent": {...}
         }
+
+    Comps are added only through the add_* methods. `comps` is a read-only
+    tuple snapshot of them; it cannot be appended to or reassigned.
     """
 
+    # Rows allocated up front; the columns double whenever they fill up
+    INITIAL_CAPACITY = 64
+
     def __init__(
         self,
         subject_beds: Optional[float] = None,
@@ -92,7 +100,42 @@ class RentalCompAggregator:
         self.subject_beds = subject_beds
         self.subject_baths = subject_baths
         self.subject_sqft = subject_sqft
-        self.comps: List[Dict] = []
+
+        # Comps are stored column-wise: one float64 array per numeric field
+        # (NaN where a value is missing) plus the source labels. Only the
+        # first _n rows are in use.
+        self._n = 0
+        self._beds = np.full(self.INITIAL_CAPACITY, np.nan)
+        self._baths = np.full(self.INITIAL_CAPACITY, np.nan)
+        self._sqft = np.full(self.INITIAL_CAPACITY, np.nan)
+        self._rents = np.full(self.INITIAL_CAPACITY, np.nan)
+        self._sources: List[str] = []
+
+        # Stats derived from the comps; built on first use, dropped
+        # whenever a comp is added
+        self._cache: Optional[Dict] = None
+
+    @property
+    def comps(self) -> Tuple[Dict, ...]:
+        """
+        The comps in the standardized dict format (see module docstring),
+        built from the column arrays on each access. A tuple, so code that
+        still appends to it fails loudly; use the add_* methods instead.
+        """
+        n = self._n
+        return tuple(
+            {
+                "beds": self._py_value(beds),
+                "baths": self._py_value(baths),
+                "sqft": self._py_value(sqft, integral=True),
+                "rent": self._py_value(rent),
+                "source": source,
+            }
+            for beds, baths, sqft, rent, source in zip(
+                self._beds[:n].tolist(), self._baths[:n].tolist(),
+                self._sqft[:n].tolist(), self._rents[:n].tolist(), self._sources,
+            )
+        )
 
     # ---------------------------------------------------------
     # Input normalization methods
@@ -105,41 +148,25 @@ class RentalCompAggregator:
         if not apartments_data or "unit_types" not in apartments_data:
             return
 
-        for unit in apartments_data.get("unit_types", []):
-            beds = unit.get("beds")
-            baths = unit.get("baths")
-            sqft_min = unit.get("sqft_min")
-            sqft_max = unit.get("sqft_max")
-            rent_min = unit.get("rent_min")
-            rent_max = unit.get("rent_max")
-
-            # Average sqft if range is provided
-            sqft = None
-            if sqft_min and sqft_max:
-                sqft = int(round((sqft_min + sqft_max) / 2))
-            elif sqft_min:
-                sqft = sqft_min
-            elif sqft_max:
-                sqft = sqft_max
-
-            # Average rent if range is provided
-            rent = None
-            if rent_min and rent_max:
-                rent = round((rent_min + rent_max) / 2, 2)
-            elif rent_min:
-                rent = rent_min
-            elif rent_max:
-                rent = rent_max
-
-            self.comps.append(
-                {
-                    "beds": beds,
-                    "baths": baths,
-                    "sqft": sqft,
-                    "rent": rent,
-                    "source": label
-                }
-            )
+        units = list(apartments_data.get("unit_types", []))
+
+        # Each range resolves to its midpoint when both ends are set, else
+        # whichever end is set; a missing or zero end counts as unset
+        sqft, sqft_mid = self._resolve_ranges(self._range_column(units, "sqft_min"),
+                                              self._range_column(units, "sqft_max"))
+        sqft = np.where(sqft_mid, np.round(sqft), sqft)
+        rent, rent_mid = self._resolve_ranges(self._range_column(units, "rent_min"),
+                                              self._range_column(units, "rent_max"))
+        # Python's round(): np.round can land a cent off on halves
+        rent[rent_mid] = [round(r, 2) for r in rent[rent_mid].tolist()]
+
+        self._append_rows(
+            self._column(units, "beds"),
+            self._column(units, "baths"),
+            sqft,
+            rent,
+            [label] * len(units),
+        )
 
     def add_manual_comp(
         self,
@@ -152,14 +179,10 @@ class RentalCompAggregator:
         """
         Adds a single manually-defined comp.
         """
-        self.comps.append(
-            {
-                "beds": beds,
-                "baths": baths,
-                "sqft": sqft,
-                "rent": rent,
-                "source": source
-            }
+        self._append_rows(
+            *(np.array([np.nan if v is None else v], dtype=np.float64)
+              for v in (beds, baths, sqft, rent)),
+            [source],
         )
 
     def add_many_manual_comps(self, comp_list: List[Dict]):
@@ -169,33 +192,136 @@ class RentalCompAggregator:
         Each comp dict should have keys:
             beds, baths, sqft, rent, source (source optional)
         """
-        for c in comp_list:
-            self.add_manual_comp(
-                beds=c.get("beds"),
-                baths=c.get("baths"),
-                sqft=c.get("sqft"),
-                rent=c.get("rent"),
-                source=c.get("source", "manual")
-            )
+        comp_list = list(comp_list)
+        self._append_rows(
+            *(self._column(comp_list, key) for key in ("beds", "baths", "sqft", "rent")),
+            [c.get("source", "manual") for c in comp_list],
+        )
 
     # ---------------------------------------------------------
     # Internal helpers
     # ---------------------------------------------------------
 
+    def _append_rows(
+        self,
+        beds: np.ndarray,
+        baths: np.ndarray,
+        sqft: np.ndarray,
+        rents: np.ndarray,
+        sources: List[str],
+    ) -> None:
+        start, end = self._n, self._n + len(sources)
+        if end > len(self._rents):
+            capacity = max(end, 2 * len(self._rents))
+            for name in ("_beds", "_baths", "_sqft", "_rents"):
+                grown = np.full(capacity, np.nan)
+                grown[:start] = getattr(self, name)[:start]
+                setattr(self, name, grown)
+
+        self._beds[start:end] = beds
+        self._baths[start:end] = baths
+        self._sqft[start:end] = sqft
+        self._rents[start:end] = rents
+        self._sources.extend(sources)
+        self._n = end
+        self._cache = None
+
+    @staticmethod
+    def _column(rows: List[Dict], key: str) -> np.ndarray:
+        return np.fromiter(
+            (np.nan if row.get(key) is None else row[key] for row in rows),
+            dtype=np.float64, count=len(rows),
+        )
+
+    @staticmethod
+    def _range_column(units: List[Dict], key: str) -> np.ndarray:
+        return np.fromiter(
+            (unit.get(key) or np.nan for unit in units), dtype=np.float64, count=len(units)
+        )
+
+    @staticmethod
+    def _resolve_ranges(lo: np.ndarray, hi: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (values, is_midpoint): the midpoint where both ends are present, the
+        present end where only one is, NaN where neither is.
+        """
+        lo_missing = np.isnan(lo)
+        hi_missing = np.isnan(hi)
+        values = np.where(lo_missing, hi, np.where(hi_missing, lo, (lo + hi) / 2))
+        return values, ~lo_missing & ~hi_missing
+
+    @staticmethod
+    def _py_value(value: float, integral: bool = False):
+        if value != value:
+            return None
+        if integral and value.is_integer():
+            return int(value)
+        return value
+
     def _filter_valid_rent_comps(self) -> List[Dict]:
         """
         Returns comps that have at least a rent value.
         """
-        return [c for c in self.comps if c.get("rent") is not None]
+        comps = self.comps
+        return [comps[i] for i in self._scan_comps()[0].tolist()]
+
+    def _get_cache(self) -> Dict:
+        """
+        Per-comp-set cache: the indexes of the comps with a rent, their
+        rent-per-sqft, and any stats computed so far.
+        """
+        if self._cache is None:
+            rents, _, sqft = self._comp_arrays()
+            has_rent = ~np.isnan(rents)
+            # Same filter as before: a non-zero rent and a positive sqft
+            rps_mask = has_rent & (rents != 0) & (sqft > 0)
+            self._cache = {
+                "rent_idx": np.flatnonzero(has_rent),
+                "rps": rents[rps_mask] / sqft[rps_mask],
+            }
+        return self._cache
+
+    def _comp_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (rents, beds, sqft) views over the rows in use.
+        """
+        n = self._n
+        return self._rents[:n], self._beds[:n], self._sqft[:n]
+
+    def _scan_comps(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (indexes of the comps with a rent, rent-per-sqft of those that also
+        have a usable sqft).
+        """
+        cache = self._get_cache()
+        return cache["rent_idx"], cache["rps"]
+
+    def _rent_per_sqft(self) -> np.ndarray:
+        return self._scan_comps()[1]
 
     def _rent_per_sqft_list(self) -> List[float]:
-        rps_list = []
-        for c in self.comps:
-            rent = c.get("rent")
-            sqft = c.get("sqft")
-            if rent and sqft and sqft > 0:
-                rps_list.append(rent / sqft)
-        return rps_list
+        return self._rent_per_sqft().tolist()
+
+    @staticmethod
+    def _mean(values: np.ndarray) -> float:
+        # statistics.mean is exact, so averages round to the same cent as
+        # before; ndarray.mean (and fsum / n) can land a cent off on ties
+        return float(statistics.mean(values.tolist()))
+
+    @classmethod
+    def _rent_stats(cls, rents: np.ndarray) -> Dict:
+        # Median by selection: partition around the middle one or two
+        # positions (O(n)) instead of sorting
+        n = len(rents)
+        lo, hi = (n - 1) // 2, n // 2
+        middle = np.partition(rents, (lo, hi))
+        return {
+            "count": n,
+            "rent_min": float(rents.min()),
+            "rent_max": float(rents.max()),
+            "rent_avg": round(cls._mean(rents), 2),
+            "rent_median": round(float((middle[lo] + middle[hi]) / 2), 2),
+        }
 
     # ---------------------------------------------------------
     # Statistical calculations
@@ -205,10 +331,16 @@ class RentalCompAggregator:
         """
         Computes overall rent statistics across all comps.
         """
-        valid_comps = self._filter_valid_rent_comps()
-        rents = [c["rent"] for c in valid_comps if c["rent"] is not None]
+        cache = self._get_cache()
+        if "overall" not in cache:
+            cache["overall"] = self._overall_stats_uncached()
+        return dict(cache["overall"])
 
-        if not rents:
+    def _overall_stats_uncached(self) -> Dict:
+        all_rents, _, _ = self._comp_arrays()
+        comp_idx, rps = self._scan_comps()
+
+        if not len(comp_idx):
             return {
                 "count": 0,
                 "rent_min": None,
@@ -218,45 +350,53 @@ class RentalCompAggregator:
                 "rent_per_sqft_avg": None,
             }
 
-        rent_min = min(rents)
-        rent_max = max(rents)
-        rent_avg = round(statistics.mean(rents), 2)
-        rent_median = round(statistics.median(rents), 2)
+        stats = self._rent_stats(all_rents[comp_idx])
+        stats["rent_per_sqft_avg"] = round(self._mean(rps), 4) if len(rps) else None
 
-        rps_list = self._rent_per_sqft_list()
-        rps_avg = round(statistics.mean(rps_list), 4) if rps_list else None
-
-        return {
-            "count": len(rents),
-            "rent_min": rent_min,
-            "rent_max": rent_max,
-            "rent_avg": rent_avg,
-            "rent_median": rent_median,
-            "rent_per_sqft_avg": rps_avg,
-        }
+        return stats
 
     def stats_by_bedroom(self) -> Dict:
         """
         Computes rent stats grouped by bedroom count.
         """
-        grouped: Dict[float, List[float]] = {}
-        for c in self._filter_valid_rent_comps():
-            beds = c.get("beds")
-            rent = c.get("rent")
-            if beds is None or rent is None:
-                continue
-            grouped.setdefault(beds, []).append(rent)
+        cache = self._get_cache()
+        if "by_bedroom" not in cache:
+            cache["by_bedroom"] = self._stats_by_bedroom_uncached()
+        return {beds: dict(stats) for beds, stats in cache["by_bedroom"].items()}
+
+    def _stats_by_bedroom_uncached(self) -> Dict:
+        all_rents, all_beds, _ = self._comp_arrays()
+        rent_idx, _ = self._scan_comps()
+        comp_idx = rent_idx[~np.isnan(all_beds[rent_idx])]
+        if not len(comp_idx):
+            return {}
+
+        beds = all_beds[comp_idx]
+        rents = all_rents[comp_idx]
+        _, first, group = np.unique(beds, return_index=True, return_inverse=True)
+        counts = np.bincount(group)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+        # One sort by (bedrooms, rent) gives every group's stats at once:
+        # each group is a contiguous run, its min and max are the run's
+        # ends and its median sits in the middle
+        sorted_rents = rents[np.lexsort((rents, group))]
+        means = [self._mean(run) for run in np.split(sorted_rents, starts[1:])]
+        medians = (
+            sorted_rents[starts + (counts - 1) // 2] + sorted_rents[starts + counts // 2]
+        ) / 2
+        mins = sorted_rents[starts]
+        maxes = sorted_rents[starts + counts - 1]
 
         result = {}
-        for beds, rents in grouped.items():
-            if not rents:
-                continue
-            result[beds] = {
-                "count": len(rents),
-                "rent_min": min(rents),
-                "rent_max": max(rents),
-                "rent_avg": round(statistics.mean(rents), 2),
-                "rent_median": round(statistics.median(rents), 2),
+        # Groups in order of first appearance
+        for g in np.argsort(first):
+            result[float(beds[first[g]])] = {
+                "count": int(counts[g]),
+                "rent_min": float(mins[g]),
+                "rent_max": float(maxes[g]),
+                "rent_avg": round(means[g], 2),
+                "rent_median": round(float(medians[g]), 2),
             }
 
         return result
@@ -265,46 +405,45 @@ class RentalCompAggregator:
     # Recommended rent for subject
     # ---------------------------------------------------------
 
-    def _recommended_rent_for_subject(self) -> Dict:
+    def _recommended_rent_for_subject(self, overall: Optional[Dict] = None) -> Dict:
         """
         Uses:
         - bedroom-matched comps (exact match)
         - fallback to +/- 1 bedroom
         - optional rent-per-sqft logic if subject_sqft available
+
+        `overall` is overall_stats() when the caller already has it.
         """
+        overall = dict(overall) if overall is not None else None
+
         if self.subject_beds is None:
             # Without bed count, we fall back to overall stats
-            overall = self.overall_stats()
+            overall = overall or self.overall_stats()
             return {
                 "method": "overall_only",
                 "rent_estimate": overall.get("rent_avg"),
                 "details": overall
             }
 
+        rent_idx, _ = self._scan_comps()
+        rents, beds, _ = self._comp_arrays()
+        rents = rents[rent_idx]
+        # Bedroom distance of every rented comp (NaN beds never match)
+        bed_gap = np.abs(beds[rent_idx] - self.subject_beds)
+
         # 1) Exact bed match
-        exact_rents = [
-            c["rent"]
-            for c in self._filter_valid_rent_comps()
-            if c.get("beds") == self.subject_beds and c.get("rent") is not None
-        ]
-
-        # 2) +/- 1 bed fallback
-        close_rents = [
-            c["rent"]
-            for c in self._filter_valid_rent_comps()
-            if c.get("beds") is not None
-            and abs(c.get("beds") - self.subject_beds) <= 1
-            and c.get("rent") is not None
-        ]
-
-        if exact_rents:
-            base_estimate = round(statistics.mean(exact_rents), 2)
+        exact = bed_gap == 0
+        # 2) +/- 1 bed fallback, only masked when there is no exact match
+        close = None if exact.any() else bed_gap <= 1
+
+        if close is None:
+            base_estimate = round(self._mean(rents[exact]), 2)
             method = "exact_bed_match"
-        elif close_rents:
-            base_estimate = round(statistics.mean(close_rents), 2)
+        elif close.any():
+            base_estimate = round(self._mean(rents[close]), 2)
             method = "plus_minus_one_bed"
         else:
-            overall = self.overall_stats()
+            overall = overall or self.overall_stats()
             return {
                 "method": "fallback_overall",
                 "rent_estimate": overall.get("rent_avg"),
@@ -313,9 +452,9 @@ class RentalCompAggregator:
 
         # If we have subject sqft and rent-per-sqft, refine
         if self.subject_sqft and self.subject_sqft > 0:
-            rps_list = self._rent_per_sqft_list()
-            if rps_list:
-                avg_rps = statistics.mean(rps_list)
+            rps = self._rent_per_sqft()
+            if len(rps):
+                avg_rps = self._mean(rps)
                 sqft_based_estimate = round(avg_rps * self.subject_sqft, 2)
 
                 # average of bedroom-based and sqft-based
@@ -345,7 +484,7 @@ class RentalCompAggregator:
         """
         overall = self.overall_stats()
         by_bed = self.stats_by_bedroom()
-        recommended = self._recommended_rent_for_subject()
+        recommended = self._recommended_rent_for_subject(overall)
 
         subject_info = {
             "beds": self.subject_beds,
@@ -358,5 +497,5 @@ class RentalCompAggregator:
             "overall_stats": overall,
             "by_bedroom": by_bed,
             "recommended_rent": recommended,
-            "comp_count": len(self._filter_valid_rent_comps()),
+            "comp_count": overall["count"],
         }
@@ -17,6 +17,85 @@ using the standard 9-section structure:
 
 from typing import Dict, Optional
 
+# The whole report is one template; each {..._lines} slot is a run of
+# complete "- ...\n" lines (possibly empty) rendered before formatting
+REPORT_TEMPLATE = """\
+# 1. Property Snapshot
+**Address:** {address}
+**Asking Price:** {asking_price}
+**Beds/Baths:** {beds} / {baths}
+**Building SF:** {sqft} | **Lot SF:** {lot_sqft}
+**Year Built:** {year_built}
+
+## 2. Zoning & Legal Use
+- Zoning Code: {zoning_code}
+- SFR: {is_sfr} | Multifamily: {is_multifamily} | Commercial: {is_commercial}
+
+## 3. Rent Control & Regulatory Factors
+- RSO / rent control analysis to be added based on jurisdiction, year built, and local ordinances.
+
+## 4. Comparable Sales Summary
+{comps_lines}
+## 5. Income Approach & Cap Rate
+{income_lines}
+## 6. Financing & Monthly Payment
+{financing_lines}
+## 7. Cash Flow & Return Scenarios
+{returns_lines}
+## 8. Risks & Red Flags
+- Hazard Summary: {hazards}
+- Confirm legal unit count, permits, and code compliance with city/county agencies.
+- Verify any non-conforming or unpermitted improvements with a qualified professional.
+
+## 9. Strategic Recommendation
+- Provide a Buy / Watch / Pass recommendation here based on your risk tolerance, financing, and long-term strategy.
+"""
+
+COMPS_TEMPLATE = """\
+- Low Value: ${low_value:,.0f}
+- Base Value: ${base_value:,.0f}
+- High Value: ${high_value:,.0f}
+"""
+
+INCOME_TEMPLATE = """\
+- Gross Scheduled Rent (GSR): ${gsr:,.0f}
+- Net Operating Income (NOI): ${noi:,.0f}
+{cap_rate_line}- Income Approach Value Estimate: ${value_estimate:,.0f}
+"""
+CAP_RATE_LINE = "- Implied Cap Rate: {:.2%}\n"
+
+# Report slots filled straight from the subject / zoning dicts
+SUBJECT_FIELDS = ("address", "beds", "baths", "sqft", "lot_sqft", "year_built")
+ZONING_FIELDS = ("zoning_code", "is_sfr", "is_multifamily", "is_commercial")
+# (summary key, line) pairs whose line is only written when the value is set
+FINANCING_LINES = (
+    ("annual_debt_service", "- Annual Debt Service: ${:,.0f}\n"),
+    ("monthly_pi", "- Monthly Principal & Interest (P&I): ${:,.0f}\n"),
+)
+RETURNS_LINES = (
+    ("dscr", "- DSCR: {:.2f}\n"),
+    ("annual_cash_flow", "- Annual Cash Flow (Before Taxes): ${:,.0f}\n"),
+    ("coc_return", "- Cash-on-Cash Return: {:.2%}\n"),
+)
+
+
+def _optional_lines(summary: Dict, line_templates) -> str:
+    parts = ""
+    for key, template in line_templates:
+        value = summary.get(key)
+        if value is not None:
+            parts += template.format(value)
+    return parts
+
+
+def _asking_price(price) -> str:
+    if not price:
+        return "N/A"
+    try:
+        return f"${float(price):,.0f}"
+    except Exception:
+        return f"{price}"
+
 
 def generate_markdown_report(
     subject: Dict,
@@ -44,98 +123,45 @@ def generate_markdown_report(
     underwriting_summary: {dscr, coc_return, annual_cash_flow, annual_debt_service, monthly_pi}
     """
 
-    lines = []
-
-    # 1. Property Snapshot
-    lines.append("# 1. Property Snapshot")
-    lines.append(f"**Address:** {subject.get('address')}")
-    price = subject.get("price")
-    if price:
-        try:
-            price = float(price)
-            lines.append(f"**Asking Price:** ${price:,.0f}")
-        except Exception:
-            lines.append(f"**Asking Price:** {price}")
-    else:
-        lines.append("**Asking Price:** N/A")
-    lines.append(f"**Beds/Baths:** {subject.get('beds')} / {subject.get('baths')}")
-    lines.append(f"**Building SF:** {subject.get('sqft')} | **Lot SF:** {subject.get('lot_sqft')}")
-    lines.append(f"**Year Built:** {subject.get('year_built')}")
-    lines.append("")
-
-    # 2. Zoning & Legal Use
-    lines.append("## 2. Zoning & Legal Use")
-    lines.append(f"- Zoning Code: {zoning.get('zoning_code')}")
-    lines.append(f"- SFR: {zoning.get('is_sfr')} | Multifamily: {zoning.get('is_multifamily')} | Commercial: {zoning.get('is_commercial')}")
-    lines.append("")
-
-    # 3. Rent Control & Regulatory Factors
-    lines.append("## 3. Rent Control & Regulatory Factors")
-    lines.append("- RSO / rent control analysis to be added based on jurisdiction, year built, and local ordinances.")
-    lines.append("")
-
-    # 4. Comparable Sales Summary
-    lines.append("## 4. Comparable Sales Summary")
+    # Every value is read once up front; the templates only format them
+    s_get = subject.get
+    z_get = zoning.get
+    values = {key: s_get(key) for key in SUBJECT_FIELDS}
+    values.update((key, z_get(key)) for key in ZONING_FIELDS)
+    values["asking_price"] = _asking_price(s_get("price"))
+    values["hazards"] = hazards
+
     if comps_summary:
-        lines.append(f"- Low Value: ${comps_summary.get('low_value'):,.0f}")
-        lines.append(f"- Base Value: ${comps_summary.get('base_value'):,.0f}")
-        lines.append(f"- High Value: ${comps_summary.get('high_value'):,.0f}")
+        c_get = comps_summary.get
+        comps_lines = COMPS_TEMPLATE.format(
+            low_value=c_get("low_value"),
+            base_value=c_get("base_value"),
+            high_value=c_get("high_value"),
+        )
     else:
-        lines.append("- Comparable sales data unavailable or not yet modeled.")
-    lines.append("")
+        comps_lines = "- Comparable sales data unavailable or not yet modeled.\n"
 
-    # 5. Income Approach & Cap Rate
-    lines.append("## 5. Income Approach & Cap Rate")
     if income_summary:
-        lines.append(f"- Gross Scheduled Rent (GSR): ${income_summary.get('gsr'):,.0f}")
-        lines.append(f"- Net Operating Income (NOI): ${income_summary.get('noi'):,.0f}")
-        cap_rate = income_summary.get("cap_rate")
-        if cap_rate is not None:
-            lines.append(f"- Implied Cap Rate: {cap_rate:.2%}")
-        lines.append(f"- Income Approach Value Estimate: ${income_summary.get('value_estimate'):,.0f}")
-    else:
-        lines.append("- Income approach not calculated.")
-    lines.append("")
-
-    # 6. Financing & Monthly Payment
-    lines.append("## 6. Financing & Monthly Payment")
-    if underwriting_summary:
-        ads = underwriting_summary.get("annual_debt_service")
-        mpi = underwriting_summary.get("monthly_pi")
-        if ads is not None:
-            lines.append(f"- Annual Debt Service: ${ads:,.0f}")
-        if mpi is not None:
-            lines.append(f"- Monthly Principal & Interest (P&I): ${mpi:,.0f}")
+        i_get = income_summary.get
+        cap_rate = i_get("cap_rate")
+        income_lines = INCOME_TEMPLATE.format(
+            gsr=i_get("gsr"),
+            noi=i_get("noi"),
+            cap_rate_line=CAP_RATE_LINE.format(cap_rate) if cap_rate is not None else "",
+            value_estimate=i_get("value_estimate"),
+        )
     else:
-        lines.append("- Financing scenario not modeled.")
-    lines.append("")
+        income_lines = "- Income approach not calculated.\n"
 
-    # 7. Cash Flow & Return Scenarios
-    lines.append("## 7. Cash Flow & Return Scenarios")
     if underwriting_summary:
-        dscr = underwriting_summary.get("dscr")
-        annual_cf = underwriting_summary.get("annual_cash_flow")
-        coc = underwriting_summary.get("coc_return")
-        if dscr is not None:
-            lines.append(f"- DSCR: {dscr:.2f}")
-        if annual_cf is not None:
-            lines.append(f"- Annual Cash Flow (Before Taxes): ${annual_cf:,.0f}")
-        if coc is not None:
-            lines.append(f"- Cash-on-Cash Return: {coc:.2%}")
+        financing_lines = _optional_lines(underwriting_summary, FINANCING_LINES)
+        returns_lines = _optional_lines(underwriting_summary, RETURNS_LINES)
     else:
-        lines.append("- Return scenarios not calculated.")
-    lines.append("")
-
-    # 8. Risks & Red Flags
-    lines.append("## 8. Risks & Red Flags")
-    lines.append(f"- Hazard Summary: {hazards}")
-    lines.append("- Confirm legal unit count, permits, and code compliance with city/county agencies.")
-    lines.append("- Verify any non-conforming or unpermitted improvements with a qualified professional.")
-    lines.append("")
-
-    # 9. Strategic Recommendation
-    lines.append("## 9. Strategic Recommendation")
-    lines.append("- Provide a Buy / Watch / Pass recommendation here based on your risk tolerance, financing, and long-term strategy.")
-    lines.append("")
-
-    return "\n".join(lines)
+        financing_lines = "- Financing scenario not modeled.\n"
+        returns_lines = "- Return scenarios not calculated.\n"
+
+    values["comps_lines"] = comps_lines
+    values["income_lines"] = income_lines
+    values["financing_lines"] = financing_lines
+    values["returns_lines"] = returns_lines
+    return REPORT_TEMPLATE.format_map(values)
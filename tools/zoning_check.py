@@ -17,38 +17,67 @@ class ZoningCheck:
     and returns a basic classification.
     """
 
+    SFR_FLAG = 1
+    MULTI_FAMILY_FLAG = 2
+    COMMERCIAL_FLAG = 4
+
+    # Two-character zone tokens and the uses they signal. A token can appear
+    # anywhere in the code (e.g. "[Q]R3-1", "(T)C2-1VL"), so every
+    # two-character window of the code is looked up.
+    TOKEN_FLAGS = {
+        "R1": SFR_FLAG,
+        "RE": SFR_FLAG,
+        "RS": SFR_FLAG,
+        "RD": MULTI_FAMILY_FLAG,
+        "R2": MULTI_FAMILY_FLAG,
+        "R3": MULTI_FAMILY_FLAG,
+        "R4": MULTI_FAMILY_FLAG,
+        "R5": MULTI_FAMILY_FLAG,
+        "C1": COMMERCIAL_FLAG,
+        "C2": COMMERCIAL_FLAG,
+        "C3": COMMERCIAL_FLAG,
+        "C4": COMMERCIAL_FLAG,
+        "CR": COMMERCIAL_FLAG,
+    }
+
     def __init__(self, zoning_code: str):
         # Normalize the code for easier comparisons
         self.code = (zoning_code or "").upper().strip()
+        # One pass over the code sets every classification flag
+        self._flags = 0
+        for i in range(len(self.code) - 1):
+            self._flags |= self.TOKEN_FLAGS.get(self.code[i:i + 2], 0)
+        # The classification never changes, so the summary is built once
+        self._summary = {
+            "zoning_code": self.code or None,
+            "is_sfr": self.is_single_family(),
+            "is_multifamily": self.is_multi_family(),
+            "is_commercial": self.is_commercial()
+        }
 
     def is_multi_family(self) -> bool:
         """
         Returns True if the zoning appears to allow multifamily use.
         Common LA patterns: RD, R2, R3, R4, R5.
         """
-        return any(prefix in self.code for prefix in ["RD", "R2", "R3", "R4", "R5"])
+        return bool(self._flags & self.MULTI_FAMILY_FLAG)
 
     def is_single_family(self) -> bool:
         """
         Returns True if the zoning appears to be low-density SFR.
         Common LA patterns: R1, RE (Residential Estate), RS (Suburban).
         """
-        return any(prefix in self.code for prefix in ["R1", "RE", "RS"])
+        return bool(self._flags & self.SFR_FLAG)
 
     def is_commercial(self) -> bool:
         """
         Returns True if the zoning appears commercial.
         Common LA patterns: C1, C2, C4, CR, etc.
         """
-        return any(prefix in self.code for prefix in ["C1", "C2", "C3", "C4", "CR"])
+        return bool(self._flags & self.COMMERCIAL_FLAG)
 
     def summary(self) -> dict:
         """
         Returns a simple dictionary with zoning classification flags.
         """
-        return {
-            "zoning_code": self.code or None,
-            "is_sfr": self.is_single_family(),
-            "is_multifamily": self.is_multi_family(),
-            "is_commercial": self.is_commercial()
-        }
+        return dict(self._summary)
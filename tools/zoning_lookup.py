@@ -24,9 +24,95 @@ ZIMAS or equivalent official sources.
 """
 
 import re
-from typing import Optional, Dict
+import copy
+import sys
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Callable, Optional, Dict, Iterable, List, Pattern, Tuple
 
-from bs4 import BeautifulSoup
+from services.html_parsing import HAS_LXML, make_soup
+
+# Distinct normalized zoning codes kept by ZoningInterpreter.interpret
+INTERPRET_CACHE_SIZE = 4096
+
+# Head and non-visible tags; ZIMAS labels never live in them. Text under
+# <html>/<body> (or a bare fragment) is page content.
+NON_CONTENT_TAGS = frozenset((
+    "head", "title", "meta", "link",
+    "script", "style", "noscript", "template",
+))
+
+
+def _in_page_content(node) -> bool:
+    # A soup text node outside every head / non-visible tag
+    return not any(parent.name in NON_CONTENT_TAGS for parent in node.parents)
+
+
+if HAS_LXML:
+    from lxml import etree  # type: ignore
+
+    # Every text or comment node matching $label (case-insensitive) outside
+    # every head / non-visible tag, in document order
+    _LABEL_NODES_XPATH = etree.XPath(
+        "(//text() | //comment())[re:test(., $label, 'i')]"
+        "[not(ancestor::*[" + " or ".join(f"self::{tag}" for tag in sorted(NON_CONTENT_TAGS)) + "])]",
+        namespaces={"re": "http://exslt.org/regular-expressions"},
+    )
+    # bs4's find_next: the element's own descendants, then what follows it
+    _NEXT_SPAN_XPATH = etree.XPath("(descendant::span | following::span)[1]")
+    _NEXT_DIV_XPATH = etree.XPath("(descendant::div | following::div)[1]")
+
+# Text under these tags is not part of BeautifulSoup's get_text()
+NON_TEXT_TAGS = frozenset(("script", "style", "template"))
+
+
+def _stripped_text(elem) -> str:
+    """
+    get_text(strip=True) for an lxml element: every text node stripped and
+    joined, skipping comments and script/style/template contents.
+    """
+    # A <template> turns everything under it into template text, which
+    # get_text() leaves out
+    for _ in elem.iterancestors("template"):
+        return ""
+    return _stripped_subtree_text(elem)
+
+
+def _stripped_subtree_text(elem) -> str:
+    parts = [(elem.text or "").strip()]
+    for child in elem:
+        if isinstance(child.tag, str) and child.tag not in NON_TEXT_TAGS:
+            parts.append(_stripped_subtree_text(child))
+        parts.append((child.tail or "").strip())
+    return "".join(parts)
+
+
+@dataclass(frozen=True, slots=True)
+class ZoningInfo:
+    """
+    Read-only interpretation of one zoning code; the fields are the keys
+    of ZoningInterpreter.interpret(), with overlays as a tuple. Instances
+    are shared by every parcel carrying the same code, so they cannot be
+    modified; to_dict() gives the plain dict form.
+    """
+
+    raw_zoning: Optional[str]
+    base_zone: Optional[str]
+    height_district: Optional[str]
+    overlays: Tuple[str, ...]
+    is_residential: Optional[bool]
+    is_commercial: Optional[bool]
+    density_category: Optional[str]
+    notes: Optional[str]
+
+    def __post_init__(self):
+        # Keeps the record hashable when built from interpret()'s list form
+        object.__setattr__(self, "overlays", tuple(self.overlays))
+
+    def to_dict(self) -> Dict:
+        info = {f.name: getattr(self, f.name) for f in fields(self)}
+        info["overlays"] = list(self.overlays)
+        return info
 
 
 class ZoningInterpreter:
@@ -49,10 +135,45 @@ class ZoningInterpreter:
         }
     """
 
+    RESULT_KEYS = tuple(f.name for f in fields(ZoningInfo))
+
+    # Zone families, keyed by the base zone's leading character
+    RESIDENTIAL_FAMILIES = frozenset({"R"})
+    COMMERCIAL_FAMILIES = frozenset({"C", "M"})
+
+    # Density by the base zone's two-character prefix; other C*/M* zones are
+    # commercial_mixed, anything else is unknown
+    DENSITY_BY_PREFIX = {
+        # Single-family neighborhood style zones
+        "R1": "single_family",
+        "RE": "single_family",
+        "RS": "single_family",
+        # Duplex / small lot
+        "R2": "duplex",
+        # RD zones often allow small multifamily
+        "RD": "small_multifamily",
+        # R3 / R4 / R5 = higher density multi
+        "R3": "medium_multifamily",
+        "R4": "high_multifamily",
+        "R5": "very_high_multifamily",
+    }
+
     def __init__(self, zoning_code: Optional[str]):
-        self.raw = (zoning_code or "").upper().strip()
+        self.raw = normalize_zoning_code(zoning_code)
 
     def interpret(self) -> Dict:
+        # A portfolio draws on a few hundred distinct codes, so each one is
+        # interpreted once; the cache holds ZoningInfo and callers get new dicts
+        return _interpret_cached(self.raw).to_dict()
+
+    def interpret_info(self) -> ZoningInfo:
+        """
+        interpret() as a shared, read-only ZoningInfo, without building a
+        dict per call.
+        """
+        return _interpret_cached(self.raw)
+
+    def _interpret_uncached(self) -> Dict:
         if not self.raw:
             return {
                 "raw_zoning": None,
@@ -65,10 +186,18 @@ class ZoningInterpreter:
                 "notes": "No zoning code provided"
             }
 
-        parts = self.raw.split("-")
-        base_zone = parts[0] if parts else None
-        height_district = parts[1] if len(parts) > 1 else None
-        overlays = parts[2:] if len(parts) > 2 else []
+        # Codes across a portfolio repeat the same few tokens ("R1", "1",
+        # "TOC"); interning keeps one copy of each per process
+        if "-" not in self.raw:
+            # A bare base zone: nothing to split
+            base_zone = sys.intern(self.raw)
+            height_district = None
+            overlays = ()
+        else:
+            parts = [sys.intern(part) for part in self.raw.split("-")]
+            base_zone = parts[0]
+            height_district = parts[1]
+            overlays = parts[2:]
 
         is_residential = self._is_residential_zone(base_zone)
         is_commercial = self._is_commercial_zone(base_zone)
@@ -89,17 +218,15 @@ class ZoningInterpreter:
         if not base_zone:
             return None
 
-        if base_zone.startswith(("R", "RD", "RE", "RS")):
-            return True
-        return False
+        # R, RD, RE, RS all share the "R" family
+        return base_zone[:1] in self.RESIDENTIAL_FAMILIES
 
     def _is_commercial_zone(self, base_zone: Optional[str]) -> Optional[bool]:
         if not base_zone:
             return None
 
-        if base_zone.startswith(("C", "CR", "CM", "M")):
-            return True
-        return False
+        # C, CR, CM, M
+        return base_zone[:1] in self.COMMERCIAL_FAMILIES
 
     def _density_category(self, base_zone: Optional[str]) -> Optional[str]:
         """
@@ -109,33 +236,30 @@ class ZoningInterpreter:
         if not base_zone:
             return None
 
-        z = base_zone.upper()
+        # base_zone is sliced from self.raw, which is already upper-cased
+        category = self.DENSITY_BY_PREFIX.get(base_zone[:2])
+        if category:
+            return category
+        if base_zone[:1] in self.COMMERCIAL_FAMILIES:
+            return "commercial_mixed"
+        return "unknown"
 
-        # Single-family neighborhood style zones
-        if z.startswith(("R1", "RE", "RS")):
-            return "single_family"
 
-        # Duplex / small lot
-        if z.startswith("R2"):
-            return "duplex"
+@lru_cache(maxsize=INTERPRET_CACHE_SIZE)
+def _interpret_cached(raw: str) -> ZoningInfo:
+    return ZoningInfo(**ZoningInterpreter(raw)._interpret_uncached())
 
-        # RD zones often allow small multifamily
-        if z.startswith("RD"):
-            return "small_multifamily"
 
-        # R3 / R4 / R5 = higher density multi
-        if z.startswith("R3"):
-            return "medium_multifamily"
-        if z.startswith("R4"):
-            return "high_multifamily"
-        if z.startswith("R5"):
-            return "very_high_multifamily"
-
-        # Commercial / mixed
-        if z.startswith(("C", "CM", "CR", "M")):
-            return "commercial_mixed"
+def normalize_zoning_code(zoning_code: Optional[str]) -> str:
+    return (zoning_code or "").upper().strip()
 
-        return "unknown"
+
+def interpret_zoning(zoning_code: Optional[str]) -> Dict:
+    """
+    ZoningInterpreter(zoning_code).interpret() without the interpreter
+    object.
+    """
+    return _interpret_cached(normalize_zoning_code(zoning_code)).to_dict()
 
 
 class ZoningLookup:
@@ -154,6 +278,21 @@ class ZoningLookup:
         info = zl.from_zimas_html(html_snippet_with_zoning)
     """
 
+    # Labels located in ZIMAS HTML (case-insensitive)
+    ZONING_LABEL_PATTERN = re.compile(r"Zoning", re.IGNORECASE)
+    COMMUNITY_PLAN_LABEL_PATTERN = re.compile(r"Community Plan", re.IGNORECASE)
+    RSO_LABEL_PATTERN = re.compile(r"RSO", re.IGNORECASE)
+    RENT_STABILIZATION_LABEL_PATTERN = re.compile(r"Rent Stabilization", re.IGNORECASE)
+    LABEL_PATTERNS = (
+        ZONING_LABEL_PATTERN,
+        COMMUNITY_PLAN_LABEL_PATTERN,
+        RSO_LABEL_PATTERN,
+        RENT_STABILIZATION_LABEL_PATTERN,
+    )
+    # Any of the above: checked against the raw HTML before parsing, and
+    # used to collect every labelled node in one walk
+    ANY_LABEL_PATTERN = re.compile(r"Zoning|Community Plan|RSO|Rent Stabilization", re.IGNORECASE)
+
     def __init__(self):
         pass
 
@@ -162,8 +301,7 @@ class ZoningLookup:
     # ---------------------------------------------------------
 
     def from_zoning_code(self, zoning_code: str) -> Dict:
-        interpreter = ZoningInterpreter(zoning_code)
-        interpreted = interpreter.interpret()
+        interpreted = interpret_zoning(zoning_code)
 
         return {
             "source": "code",
@@ -185,29 +323,17 @@ class ZoningLookup:
             - community plan area
             - RSO flag (if shown)
         """
-        soup = BeautifulSoup(html_text, "html.parser")
-
-        # Generic helper to find nearest value after a label
-        def extract_after_label(label_pattern: str) -> Optional[str]:
-            el = soup.find(text=re.compile(label_pattern, re.IGNORECASE))
-            if not el:
-                return None
-            parent = el.parent
-            # Look for next sibling span/div/etc.
-            nxt = parent.find_next("span") or parent.find_next("div")
-            if nxt:
-                return nxt.get_text(strip=True)
-            return None
-
-        zoning_code = extract_after_label(r"Zoning")
-        community_plan = extract_after_label(r"Community Plan")
-        rso_flag = extract_after_label(r"RSO") or extract_after_label(r"Rent Stabilization")
+        if self.ANY_LABEL_PATTERN.search(html_text):
+            zoning_code, community_plan, rso_flag = self._extract_labels(html_text)
+        else:
+            # None of the labels occur anywhere in the raw HTML, so no text
+            # node can match either; skip parsing
+            zoning_code = community_plan = rso_flag = None
 
         # Interpret zoning code if found
         zoning_info = None
         if zoning_code:
-            interpreter = ZoningInterpreter(zoning_code)
-            zoning_info = interpreter.interpret()
+            zoning_info = interpret_zoning(zoning_code)
 
         return {
             "source": "zimas_html",
@@ -217,6 +343,87 @@ class ZoningLookup:
             "notes": "Parsed from ZIMAS-like HTML; verify with official records."
         }
 
+    def _extract_labels(self, html_text: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        (zoning code, community plan area, RSO flag) text from ZIMAS HTML.
+        """
+        if HAS_LXML:
+            label_nodes, value_after = self._xpath_label_nodes(html_text)
+        else:
+            label_nodes, value_after = self._soup_label_nodes(html_text)
+
+        # One pass over every node carrying any label: each label takes the
+        # first node it occurs in, and the pass ends once all are placed
+        first_nodes: Dict[Pattern, object] = {}
+        for node in label_nodes:
+            text = node if isinstance(node, str) else node.text
+            for pattern in self.LABEL_PATTERNS:
+                if pattern not in first_nodes and pattern.search(text):
+                    first_nodes[pattern] = node
+            if len(first_nodes) == len(self.LABEL_PATTERNS):
+                break
+
+        def extract_after_label(label_pattern: Pattern) -> Optional[str]:
+            node = first_nodes.get(label_pattern)
+            return value_after(node) if node is not None else None
+
+        zoning_code = extract_after_label(self.ZONING_LABEL_PATTERN)
+        community_plan = extract_after_label(self.COMMUNITY_PLAN_LABEL_PATTERN)
+        rso_flag = (
+            extract_after_label(self.RSO_LABEL_PATTERN)
+            or extract_after_label(self.RENT_STABILIZATION_LABEL_PATTERN)
+        )
+
+        return zoning_code, community_plan, rso_flag
+
+    def _xpath_label_nodes(self, html_text: str) -> Tuple[List, Callable[[object], Optional[str]]]:
+        """
+        (label nodes, value lookup) over an lxml tree, via compiled XPath:
+        every text (or comment) node inside page content carrying a label,
+        and the first span (else div) from a node's parent onward. Same
+        result as the soup walk in _soup_label_nodes.
+        """
+        root = etree.HTML(html_text.encode("utf-8"), etree.HTMLParser(encoding="utf-8"))
+        if root is None:
+            return [], lambda node: None
+
+        def value_after(node) -> Optional[str]:
+            parent = node.getparent()
+            # Text after a child element is reported as that child's tail
+            if getattr(node, "is_tail", False):
+                parent = parent.getparent()
+            # Outside the root element, e.g. a comment before <html>: bs4's
+            # find_next from the document itself finds nothing
+            if parent is None:
+                return None
+            nxt = _NEXT_SPAN_XPATH(parent) or _NEXT_DIV_XPATH(parent)
+            if nxt:
+                return _stripped_text(nxt[0])
+            return None
+
+        return _LABEL_NODES_XPATH(root, label=self.ANY_LABEL_PATTERN.pattern), value_after
+
+    def _soup_label_nodes(self, html_text: str) -> Tuple[List, Callable[[object], Optional[str]]]:
+        # No strainer: it would keep all of <html> anyway, and drops bare
+        # fragment text under html.parser; head and non-visible text is
+        # filtered from the label candidates instead
+        soup = make_soup(html_text)
+
+        # Generic helper to find nearest value after a label
+        def value_after(node) -> Optional[str]:
+            parent = node.parent
+            # Look for next sibling span/div/etc.
+            nxt = parent.find_next("span") or parent.find_next("div")
+            if nxt:
+                return nxt.get_text(strip=True)
+            return None
+
+        label_nodes = [
+            node for node in soup.find_all(string=self.ANY_LABEL_PATTERN)
+            if _in_page_content(node)
+        ]
+        return label_nodes, value_after
+
     # ---------------------------------------------------------
     # Unified lookup
     # ---------------------------------------------------------
@@ -246,3 +453,13 @@ class ZoningLookup:
             "rso_flag": None,
             "notes": "No zoning information provided."
         }
+
+    def lookup_many(self, zoning_codes: Iterable[Optional[str]]) -> List[Dict]:
+        """
+        lookup(zoning_code=...) for a whole portfolio. Each distinct code is
+        looked up once; every parcel gets its own copy of the result.
+        Results are returned in the same order as `zoning_codes`.
+        """
+        zoning_codes = list(zoning_codes)
+        results = {code: self.lookup(zoning_code=code) for code in dict.fromkeys(zoning_codes)}
+        return [copy.deepcopy(results[code]) for code in zoning_codes]